@@ -3,10 +3,6 @@ from typing import Annotated
 
 import typer
 
-from dbt_helpers_core.orchestrator import Orchestrator
-
-from ..utils import console, print_deprecation_warning, print_plan
-
 app = typer.Typer(help="Manage dbt sources")
 
 
@@ -19,13 +15,31 @@ def source_import(
     project_dir: Annotated[Path | None, typer.Option("--project-dir", "-p", help="Path to dbt project")] = None,
     apply: Annotated[bool, typer.Option("--apply", help="Apply changes to the dbt project")] = False,
     out: Annotated[Path | None, typer.Option("--out", "-o", help="Save the plan to a JSON file")] = None,
+    no_catalog_cache: Annotated[
+        bool, typer.Option("--no-catalog-cache", help="Bypass the persistent warehouse catalog cache")
+    ] = False,
 ):
     """Import dbt Sources from warehouse metadata."""
+    from ..utils import (  # pylint: disable=import-outside-toplevel
+        console,
+        get_orchestrator,
+        print_catalog_cache_stats,
+        print_catalog_file_stats,
+        print_catalog_request_stats,
+        print_deprecation_warning,
+        print_plan,
+        print_state_stats,
+    )
+
     actual_project_dir = project_dir or Path.cwd()
-    orchestrator = Orchestrator(actual_project_dir)
+    orchestrator = get_orchestrator(actual_project_dir, use_catalog_cache=not no_catalog_cache)
 
     try:
         plan = orchestrator.generate_source_plan(scope)
+        print_catalog_cache_stats(orchestrator.catalog_cache_stats)
+        print_catalog_request_stats(orchestrator.catalog_request_stats)
+        print_catalog_file_stats(orchestrator.catalog_file_stats)
+        print_state_stats(orchestrator.state_stats)
 
         if out:
             plan.save(out)
@@ -63,13 +77,37 @@ def source_sync(
     project_dir: Annotated[Path | None, typer.Option("--project-dir", "-p", help="Path to dbt project")] = None,
     apply: Annotated[bool, typer.Option("--apply", help="Apply changes to the dbt project")] = False,
     out: Annotated[Path | None, typer.Option("--out", "-o", help="Save the plan to a JSON file")] = None,
+    no_catalog_cache: Annotated[
+        bool, typer.Option("--no-catalog-cache", help="Bypass the persistent warehouse catalog cache")
+    ] = False,
+    changed_only: Annotated[
+        bool,
+        typer.Option("--changed-only", help="Only sync relations whose columns changed since they were last synced"),
+    ] = False,
 ):
     """Sync existing dbt Sources with warehouse metadata."""
+    from ..utils import (  # pylint: disable=import-outside-toplevel
+        console,
+        get_orchestrator,
+        print_catalog_cache_stats,
+        print_catalog_file_stats,
+        print_catalog_request_stats,
+        print_deprecation_warning,
+        print_plan,
+        print_state_stats,
+    )
+
     actual_project_dir = project_dir or Path.cwd()
-    orchestrator = Orchestrator(actual_project_dir)
+    orchestrator = get_orchestrator(
+        actual_project_dir, use_catalog_cache=not no_catalog_cache, changed_only=changed_only
+    )
 
     try:
         plan = orchestrator.sync_sources(scope)
+        print_catalog_cache_stats(orchestrator.catalog_cache_stats)
+        print_catalog_request_stats(orchestrator.catalog_request_stats)
+        print_catalog_file_stats(orchestrator.catalog_file_stats)
+        print_state_stats(orchestrator.state_stats)
 
         if out:
             plan.save(out)
@@ -3,13 +3,11 @@ from typing import Annotated
 
 import typer
 
-from dbt_helpers_core.orchestrator import Orchestrator
-from dbt_helpers_sdk import Plan
-
+# Only typer is imported at startup: the core, the SDK models, rich rendering and the plugins are
+# imported inside the command bodies, so `--help` and argument errors stay fast
 from .commands.model import app as model_app
 from .commands.snapshot import app as snapshot_app
 from .commands.source import app as source_app
-from .utils import console, print_plan
 
 app = typer.Typer(help="dbt-helpers: A modular toolkit for dbt project management")
 
@@ -25,6 +23,10 @@ def apply(
     yes: Annotated[bool, typer.Option("--yes", "-y", help="Skip confirmation prompt")] = False,
 ):
     """Apply a saved plan to the dbt project."""
+    from dbt_helpers_sdk import Plan  # pylint: disable=import-outside-toplevel
+
+    from .utils import console, get_orchestrator, print_plan  # pylint: disable=import-outside-toplevel
+
     actual_project_dir = project_dir or Path.cwd()
 
     try:
@@ -40,7 +42,7 @@ def apply(
             return
 
         if yes or typer.confirm("Do you want to apply these changes?"):
-            orchestrator = Orchestrator(actual_project_dir)
+            orchestrator = get_orchestrator(actual_project_dir)
 
             with console.status("[bold green]Applying changes...") as status:
                 def progress_callback(op):
@@ -58,5 +60,55 @@ def apply(
         raise typer.Exit(code=1) from e
 
 
+@app.command("serve")
+def serve(
+    socket_path: Annotated[
+        Path | None, typer.Option("--socket", help="Unix socket to listen on (default: per-user runtime directory)")
+    ] = None,
+    keep_warehouse_connections: Annotated[
+        bool,
+        typer.Option(
+            "--keep-warehouse-connections", help="Keep DuckDB database files open (and locked) between requests"
+        ),
+    ] = False,
+    stop: Annotated[bool, typer.Option("--stop", help="Stop the running daemon")] = False,
+):
+    """Run a daemon that keeps plugins and project state warm.
+
+    While it runs, dbth commands started in the same Python environment, with the same credential
+    and configuration variables, use it.
+    """
+    # pylint: disable=import-outside-toplevel
+    from dbt_helpers_core.daemon.client import DaemonClient
+    from dbt_helpers_core.daemon.protocol import DaemonError, default_socket_path, supports_unix_sockets
+    from dbt_helpers_core.daemon.server import DaemonServer
+
+    from .utils import console
+
+    if not supports_unix_sockets():
+        console.print("[bold red]Error:[/bold red] The daemon needs Unix domain sockets, which this platform lacks.")
+        raise typer.Exit(code=1)
+
+    actual_socket_path = socket_path or default_socket_path()
+
+    try:
+        if stop:
+            DaemonClient(actual_socket_path, timeout=5).call("shutdown")
+            console.print(f"[green]Stopped the daemon on {actual_socket_path}[/green]")
+            return
+        server = DaemonServer(actual_socket_path, keep_warehouse_connections=keep_warehouse_connections)
+    except DaemonError as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        raise typer.Exit(code=1) from e
+
+    console.print(f"[green]Serving on {actual_socket_path}[/green] (stop with Ctrl+C or `dbth serve --stop`)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
 if __name__ == "__main__":
     app()
@@ -1,5 +1,6 @@
 import difflib
 from pathlib import Path
+from typing import Any
 
 from rich.console import Console
 from rich.panel import Panel
@@ -26,6 +27,73 @@ def print_deprecation_warning():
             border_style="yellow",
         )
     )
+
+
+def get_orchestrator(project_dir: Path, use_catalog_cache: bool = True, changed_only: bool = False):
+    """Return an orchestrator of the project: the running `dbth serve` daemon's if any, else a local one."""
+    # pylint: disable=import-outside-toplevel
+    from dbt_helpers_core.daemon.client import RemoteOrchestrator, connect_daemon
+
+    client = connect_daemon()
+    if client is not None:
+        return RemoteOrchestrator(client, project_dir, use_catalog_cache=use_catalog_cache, changed_only=changed_only)
+
+    from dbt_helpers_core.orchestrator import Orchestrator
+
+    return Orchestrator(project_dir, use_catalog_cache=use_catalog_cache, changed_only=changed_only)
+
+
+def print_catalog_cache_stats(stats: dict[str, int] | None):
+    """Print catalog cache statistics reported by the warehouse plugin, if any."""
+    if not stats:
+        return
+    console.print(
+        f"[dim]Catalog cache: {stats.get('hits', 0)} hits, {stats.get('misses', 0)} misses, "
+        f"{stats.get('bytes_read', 0)} bytes read, {stats.get('bytes_written', 0)} bytes written[/dim]"
+    )
+
+
+def print_catalog_request_stats(stats: dict[str, dict[str, Any]] | None):
+    """Print per-project metadata request statistics when any request was retried or throttled."""
+    for project, project_stats in (stats or {}).items():
+        if not project_stats.get("retries") and not project_stats.get("throttled_seconds"):
+            continue
+        console.print(
+            f"[dim]Catalog requests ({project}): {project_stats.get('requests', 0)} requests, "
+            f"{project_stats.get('retries', 0)} retries, {project_stats.get('throttled', 0)} throttled, "
+            f"{project_stats.get('throttled_seconds', 0)}s throttled, {project_stats.get('backoff_seconds', 0)}s backing off, "
+            f"{project_stats.get('effective_qps', 0)} QPS[/dim]"
+        )
+
+
+def print_catalog_file_stats(stats: dict[str, dict[str, Any]] | None, slowest: int = 5):
+    """Print the total and the slowest per-file catalog read times, when files were read separately."""
+    if not stats:
+        return
+    seconds = sum(file_stats.get("seconds", 0) for file_stats in stats.values())
+    relations = sum(file_stats.get("relations", 0) for file_stats in stats.values())
+    console.print(f"[dim]Catalog files: {len(stats)} files, {relations} relations, {seconds:.2f}s reading[/dim]")
+    by_time = sorted(stats.items(), key=lambda item: item[1].get("seconds", 0), reverse=True)
+    for path, file_stats in by_time[:slowest]:
+        console.print(
+            f"[dim]  {Path(path).name}: {file_stats.get('seconds', 0):.2f}s, "
+            f"{file_stats.get('relations', 0)} relations[/dim]"
+        )
+
+
+def print_state_stats(stats: dict[str, int] | None):
+    """Print how many project YAML files were parsed again and how many were read from the parse cache."""
+    if not stats:
+        return
+    if "manifest" in stats:
+        console.print(f"[dim]Project state: {stats['manifest']} resources read from the dbt manifest[/dim]")
+        return
+    console.print(
+        f"[dim]Project state: {stats.get('reparsed', 0)} files parsed, {stats.get('cached', 0)} cached, "
+        f"{stats.get('removed', 0)} removed[/dim]"
+    )
+
+
 def print_plan(plan, project_dir: Path | None = None):
     """Print the plan in a rich, human-readable format."""
     if not plan.ops:
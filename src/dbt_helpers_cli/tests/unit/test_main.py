@@ -20,3 +20,13 @@ class TestMain(unittest.TestCase):
         result = self.runner.invoke(app, ["model", "scaffold", "--help"])
         self.assertEqual(result.exit_code, 0)
         self.assertIn("Generate dbt Model scaffolds based on warehouse tables", result.output)
+
+    def test_source_sync_help_lists_no_catalog_cache(self):
+        result = self.runner.invoke(app, ["source", "sync", "--help"])
+        self.assertEqual(result.exit_code, 0)
+        self.assertIn("--no-catalog-cache", result.output)
+
+    def test_serve_help(self):
+        result = self.runner.invoke(app, ["serve", "--help"])
+        self.assertEqual(result.exit_code, 0)
+        self.assertIn("--stop", result.output)
@@ -0,0 +1,117 @@
+import importlib.metadata
+import os
+import shutil
+import subprocess  # nosec B404
+import sys
+import tempfile
+import textwrap
+import unittest
+from pathlib import Path
+
+# Cold-start budgets for the import time a command adds to a bare interpreter (the sum of
+# `python -X importtime` self times of the modules it imports), with headroom for slow CI machines
+HELP_IMPORT_BUDGET_MS = 400
+PLAN_IMPORT_BUDGET_MS = 1500
+
+# Modules `dbth --help` must not import: they are only needed by the command bodies
+HELP_FORBIDDEN_MODULES = (
+    "dbt_helpers_core",
+    "dbt_helpers_sdk",
+    "pydantic",
+    "jinja2",
+    "ruamel",
+    "duckdb",
+    "google.cloud.bigquery",
+)
+
+
+def _duckdb_plugin_installed() -> bool:
+    return any(
+        entry_point.name == "duckdb"
+        for entry_point in importlib.metadata.entry_points(group="dbt_helpers.warehouse_plugins")
+    )
+
+
+def _isolated_env(cache_dir: Path) -> dict[str, str]:
+    """Return this process's environment with its own user cache and without a running daemon."""
+    env = {key: value for key, value in os.environ.items() if key != "DBT_HELPERS_DAEMON_SOCKET"}
+    env["XDG_CACHE_HOME"] = str(cache_dir)
+    env["DBT_HELPERS_NO_DAEMON"] = "1"
+    return env
+
+
+def _run_importtime(code: str, env: dict[str, str]) -> dict[str, int]:
+    """Run code in a fresh interpreter and return each imported module's self time in microseconds."""
+    result = subprocess.run(  # noqa: S603  # nosec B603
+        [sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, check=False, env=env
+    )
+    if result.returncode != 0:
+        raise AssertionError(f"{code!r} failed:\n{result.stdout}\n{result.stderr}")
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, module = line.removeprefix("import time:").split("|")
+        times[module.strip()] = int(self_us)
+    return times
+
+
+def _import_times(args: list[str], cache_dir: Path) -> dict[str, int]:
+    """Return the self times of the modules `dbth <args>` imports beyond a bare interpreter's (site, .pth files)."""
+    env = _isolated_env(cache_dir)
+    baseline = _run_importtime("pass", env)
+    times = _run_importtime(f"from dbt_helpers_cli.main import app\napp({args!r})", env)
+    return {module: self_us for module, self_us in times.items() if module not in baseline}
+
+
+class TestStartup(unittest.TestCase):
+    """Cold-start import budgets for the dbth CLI."""
+
+    def assert_within_budget(self, times: dict[str, int], budget_ms: int):
+        total_ms = sum(times.values()) / 1000
+        slowest = sorted(times.items(), key=lambda item: item[1], reverse=True)[:10]
+        self.assertLessEqual(total_ms, budget_ms, f"imports took {total_ms:.0f} ms; slowest: {slowest}")
+
+    def test_help_imports_only_the_cli(self):
+        """`dbth --help` imports neither the core, the SDK models nor any plugin."""
+        cache_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, cache_dir)
+
+        times = _import_times(["--help"], cache_dir)
+
+        loaded = [module for module in times if module.startswith(HELP_FORBIDDEN_MODULES)]
+        self.assertEqual(loaded, [])
+        self.assert_within_budget(times, HELP_IMPORT_BUDGET_MS)
+
+    @unittest.skipUnless(_duckdb_plugin_installed(), "the duckdb warehouse plugin is not installed")
+    def test_plan_only_command_imports_only_the_selected_plugin(self):
+        """A plan-only command imports the configured plugin, not the other warehouse SDKs."""
+        import duckdb  # pylint: disable=import-outside-toplevel
+
+        project_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, project_dir)
+        conn = duckdb.connect(str(project_dir / "warehouse.duckdb"))
+        conn.execute("CREATE SCHEMA raw; CREATE TABLE raw.users (id INT)")
+        conn.close()
+        (project_dir / "dbt_helpers.yml").write_text(
+            textwrap.dedent(
+                f"""\
+                warehouse:
+                  plugin: duckdb
+                  connection:
+                    db_path: {project_dir / "warehouse.duckdb"}
+                """
+            ),
+            encoding="utf-8",
+        )
+
+        plan_path = project_dir / "plan.json"
+
+        times = _import_times(
+            ["source", "import", "--scope", "raw", "--project-dir", str(project_dir), "--out", str(plan_path)],
+            project_dir / ".cache",
+        )
+
+        self.assertIn("raw__users", plan_path.read_text(encoding="utf-8"))
+        self.assertEqual([module for module in times if module.startswith("google.cloud.bigquery")], [])
+        self.assert_within_budget(times, PLAN_IMPORT_BUDGET_MS)
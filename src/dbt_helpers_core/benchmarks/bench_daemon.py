@@ -0,0 +1,147 @@
+"""Benchmark planning latency without and with a warm `dbth serve` daemon.
+
+Builds a DuckDB project with --tables tables and plans a source import three ways:
+
+- cold: a fresh interpreter imports the core, discovers the plugins and plans locally,
+  as every `dbth` invocation does without a daemon;
+- warm, fresh client: a fresh interpreter connects to a running daemon and plans through
+  it, as `dbth` does while `dbth serve` runs;
+- warm, in-process client: repeated requests from one interpreter, the daemon's own
+  latency without interpreter startup.
+
+Usage:
+    uv run python benchmarks/bench_daemon.py --tables 200
+"""
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess  # nosec B404
+import sys
+import tempfile
+import textwrap
+import time
+from pathlib import Path
+
+import duckdb
+
+from dbt_helpers_core.daemon.client import DaemonClient, RemoteOrchestrator
+from dbt_helpers_core.daemon.protocol import NO_DAEMON_ENV, SOCKET_ENV
+
+_LOCAL = """
+from dbt_helpers_core.orchestrator import Orchestrator
+
+orchestrator = Orchestrator(PROJECT_DIR)
+"""
+
+_REMOTE = """
+from dbt_helpers_core.daemon.client import RemoteOrchestrator, connect_daemon
+
+orchestrator = RemoteOrchestrator(connect_daemon(), PROJECT_DIR)
+"""
+
+_HARNESS = """
+import json, time
+start = time.perf_counter()
+from pathlib import Path
+PROJECT_DIR = Path({project_dir!r})
+{body}
+plan = orchestrator.generate_source_plan(["raw"])
+print(json.dumps({{"seconds": time.perf_counter() - start, "ops": len(plan.ops)}}))
+"""
+
+
+def create_project(directory: Path, tables: int) -> Path:
+    project_dir = directory / "project"
+    project_dir.mkdir()
+    conn = duckdb.connect(str(project_dir / "warehouse.duckdb"))
+    conn.execute("CREATE SCHEMA raw")
+    for i in range(tables):
+        conn.execute(f"CREATE TABLE raw.table_{i:04d} (id INTEGER, name VARCHAR, created_at TIMESTAMP)")
+    conn.close()
+    (project_dir / "dbt_helpers.yml").write_text(
+        f"warehouse:\n  plugin: duckdb\n  connection:\n    db_path: {project_dir / 'warehouse.duckdb'}\n",
+        encoding="utf-8",
+    )
+    return project_dir
+
+
+def run(body: str, project_dir: Path, env: dict[str, str]) -> float:
+    """Plan in a fresh interpreter and return the wall time from its first import to the plan."""
+    code = _HARNESS.format(project_dir=str(project_dir), body=textwrap.dedent(body))
+    output = subprocess.run(  # noqa: S603  # nosec B603
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True, env={**os.environ, **env}
+    ).stdout
+    seconds: float = json.loads(output.strip().splitlines()[-1])["seconds"]
+    return seconds
+
+
+def start_daemon(socket_path: Path) -> subprocess.Popen:
+    code = (
+        "from pathlib import Path\n"
+        "from dbt_helpers_core.daemon.server import DaemonServer\n"
+        f"DaemonServer(Path({str(socket_path)!r})).serve_forever()"
+    )
+    process = subprocess.Popen([sys.executable, "-c", code])  # noqa: S603  # nosec B603
+    client = DaemonClient(socket_path, timeout=1)
+    deadline = time.monotonic() + 30
+    while not client.is_running():
+        if time.monotonic() > deadline or process.poll() is not None:
+            process.kill()
+            raise RuntimeError("The daemon did not start")
+        time.sleep(0.05)
+    return process
+
+
+def report(name: str, seconds: list[float], baseline: float | None) -> float:
+    median = statistics.median(seconds)
+    print(f"{name:>26}: {median * 1000:8.1f} ms  {(baseline or median) / median:5.1f}x")
+    return median
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tables", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    directory = Path(tempfile.mkdtemp(prefix="dbth"))
+    try:
+        project_dir = create_project(directory, args.tables)
+        socket_path = directory / "run" / "daemon.sock"
+
+        cold = [run(_LOCAL, project_dir, {NO_DAEMON_ENV: "1"}) for _ in range(args.repeat)]
+        baseline = report("cold", cold, None)
+
+        daemon = start_daemon(socket_path)
+        try:
+            client = DaemonClient(socket_path)
+            remote = RemoteOrchestrator(client, project_dir)
+            # The first request builds the project's orchestrator and loads the plugins
+            start = time.perf_counter()
+            remote.generate_source_plan(["raw"])
+            report("warm-up request", [time.perf_counter() - start], baseline)
+
+            fresh = [run(_REMOTE, project_dir, {SOCKET_ENV: str(socket_path)}) for _ in range(args.repeat)]
+            report("warm, fresh client", fresh, baseline)
+
+            in_process = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                remote.generate_source_plan(["raw"])
+                in_process.append(time.perf_counter() - start)
+            report("warm, in-process client", in_process, baseline)
+
+            client.call("shutdown")
+            daemon.wait(timeout=30)
+        finally:
+            if daemon.poll() is None:
+                daemon.kill()
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
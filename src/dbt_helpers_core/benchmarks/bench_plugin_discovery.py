@@ -0,0 +1,124 @@
+"""Benchmark plugin discovery at process startup.
+
+Each run is a fresh interpreter that selects one warehouse plugin and the schema plugin,
+as every workflow does. Compares the former discovery (load and instantiate every entry
+point of the group; kept here as a reference) with the registry, which loads only the
+selected plugin, and reports whether the BigQuery client library was imported.
+
+Then times resolving the names of all three plugin groups (what every command does before
+loading a plugin) by scanning the distribution metadata and through the persistent plugin
+cache. --distributions adds that many minimal installed distributions to the import path,
+to mimic a large virtualenv.
+
+Usage:
+    uv run python benchmarks/bench_plugin_discovery.py --warehouse duckdb
+    uv run python benchmarks/bench_plugin_discovery.py --distributions 300
+"""
+
+import argparse
+import atexit
+import json
+import os
+import shutil
+import statistics
+import subprocess  # nosec B404
+import sys
+import tempfile
+import textwrap
+from pathlib import Path
+
+_REFERENCE = """
+import importlib.metadata
+
+def discover(group):
+    plugins = {}
+    for entry_point in importlib.metadata.entry_points(group=group):
+        plugins[entry_point.name] = entry_point.load()()
+    return plugins
+
+warehouse = discover("dbt_helpers.warehouse_plugins")[WAREHOUSE]
+schema = discover("dbt_helpers.schema_plugins")["dbt"]
+"""
+
+_REGISTRY = """
+from dbt_helpers_core.plugin_discovery import get_schema_plugins, get_warehouse_plugins
+
+warehouse = get_warehouse_plugins()[WAREHOUSE]
+schema = get_schema_plugins()["dbt"]
+"""
+
+_NAMES = """
+names = [list(get_warehouse_plugins()), list(get_tool_plugins()), list(get_schema_plugins())]
+"""
+
+_NAMES_SETUP = """
+from dbt_helpers_core.plugin_discovery import get_schema_plugins, get_tool_plugins, get_warehouse_plugins
+"""
+
+_HARNESS = """
+import json, sys, time
+{setup}
+start = time.perf_counter()
+WAREHOUSE = {warehouse!r}
+{body}
+print(json.dumps({{"seconds": time.perf_counter() - start, "bigquery": "google.cloud.bigquery" in sys.modules}}))
+"""
+
+
+def run(body: str, warehouse: str, setup: str = "", env: dict[str, str] | None = None) -> dict:
+    """Run a discovery snippet in a fresh interpreter and return its timing (setup is not timed)."""
+    code = _HARNESS.format(warehouse=warehouse, setup=textwrap.dedent(setup), body=textwrap.dedent(body))
+    output = subprocess.run(  # noqa: S603  # nosec B603
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True, env={**os.environ, **(env or {})}
+    ).stdout
+    timing: dict = json.loads(output.strip().splitlines()[-1])
+    return timing
+
+
+def create_distributions(n: int) -> str:
+    """Create n minimal installed distributions with console scripts; return their directory."""
+    directory = Path(tempfile.mkdtemp())
+    atexit.register(shutil.rmtree, directory, ignore_errors=True)
+    for i in range(n):
+        dist_info = directory / f"fake_package_{i:04d}-1.0.dist-info"
+        dist_info.mkdir()
+        (dist_info / "METADATA").write_text(f"Metadata-Version: 2.1\nName: fake-package-{i:04d}\nVersion: 1.0\n")
+        (dist_info / "entry_points.txt").write_text(f"[console_scripts]\nfake-{i:04d} = fake_package_{i:04d}:main\n")
+    return str(directory)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--warehouse", default="duckdb", help="Warehouse plugin to select")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--distributions", type=int, default=0, help="Extra installed distributions to add")
+    args = parser.parse_args()
+
+    env = {}
+    if args.distributions:
+        paths = [create_distributions(args.distributions), os.environ.get("PYTHONPATH")]
+        env["PYTHONPATH"] = os.pathsep.join(path for path in paths if path)
+
+    baseline = None
+    for name, body in (("all plugins (reference)", _REFERENCE), ("selected plugin", _REGISTRY)):
+        results = [run(body, args.warehouse, env=env) for _ in range(args.repeat)]
+        median = statistics.median(result["seconds"] for result in results)
+        baseline = baseline or median
+        bigquery = "yes" if results[-1]["bigquery"] else "no"
+        print(f"{name:>24}: {median:7.3f} s  {baseline / median:5.1f}x  (imports google.cloud.bigquery: {bigquery})")
+
+    # Populate the plugin cache for this environment before timing cached runs
+    run(_NAMES, args.warehouse, setup=_NAMES_SETUP, env=env)
+    baseline = None
+    for name, no_cache in (("names, metadata scan", "1"), ("names, plugin cache", "")):
+        runs = [
+            run(_NAMES, args.warehouse, setup=_NAMES_SETUP, env={**env, "DBT_HELPERS_NO_PLUGIN_CACHE": no_cache})
+            for _ in range(args.repeat)
+        ]
+        median = statistics.median(result["seconds"] for result in runs)
+        baseline = baseline or median
+        print(f"{name:>24}: {median * 1000:7.1f} ms {baseline / median:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
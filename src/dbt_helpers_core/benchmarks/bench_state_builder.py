@@ -0,0 +1,151 @@
+"""Benchmark building the project state of a large dbt project.
+
+Creates --files YAML files (a model patch and a source table each, alternating) plus as
+many model SQL files, then times a serial build without the parse cache, the same build
+parsing in --processes worker processes, a first build filling the cache, a build with
+every file cached and a build after touching --touched files.
+
+Then writes a matching dbt manifest padded with --manifest-mb of macros and compares the
+time and peak Python memory of hydrating the state from it with `json.load`.
+
+Usage:
+    uv run python benchmarks/bench_state_builder.py --files 9000
+"""
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+
+from dbt_helpers_core.manifest_state import load_manifest_state
+from dbt_helpers_core.state_builder import StateBuilder
+
+
+def create_project(directory: Path, files: int) -> None:
+    for i in range(files):
+        schema_dir = directory / "models" / f"schema_{i % 50:02d}"
+        schema_dir.mkdir(parents=True, exist_ok=True)
+        (schema_dir / f"model_{i:05d}.sql").write_text("select 1\n", encoding="utf-8")
+        if i % 2:
+            content = f"version: 2\nsources:\n  - name: raw_{i % 50:02d}\n    tables:\n      - name: table_{i:05d}\n"
+        else:
+            content = (
+                f"version: 2\nmodels:\n  - name: model_{i:05d}\n    description: Model {i}\n"
+                "    columns:\n      - name: id\n        data_tests: [unique, not_null]\n      - name: name\n"
+            )
+        (schema_dir / f"model_{i:05d}.yml").write_text(content, encoding="utf-8")
+
+
+def create_manifest(directory: Path, files: int, padding_mb: int) -> Path:
+    nodes = {}
+    sources = {}
+    for i in range(files):
+        schema_dir = f"models/schema_{i % 50:02d}"
+        nodes[f"model.bench.model_{i:05d}"] = {
+            "resource_type": "model",
+            "package_name": "bench",
+            "name": f"model_{i:05d}",
+            "original_file_path": f"{schema_dir}/model_{i:05d}.sql",
+            "patch_path": f"bench://{schema_dir}/model_{i:05d}.yml" if i % 2 == 0 else None,
+            "raw_code": "select 1\n",
+            "columns": {"id": {"name": "id", "description": ""}},
+        }
+        if i % 2:
+            sources[f"source.bench.raw_{i % 50:02d}.table_{i:05d}"] = {
+                "resource_type": "source",
+                "package_name": "bench",
+                "source_name": f"raw_{i % 50:02d}",
+                "name": f"table_{i:05d}",
+                "original_file_path": f"{schema_dir}/model_{i:05d}.yml",
+            }
+    macro_sql = "{% macro m() %}" + "select 1 " * 100 + "{% endmacro %}"
+    macros = {f"macro.bench.m{i}": {"macro_sql": macro_sql} for i in range(padding_mb * 1024 * 1024 // len(macro_sql))}
+    manifest = {"metadata": {"project_name": "bench"}, "nodes": nodes, "sources": sources, "macros": macros}
+    path = directory / "target" / "manifest.json"
+    path.parent.mkdir()
+    path.write_text(json.dumps(manifest), encoding="utf-8")
+    return path
+
+
+def measured(function: Callable[[], object]) -> tuple[float, float]:
+    """Return the seconds and the peak traced memory in MB of a call."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    function()
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return seconds, peak / 1024 / 1024
+
+
+def timed(build: Callable[[], StateBuilder], repeat: int) -> tuple[float, dict[str, int]]:
+    seconds = []
+    cache_stats: dict[str, int] = {}
+    for _ in range(repeat):
+        start = time.perf_counter()
+        cache_stats = build().cache_stats
+        seconds.append(time.perf_counter() - start)
+    return statistics.median(seconds), cache_stats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=9000)
+    parser.add_argument("--touched", type=int, default=100, help="Files modified before the incremental build")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1, help="Worker processes parsing YAML")
+    parser.add_argument("--manifest-mb", type=int, default=100, help="Size of the macros padding the manifest")
+    args = parser.parse_args()
+
+    directory = Path(tempfile.mkdtemp())
+    try:
+        create_project(directory, args.files)
+        cache_path = directory / ".dbt_helpers" / "state_cache.json"
+
+        def build(cache: bool = True, processes: int = 1) -> StateBuilder:
+            builder = StateBuilder(directory, cache_path=cache_path if cache else None, processes=processes)
+            builder.build_state()
+            return builder
+
+        def build_after_touch() -> StateBuilder:
+            for path in sorted((directory / "models").rglob("*.yml"))[: args.touched]:
+                os.utime(path, ns=(time.time_ns(), time.time_ns()))
+            return build()
+
+        def first_build() -> StateBuilder:
+            cache_path.unlink(missing_ok=True)
+            return build()
+
+        results = [
+            ("no cache", *timed(lambda: build(cache=False), args.repeat)),
+            (f"{args.processes} processes", *timed(lambda: build(False, args.processes), args.repeat)),
+            ("first build", *timed(first_build, args.repeat)),
+            ("all cached", *timed(build, args.repeat)),
+            (f"{args.touched} touched", *timed(build_after_touch, args.repeat)),
+        ]
+        baseline = results[0][1]
+        for name, seconds, stats in results:
+            print(f"{name:>14}: {seconds:7.3f} s  {baseline / seconds:5.1f}x  {stats}")
+
+        manifest_path = create_manifest(directory, args.files, args.manifest_mb)
+        size_mb = manifest_path.stat().st_size / 1024 / 1024
+        for name, function in (
+            ("json.load", lambda: json.loads(manifest_path.read_text(encoding="utf-8"))),
+            ("manifest", lambda: load_manifest_state(directory, manifest_path)),
+        ):
+            seconds, peak_mb = measured(function)
+            print(f"{name:>14}: {seconds:7.3f} s  peak {peak_mb:7.1f} MB  ({size_mb:.0f} MB manifest)")
+        if load_manifest_state(directory, manifest_path) is None:
+            raise RuntimeError("The manifest was found stale or invalid, so its timing is not of a hydration")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
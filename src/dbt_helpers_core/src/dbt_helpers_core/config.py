@@ -19,11 +19,26 @@ class DbtPropertiesConfig(BaseModel):
     adapter: str = "dbt"
 
 
+class StateConfig(BaseModel):
+    """Configuration for building the project state from the dbt project files."""
+
+    # Persist the resources parsed from each YAML file and parse only changed files
+    cache: bool = True
+    # Compare content hashes of files whose size or mtime changed before parsing them again
+    hash_contents: bool = False
+    # dbt manifest (relative to the project) to read the state from while it is fresh, e.g. target/manifest.json
+    manifest_path: str | None = None
+    # Worker processes parsing YAML files (default: the CPU count), used from parallel_threshold files to parse
+    processes: int | None = None
+    parallel_threshold: int = 1000
+
+
 class ProjectConfig(BaseModel):
     """Configuration for the dbt-helpers project."""
 
     warehouse: WarehouseConfig
     dbt_properties: DbtPropertiesConfig = Field(default_factory=DbtPropertiesConfig)
+    state: StateConfig = Field(default_factory=StateConfig)
     owner: str = "data-engineering"
     project_alias_map: dict[str, str] = Field(default_factory=dict)
     paths: dict[str, str] = Field(
@@ -0,0 +1,168 @@
+"""Client of the `dbth serve` daemon, and an Orchestrator stand-in that plans through it."""
+
+import itertools
+import os
+import socket
+import stat
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from dbt_helpers_sdk import Plan, PlannedOp
+
+from .protocol import (
+    NO_DAEMON_ENV,
+    PROTOCOL_VERSION,
+    DaemonError,
+    context_digest,
+    default_socket_path,
+    read_message,
+    supports_unix_sockets,
+    write_message,
+)
+
+
+class DaemonClient:
+    """Sends JSON-RPC requests to a daemon, one connection per request."""
+
+    def __init__(self, socket_path: Path, timeout: float | None = None):
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self._ids = itertools.count(1)
+
+    def call(self, method: str, params: dict[str, Any] | None = None) -> Any:
+        """Return the result of a request; raises DaemonError on an error response or a broken connection."""
+        request_id = next(self._ids)
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.settimeout(self.timeout)
+                sock.connect(str(self.socket_path))
+                with sock.makefile("rwb") as stream:
+                    request = {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params or {}}
+                    write_message(stream, request)
+                    response = read_message(stream)
+        except (OSError, ValueError) as e:
+            raise DaemonError(f"Daemon on {self.socket_path} is unreachable: {e}") from e
+        if response is None:
+            raise DaemonError(f"Daemon on {self.socket_path} closed the connection")
+        if "error" in response:
+            error = response["error"]
+            raise DaemonError(error.get("message", "Unknown daemon error"), error.get("code", 0))
+        return response.get("result")
+
+    def is_running(self) -> bool:
+        """Whether a daemon speaking this protocol version answers on the socket."""
+        try:
+            return bool(self.call("ping").get("protocol") == PROTOCOL_VERSION)
+        except DaemonError:
+            return False
+
+
+def connect_daemon(socket_path: Path | None = None, timeout: float = 1.0) -> DaemonClient | None:
+    """Return a client of the running daemon, or None when there is none (or daemons are disabled).
+
+    A daemon is only used when its socket is private to the current user and it runs in the same
+    Python environment with the same planning settings (see context_digest), so that it plans
+    exactly as a local Orchestrator.
+    """
+    if os.environ.get(NO_DAEMON_ENV) or not supports_unix_sockets():
+        return None
+    socket_path = socket_path or default_socket_path()
+    # Otherwise another user could serve forged plans, e.g. from a shared temp directory
+    if not _is_private_socket(socket_path):
+        return None
+    client = DaemonClient(socket_path, timeout=timeout)
+    try:
+        status = client.call("ping")
+    except DaemonError:
+        return None
+    if status.get("protocol") != PROTOCOL_VERSION or status.get("context") != context_digest():
+        return None
+    # Planning reads the warehouse, which may take far longer than a ping
+    client.timeout = None
+    return client
+
+
+def _is_private_socket(socket_path: Path) -> bool:
+    """Whether the socket and its directory are owned by the current user, and only they can enter the directory."""
+    try:
+        directory_stat = socket_path.parent.stat()
+        socket_stat = socket_path.lstat()
+    except OSError:
+        return False
+    uid = os.getuid()
+    return (
+        directory_stat.st_uid == uid
+        and stat.S_IMODE(directory_stat.st_mode) == 0o700
+        and socket_stat.st_uid == uid
+        and stat.S_ISSOCK(socket_stat.st_mode)
+    )
+
+
+class RemoteOrchestrator:
+    """Stands in for an Orchestrator in the CLI, running its plan and apply operations in the daemon."""
+
+    def __init__(
+        self, client: DaemonClient, project_dir: Path, use_catalog_cache: bool = True, changed_only: bool = False
+    ):
+        self.client = client
+        self.project_dir = project_dir
+        self.use_catalog_cache = use_catalog_cache
+        self.changed_only = changed_only
+        self._stats: dict[str, Any] = {}
+
+    @property
+    def catalog_cache_stats(self) -> dict[str, int] | None:
+        return self._stats.get("cache")
+
+    @property
+    def catalog_request_stats(self) -> dict[str, dict[str, Any]] | None:
+        return self._stats.get("request")
+
+    @property
+    def catalog_file_stats(self) -> dict[str, dict[str, Any]] | None:
+        return self._stats.get("file")
+
+    @property
+    def state_stats(self) -> dict[str, int] | None:
+        return self._stats.get("state")
+
+    def _plan(self, operation: str, scope: list[str]) -> Plan:
+        result = self.client.call(
+            "plan",
+            {
+                "project_dir": str(self.project_dir.resolve()),
+                # Relative database paths and file scopes resolve against the client's directory
+                "working_dir": str(Path.cwd()),
+                "operation": operation,
+                "scope": scope,
+                "use_catalog_cache": self.use_catalog_cache,
+                "changed_only": self.changed_only,
+            },
+        )
+        self._stats = result.get("stats") or {}
+        return Plan.model_validate(result["plan"])
+
+    def generate_source_plan(self, scope: list[str]) -> Plan:
+        return self._plan("generate_source_plan", scope)
+
+    def sync_sources(self, scope: list[str]) -> Plan:
+        return self._plan("sync_sources", scope)
+
+    def scaffold_models(self, scope: list[str]) -> Plan:
+        return self._plan("scaffold_models", scope)
+
+    def sync_models(self, scope: list[str]) -> Plan:
+        return self._plan("sync_models", scope)
+
+    def scaffold_snapshots(self, scope: list[str]) -> Plan:
+        return self._plan("scaffold_snapshots", scope)
+
+    def apply_plan(self, plan: Plan, callback: Callable[[PlannedOp], None] | None = None) -> None:
+        """Apply the plan in the daemon; the callback sees each op before the plan is sent."""
+        if callback:
+            for op in plan.ops:
+                callback(op)
+        self.client.call(
+            "apply", {"project_dir": str(self.project_dir.resolve()), "plan": plan.model_dump(mode="json")}
+        )
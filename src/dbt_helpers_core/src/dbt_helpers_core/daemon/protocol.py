@@ -0,0 +1,103 @@
+"""Wire protocol of the `dbth serve` daemon: JSON-RPC 2.0 over a Unix domain socket.
+
+Each message is one JSON object on one line. Methods:
+
+- `ping` -> {"protocol", "pid", "projects", "context"}
+- `plan` {project_dir, working_dir, operation, scope, use_catalog_cache, changed_only} -> {"plan", "stats"}
+- `apply` {project_dir, plan} -> {"applied", "audit_log"}
+- `shutdown` -> {}
+
+The socket lives in a per-user directory only its owner can enter, since any client can
+plan and apply in any project the user can write.
+
+Plans depend on the working directory of the process reading the warehouse (relative database
+paths and file scopes), so a `plan` request carries the client's and the daemon plans in it.
+They also depend on the installed plugins and on the settings the warehouse clients read from
+the environment (credentials, cloud SDK configuration, cache locations), so a client only uses
+a daemon whose `context` (see context_digest) matches its own.
+"""
+
+import hashlib
+import json
+import os
+import socket
+import sys
+import tempfile
+from io import BufferedIOBase
+from pathlib import Path
+from typing import Any
+
+# Bump on incompatible changes; clients ignore a daemon speaking another version
+PROTOCOL_VERSION = 1
+
+# Orchestrator methods a `plan` request may run
+PLAN_OPERATIONS = ("generate_source_plan", "sync_sources", "scaffold_models", "sync_models", "scaffold_snapshots")
+
+# Overrides the socket path; set NO_DAEMON_ENV to a non-empty value to never use a daemon
+SOCKET_ENV = "DBT_HELPERS_DAEMON_SOCKET"
+NO_DAEMON_ENV = "DBT_HELPERS_NO_DAEMON"
+
+# Environment variables a plan may depend on: this package's settings, the warehouse clients'
+# credentials and configuration, and the locations of user caches and configuration files
+_CONTEXT_ENV_PREFIXES = ("DBT_HELPERS_", "GOOGLE_", "CLOUDSDK_", "GCE_", "AWS_", "AZURE_")
+_CONTEXT_ENV = frozenset(
+    {"HOME", "XDG_CACHE_HOME", "XDG_CONFIG_HOME", "HTTP_PROXY", "HTTPS_PROXY", "NO_PROXY", "SSL_CERT_FILE"}
+)
+# Client-side settings that select a daemon rather than change what it plans
+_CONTEXT_IGNORED_ENV = (SOCKET_ENV, NO_DAEMON_ENV)
+
+# JSON-RPC error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+SERVER_ERROR = -32000
+
+
+class DaemonError(Exception):
+    """An error response from the daemon, or a failure to reach it."""
+
+    def __init__(self, message: str, code: int = SERVER_ERROR):
+        super().__init__(message)
+        self.code = code
+
+
+def supports_unix_sockets() -> bool:
+    return hasattr(socket, "AF_UNIX")
+
+
+def default_socket_path() -> Path:
+    """Return the daemon socket of the current user: $XDG_RUNTIME_DIR/dbt_helpers/daemon.sock or a temp dir."""
+    override = os.environ.get(SOCKET_ENV)
+    if override:
+        return Path(override)
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / "dbt_helpers" / "daemon.sock"
+    return Path(tempfile.gettempdir()) / f"dbt_helpers-{os.getuid()}" / "daemon.sock"
+
+
+def context_digest() -> str:
+    """Return a digest of the Python environment and the environment variables that a plan depends on."""
+    env = sorted(
+        (key, value)
+        for key, value in os.environ.items()
+        if (key.upper() in _CONTEXT_ENV or key.startswith(_CONTEXT_ENV_PREFIXES)) and key not in _CONTEXT_IGNORED_ENV
+    )
+    return hashlib.sha256(json.dumps([sys.prefix, env]).encode("utf-8")).hexdigest()
+
+
+def write_message(stream: BufferedIOBase, message: dict[str, Any]) -> None:
+    stream.write(json.dumps(message, default=str).encode("utf-8") + b"\n")
+    stream.flush()
+
+
+def read_message(stream: BufferedIOBase) -> dict[str, Any] | None:
+    """Read one message; None at end of stream. Raises ValueError on malformed JSON."""
+    line = stream.readline()
+    if not line:
+        return None
+    message = json.loads(line)
+    if not isinstance(message, dict):
+        raise ValueError("a JSON-RPC message must be an object")
+    return message
@@ -0,0 +1,248 @@
+"""The `dbth serve` daemon: plans and applies for any number of projects from one warm process.
+
+An Orchestrator is kept per project and option set, so plugin discovery, plugin instances
+(and their Jinja environments and client pools) and the parsed `dbt_helpers.yml` are reused
+across requests. Each Orchestrator creates its own warehouse plugin instance, so the catalog
+statistics and pooled connections of concurrently served projects stay separate. A project's
+Orchestrator is rebuilt when its `dbt_helpers.yml` changes, and its fingerprint store is
+reloaded on every request, since other processes may apply plans too. Requests for one
+project are serialized; different projects are served concurrently, as long as they plan in
+the same working directory (see _WorkingDirectory).
+"""
+
+import os
+import socketserver
+import stat
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+from dbt_helpers_sdk import Plan
+
+from ..fingerprint_store import FingerprintStore
+from ..orchestrator import Orchestrator
+from .client import DaemonClient
+from .protocol import (
+    INVALID_PARAMS,
+    INVALID_REQUEST,
+    METHOD_NOT_FOUND,
+    PARSE_ERROR,
+    PLAN_OPERATIONS,
+    PROTOCOL_VERSION,
+    SERVER_ERROR,
+    DaemonError,
+    context_digest,
+    read_message,
+    write_message,
+)
+
+
+def _file_fingerprint(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+class _WorkingDirectory:
+    """The process working directory, shared by concurrent plans.
+
+    A plan runs in its client's working directory. The directory is process-wide, so a plan in
+    another directory waits until the plans running in the current one have finished.
+    """
+
+    def __init__(self) -> None:
+        self._in_use = 0
+        self._cond = threading.Condition()
+
+    @contextmanager
+    def use(self, path: str) -> Iterator[None]:
+        with self._cond:
+            while self._in_use and str(Path.cwd()) != path:
+                self._cond.wait()
+            if str(Path.cwd()) != path:
+                os.chdir(path)
+            self._in_use += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._in_use -= 1
+                self._cond.notify_all()
+
+
+class _Project:
+    """Orchestrators of one project (one per option set) and the lock serializing its requests."""
+
+    def __init__(self, project_dir: Path):
+        self.project_dir = project_dir
+        self.lock = threading.Lock()
+        self._orchestrators: dict[tuple[bool, bool], tuple[tuple[int, int] | None, Orchestrator]] = {}
+
+    def orchestrator(self, use_catalog_cache: bool, changed_only: bool, keep_connections: bool) -> Orchestrator:
+        """Return the project's Orchestrator for the options; call with the lock held."""
+        key = (use_catalog_cache, changed_only)
+        config_fingerprint = _file_fingerprint(self.project_dir / "dbt_helpers.yml")
+        cached = self._orchestrators.get(key)
+        if cached is not None and cached[0] == config_fingerprint:
+            orchestrator = cached[1]
+            orchestrator.fingerprint_store = FingerprintStore(orchestrator.fingerprint_store.path)
+            return orchestrator
+        if cached is not None:
+            cached[1].close()
+        orchestrator = Orchestrator(
+            self.project_dir,
+            use_catalog_cache=use_catalog_cache,
+            keep_warehouse_connections=keep_connections,
+            changed_only=changed_only,
+            shared_warehouse_plugin=False,
+        )
+        self._orchestrators[key] = (config_fingerprint, orchestrator)
+        return orchestrator
+
+    def close(self) -> None:
+        """Release the pooled warehouse connections of the project's Orchestrators."""
+        with self.lock:
+            for _, orchestrator in self._orchestrators.values():
+                orchestrator.close()
+
+
+class DaemonServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """JSON-RPC server on a Unix domain socket; see protocol for the methods."""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: Path, keep_warehouse_connections: bool = False):
+        self.socket_path = socket_path
+        # Keep DuckDB files open between requests (blocks other writers of them)
+        self.keep_warehouse_connections = keep_warehouse_connections
+        self._projects: dict[Path, _Project] = {}
+        self._projects_lock = threading.Lock()
+        # Clients only use a daemon with their own Python environment and planning settings
+        self.context = context_digest()
+        self._working_dir = _WorkingDirectory()
+        _prepare_socket_path(socket_path)
+        super().__init__(str(socket_path), _RequestHandler)
+        socket_path.chmod(0o600)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.socket_path.unlink(missing_ok=True)
+        with self._projects_lock:
+            projects = list(self._projects.values())
+        for project in projects:
+            project.close()
+
+    def project(self, project_dir: str) -> _Project:
+        path = Path(project_dir).resolve()
+        with self._projects_lock:
+            project = self._projects.get(path)
+            if project is None:
+                project = _Project(path)
+                self._projects[path] = project
+            return project
+
+    def dispatch(self, method: str, params: dict[str, Any]) -> Any:
+        if method == "ping":
+            return {
+                "protocol": PROTOCOL_VERSION,
+                "pid": os.getpid(),
+                "projects": sorted(map(str, self._projects)),
+                "context": self.context,
+            }
+        if method == "plan":
+            return self._plan(params)
+        if method == "apply":
+            return self._apply(params)
+        if method == "shutdown":
+            # shutdown() waits for serve_forever to return, so it cannot run on a request thread
+            threading.Thread(target=self.shutdown, daemon=True).start()
+            return {}
+        raise DaemonError(f"Unknown method '{method}'", METHOD_NOT_FOUND)
+
+    def _plan(self, params: dict[str, Any]) -> dict[str, Any]:
+        operation = params.get("operation")
+        if operation not in PLAN_OPERATIONS:
+            raise DaemonError(f"operation must be one of {list(PLAN_OPERATIONS)}, got {operation!r}", INVALID_PARAMS)
+        project = self.project(_require(params, "project_dir"))
+        with project.lock, self._working_dir.use(str(params.get("working_dir") or Path.cwd())):
+            orchestrator = project.orchestrator(
+                bool(params.get("use_catalog_cache", True)),
+                bool(params.get("changed_only", False)),
+                self.keep_warehouse_connections,
+            )
+            plan = getattr(orchestrator, operation)(list(_require(params, "scope")))
+            return {
+                "plan": plan.model_dump(mode="json"),
+                "stats": {
+                    "cache": orchestrator.catalog_cache_stats,
+                    "request": orchestrator.catalog_request_stats,
+                    "file": orchestrator.catalog_file_stats,
+                    "state": orchestrator.state_stats,
+                },
+            }
+
+    def _apply(self, params: dict[str, Any]) -> dict[str, Any]:
+        plan = Plan.model_validate(_require(params, "plan"))
+        project = self.project(_require(params, "project_dir"))
+        with project.lock:
+            orchestrator = project.orchestrator(True, False, self.keep_warehouse_connections)
+            orchestrator.apply_plan(plan)
+        return {"applied": len(plan.ops), "audit_log": str(project.project_dir / ".dbt_helpers" / "audit.jsonl")}
+
+
+def _require(params: dict[str, Any], name: str) -> Any:
+    if name not in params:
+        raise DaemonError(f"Missing parameter '{name}'", INVALID_PARAMS)
+    return params[name]
+
+
+def _prepare_socket_path(socket_path: Path) -> None:
+    """Create the owner-only socket directory and remove a stale socket; refuse if a daemon is running."""
+    socket_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    directory_stat = socket_path.parent.stat()
+    if directory_stat.st_uid != os.getuid():
+        raise DaemonError(f"{socket_path.parent} is not owned by the current user")
+    if stat.S_IMODE(directory_stat.st_mode) != 0o700:
+        raise DaemonError(f"{socket_path.parent} must only be accessible by its owner (mode 0700)")
+    if socket_path.exists():
+        if DaemonClient(socket_path, timeout=1).is_running():
+            raise DaemonError(f"A daemon is already running on {socket_path}")
+        socket_path.unlink()
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    server: DaemonServer
+
+    def handle(self) -> None:
+        while True:
+            try:
+                message = read_message(self.rfile)
+            except ValueError as e:
+                write_message(self.wfile, _error(None, PARSE_ERROR, str(e)))
+                continue
+            if message is None:
+                return
+            write_message(self.wfile, self._respond(message))
+
+    def _respond(self, message: dict[str, Any]) -> dict[str, Any]:
+        request_id = message.get("id")
+        method = message.get("method")
+        params = message.get("params") or {}
+        if not isinstance(method, str) or not isinstance(params, dict):
+            return _error(request_id, INVALID_REQUEST, "Expected a method name and named params")
+        try:
+            result = self.server.dispatch(method, params)
+        except DaemonError as e:
+            return _error(request_id, e.code, str(e))
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            # Workflow errors (bad config, missing plugin, warehouse failures) are reported to the client
+            return _error(request_id, SERVER_ERROR, str(e))
+        return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+
+def _error(request_id: Any, code: int, message: str) -> dict[str, Any]:
+    return {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}}
@@ -0,0 +1,78 @@
+"""Relation schema fingerprints recorded by sync runs, for skipping unchanged relations.
+
+The store is one JSON file mapping, per workflow ("sources", "models"), a relation's
+full warehouse name to the fingerprint its resource was last synced with and the
+resource id. A fingerprint is recorded once the project is known to match it: right
+away when a sync found nothing to change, otherwise when the plan carrying it is applied.
+"""
+
+import json
+from collections.abc import Container, Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+from dbt_helpers_sdk import CatalogRelation, DbtResourceIR
+
+# Bump when the file layout changes so stale stores are discarded
+FINGERPRINT_STORE_VERSION = 1
+
+
+def fingerprint_entry(resource: DbtResourceIR, resource_id: str) -> dict[str, list[str]]:
+    """Return {relation full name: [fingerprint, resource id]} for a mapped resource, or {} without a fingerprint."""
+    extraction_meta = resource.meta.get("_extraction_metadata", {})
+    fingerprint = extraction_meta.get("fingerprint")
+    relation_name = extraction_meta.get("relation_name")
+    if not fingerprint or not relation_name:
+        return {}
+    return {relation_name: [fingerprint, resource_id]}
+
+
+class FingerprintStore:
+    """Recorded fingerprints of one project, loaded from and saved to a JSON file."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._workflows: dict[str, dict[str, list[str]]] = {}
+        self._load()
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            # A corrupt or unreadable store is treated as empty; everything is synced again
+            return
+        if isinstance(data, dict) and data.get("version") == FINGERPRINT_STORE_VERSION:
+            self._workflows = data.get("workflows", {})
+
+    def is_unchanged(self, workflow: str, relation: CatalogRelation, resource_ids: Container[str]) -> bool:
+        """Whether the relation's schema matches the recorded one and its resource is still in the project."""
+        entry = self._workflows.get(workflow, {}).get(relation.full_name)
+        return (
+            relation.fingerprint is not None
+            and entry is not None
+            and entry[0] == relation.fingerprint
+            and entry[1] in resource_ids
+        )
+
+    def iter_changed(
+        self, workflow: str, relations: Iterable[CatalogRelation], resource_ids: Container[str]
+    ) -> Iterator[CatalogRelation]:
+        """Yield only the relations that are new, changed or without a fingerprint."""
+        return (relation for relation in relations if not self.is_unchanged(workflow, relation, resource_ids))
+
+    def record(self, fingerprints: dict[str, dict[str, list[str]]]) -> None:
+        """Record {workflow: {relation full name: [fingerprint, resource id]}} and save the store."""
+        if not any(fingerprints.values()):
+            return
+        for workflow, entries in fingerprints.items():
+            self._workflows.setdefault(workflow, {}).update(entries)
+        self._save()
+
+    def _save(self) -> None:
+        data: dict[str, Any] = {"version": FINGERPRINT_STORE_VERSION, "workflows": self._workflows}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(data, sort_keys=True), encoding="utf-8")
+        tmp_path.replace(self.path)
@@ -0,0 +1,185 @@
+"""Project state hydrated from a dbt `manifest.json` instead of parsing the project's YAML files.
+
+Manifests of large projects reach hundreds of megabytes, mostly macros, docs and graph maps.
+The manifest is read as a stream: the top-level sections are walked entry by entry, only the
+entries of `nodes` and `sources` are decoded, and one entry is held in memory at a time.
+
+A manifest is only trusted while it is fresh: every file it references must exist and be no
+newer than the manifest, and no model SQL or YAML file under `models/` may be newer either
+(a file added since `dbt parse` ran). Otherwise the caller scans the files.
+"""
+
+import json
+import os
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, TextIO
+
+from .state_builder import ProjectState
+
+# Sections whose entries are decoded; the others are skipped entry by entry
+MANIFEST_SECTIONS = ("nodes", "sources")
+
+_CHUNK_SIZE = 1 << 20
+_WHITESPACE = " \t\n\r"
+_PROJECT_FILE_SUFFIXES = (".sql", ".yml", ".yaml")
+
+
+class _JsonStream:
+    """Decodes the values of a JSON document one at a time from a buffered text stream."""
+
+    def __init__(self, stream: TextIO):
+        self.stream = stream
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self, size: int = _CHUNK_SIZE) -> bool:
+        if self.eof:
+            return False
+        chunk = self.stream.read(size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos :] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it."""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                raise ValueError("Unexpected end of JSON document")
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise ValueError(f"Expected {char!r} at offset {self.pos} of the JSON buffer")
+        self.pos += 1
+
+    def value(self) -> Any:
+        """Decode the next value, reading more of the stream until it is complete."""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                # Incomplete value: read at least as much again as is buffered, so a large
+                # value is decoded a logarithmic number of times
+                if not self._fill(max(_CHUNK_SIZE, len(self.buffer) - self.pos)):
+                    raise
+                continue
+            # A number may continue past the end of the buffer
+            if end == len(self.buffer) and self._fill():
+                continue
+            self.pos = end
+            return value
+
+    def object_items(self) -> Iterator[str]:
+        """Yield each key of the next object; the caller must consume its value before resuming."""
+        self.expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+        while True:
+            key = self.value()
+            self.expect(":")
+            yield key
+            separator = self.peek()
+            self.pos += 1
+            if separator == "}":
+                return
+            if separator != ",":
+                raise ValueError(f"Expected ',' or '}}' in a JSON object, got {separator!r}")
+
+    def skip(self) -> None:
+        """Consume the next value, decoding one entry at a time when it is an object."""
+        if self.peek() == "{":
+            for _ in self.object_items():
+                self.value()
+        else:
+            self.value()
+
+
+def iter_manifest_entries(path: Path, sections: tuple[str, ...] = MANIFEST_SECTIONS) -> Iterator[tuple[str, str, Any]]:
+    """Yield (section, key, value) for the entries of the given top-level sections, and ("metadata", "", value)."""
+    with path.open(encoding="utf-8") as f:
+        stream = _JsonStream(f)
+        for section in stream.object_items():
+            if section == "metadata":
+                yield section, "", stream.value()
+            elif section in sections and stream.peek() == "{":
+                for key in stream.object_items():
+                    yield section, key, stream.value()
+            else:
+                stream.skip()
+
+
+def load_manifest_state(project_dir: Path, manifest_path: Path) -> ProjectState | None:
+    """Build the project state from the manifest, or return None when it is missing, invalid or stale."""
+    try:
+        manifest_mtime_ns = manifest_path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+    state = ProjectState()
+    referenced: set[str] = set()
+    project_name = None
+    try:
+        for section, _, entry in iter_manifest_entries(manifest_path):
+            if section == "metadata":
+                project_name = entry.get("project_name")
+                continue
+            # Resources of installed packages live outside the project
+            if project_name and entry.get("package_name") != project_name:
+                continue
+            file_path = entry.get("original_file_path")
+            if not file_path:
+                continue
+            resource_type = entry.get("resource_type")
+            if resource_type == "model":
+                state.models[entry["name"]] = Path(file_path)
+                patch_path = entry.get("patch_path")
+                if patch_path:
+                    referenced.add(patch_path.split("://", 1)[-1])
+            elif resource_type == "source":
+                state.sources[f"{entry['source_name']}.{entry['name']}"] = Path(file_path)
+            else:
+                continue
+            referenced.add(file_path)
+    except (OSError, ValueError, KeyError, AttributeError):
+        return None
+
+    if not _is_fresh(project_dir, manifest_mtime_ns, referenced):
+        return None
+    return state
+
+
+def _is_fresh(project_dir: Path, manifest_mtime_ns: int, referenced: set[str]) -> bool:
+    """Whether the referenced files exist and no referenced or project model file changed after the manifest."""
+    models_dir = project_dir / "models"
+    unchecked = set(referenced)
+    for dir_path, _, file_names in os.walk(models_dir):
+        directory = Path(dir_path)
+        relative_dir = directory.relative_to(project_dir).as_posix()
+        for file_name in file_names:
+            if not file_name.endswith(_PROJECT_FILE_SUFFIXES):
+                continue
+            try:
+                if (directory / file_name).stat().st_mtime_ns > manifest_mtime_ns:
+                    return False
+            except OSError:
+                return False
+            unchecked.discard(f"{relative_dir}/{file_name}")
+    # Referenced files outside models/ (other model paths, or files the walk did not find)
+    for file_path in unchecked:
+        try:
+            if (project_dir / file_path).stat().st_mtime_ns > manifest_mtime_ns:
+                return False
+        except OSError:
+            return False
+    return True
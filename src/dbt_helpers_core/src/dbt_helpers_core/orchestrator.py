@@ -1,4 +1,5 @@
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any
 
@@ -9,6 +10,7 @@ from dbt_helpers_sdk import (
 )
 
 from .config import ProjectConfig, load_config
+from .fingerprint_store import FingerprintStore
 from .path_policy import PathPolicy
 from .plugin_discovery import get_schema_plugins, get_warehouse_plugins
 from .safe_fs_writer import SafeFSWriter
@@ -22,11 +24,31 @@ from .yaml_store import YamlStore
 class Orchestrator:
     """Orchestrates the catalog extraction and dbt project state building."""
 
-    def __init__(self, project_dir: Path):
+    def __init__(
+        self,
+        project_dir: Path,
+        use_catalog_cache: bool = True,
+        keep_warehouse_connections: bool = False,
+        changed_only: bool = False,
+        shared_warehouse_plugin: bool = True,
+    ):
         self.project_dir = project_dir
         self.config_path = project_dir / "dbt_helpers.yml"
+        self.use_catalog_cache = use_catalog_cache
+        # Keep the warehouse plugin's file locks (DuckDB's read-only connections) between catalog
+        # operations (long-lived processes); by default they are released so others can write the files
+        self.keep_warehouse_connections = keep_warehouse_connections
+        # Use the process-wide warehouse plugin instance; without it this Orchestrator creates its own,
+        # so concurrent Orchestrators (the daemon's) neither share statistics nor close each other's pools
+        self.shared_warehouse_plugin = shared_warehouse_plugin
+        self.catalog_cache_dir = project_dir / ".dbt_helpers" / "cache"
+        # Sync only relations whose schema fingerprint changed since it was last synced
+        self.changed_only = changed_only
+        self.fingerprint_store = FingerprintStore(project_dir / ".dbt_helpers" / "fingerprints.json")
+        self.state_cache_path = project_dir / ".dbt_helpers" / "state_cache.json"
         self._config: ProjectConfig | None = None
-        self.state_builder = StateBuilder(project_dir)
+        self._warehouse_plugin: Any = None
+        self._state_builder: StateBuilder | None = None
 
         # Initialize workflow services
         self.source_sync_service = SourceSyncService(self)
@@ -39,17 +61,82 @@ class Orchestrator:
             self._config = load_config(self.config_path)
         return self._config
 
+    @property
+    def state_builder(self) -> StateBuilder:
+        if self._state_builder is None:
+            state_config = self.config.state
+            self._state_builder = StateBuilder(
+                self.project_dir,
+                cache_path=self.state_cache_path if state_config.cache else None,
+                hash_contents=state_config.hash_contents,
+                manifest_path=self.project_dir / state_config.manifest_path if state_config.manifest_path else None,
+                processes=state_config.processes,
+                parallel_threshold=state_config.parallel_threshold,
+            )
+        return self._state_builder
+
     @property
     def path_policy(self) -> PathPolicy:
         return PathPolicy(self.config.paths)
 
+    @property
+    def warehouse_connection(self) -> dict[str, Any]:
+        """Connection config passed to the warehouse plugin, including the catalog cache location."""
+        connection = dict(self.config.warehouse.connection)
+        if self.use_catalog_cache:
+            connection.setdefault("catalog_cache_dir", str(self.catalog_cache_dir))
+        return connection
+
+    @property
+    def catalog_cache_stats(self) -> dict[str, int] | None:
+        """Catalog cache statistics reported by the warehouse plugin for its last read, if any."""
+        return getattr(self._warehouse_plugin, "cache_stats", None)
+
+    @property
+    def catalog_request_stats(self) -> dict[str, dict[str, Any]] | None:
+        """Per-project request, retry and throttling counters reported by the warehouse plugin, if any."""
+        return getattr(self._warehouse_plugin, "request_stats", None)
+
+    @property
+    def catalog_file_stats(self) -> dict[str, dict[str, Any]] | None:
+        """Per-file read time and relation count reported by the warehouse plugin for its last read, if any."""
+        return getattr(self._warehouse_plugin, "file_stats", None)
+
+    @property
+    def state_stats(self) -> dict[str, int] | None:
+        """Reparsed, cached and removed YAML file counts (or manifest resources) of the last state build, if any."""
+        return self._state_builder.cache_stats if self._state_builder is not None else None
+
     def get_warehouse_plugin(self) -> Any:
         """Get the configured warehouse plugin."""
+        if self._warehouse_plugin is not None:
+            return self._warehouse_plugin
         wh_plugins = get_warehouse_plugins()
         wh_name = self.config.warehouse.plugin
         if wh_name not in wh_plugins:
             raise ValueError(f"Warehouse plugin '{wh_name}' not found. Available: {list(wh_plugins.keys())}")
-        return wh_plugins[wh_name]
+        self._warehouse_plugin = wh_plugins[wh_name] if self.shared_warehouse_plugin else wh_plugins.create(wh_name)
+        return self._warehouse_plugin
+
+    @contextmanager
+    def _catalog_operation(self) -> Iterator[None]:
+        """Release the warehouse plugin's file locks after a catalog operation, unless kept.
+
+        Only plugins locking local files implement `release_file_locks`; other pooled resources (such as
+        BigQuery's clients and credentials) are kept until `close`.
+        """
+        try:
+            yield
+        finally:
+            release_file_locks = getattr(self._warehouse_plugin, "release_file_locks", None)
+            if release_file_locks is not None and not self.keep_warehouse_connections:
+                release_file_locks()
+
+    def close(self) -> None:
+        """Release the warehouse plugin's pooled connections, if it pools any."""
+        close = getattr(self._warehouse_plugin, "close", None)
+        if close is not None:
+            close()
 
     def get_schema_plugin(self) -> Any:
         """Get the configured schema plugin (defaults to 'dbt')."""
@@ -63,11 +150,13 @@ class Orchestrator:
 
     def generate_source_plan(self, scope: list[str]) -> Plan:
         """Generate a plan to import new sources."""
-        return self.source_sync_service.generate_plan(scope)
+        with self._catalog_operation():
+            return self.source_sync_service.generate_plan(scope)
 
     def scaffold_models(self, scope: list[str]) -> Plan:
         """Read catalog for specified scope and generate scaffolded dbt models."""
-        return self.model_scaffold_service.scaffold(scope)
+        with self._catalog_operation():
+            return self.model_scaffold_service.scaffold(scope)
 
     def apply_plan(self, plan: Plan, callback: Callable[[PlannedOp], None] | None = None) -> None:
         """Apply the given plan to the project using safe I/O."""
@@ -87,14 +176,20 @@ class Orchestrator:
             else:
                 fs_writer.apply_op(op)
 
+        # The project now matches the fingerprints the plan was generated from
+        self.fingerprint_store.record(plan.fingerprints)
+
     def sync_sources(self, scope: list[str]) -> Plan:
         """Sync existing sources with warehouse metadata."""
-        return self.source_sync_service.sync(scope)
+        with self._catalog_operation():
+            return self.source_sync_service.sync(scope)
 
     def sync_models(self, scope: list[str]) -> Plan:
         """Sync existing models with warehouse metadata."""
-        return self.model_scaffold_service.sync(scope)
+        with self._catalog_operation():
+            return self.model_scaffold_service.sync(scope)
 
     def scaffold_snapshots(self, scope: list[str]) -> Plan:
         """Read catalog for specified scope and generate scaffolded dbt snapshots."""
-        return self.snapshot_scaffold_service.scaffold(scope)
+        with self._catalog_operation():
+            return self.snapshot_scaffold_service.scaffold(scope)
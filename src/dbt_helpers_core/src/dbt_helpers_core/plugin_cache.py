@@ -0,0 +1,115 @@
+"""Persistent cache of the plugin entry points, for discovery without a metadata scan.
+
+`importlib.metadata.entry_points()` reads the metadata of every installed distribution,
+which is slow in large environments. The cache records the entry points of the plugin
+groups in one JSON file per environment (`sys.prefix`) under the user cache directory, keyed
+on a fingerprint of the interpreter, the import path and the `*.dist-info`/`*.egg-info` entries on it (names and
+modification times). Installing, upgrading or removing a distribution changes the
+fingerprint, and the next discovery scans the metadata once and rewrites the cache.
+"""
+
+import contextlib
+import hashlib
+import importlib.metadata
+import json
+import os
+import sys
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+# Bump when the file layout changes so stale caches are discarded
+PLUGIN_CACHE_VERSION = 1
+
+# Set to a non-empty value to always scan the installed distributions
+NO_PLUGIN_CACHE_ENV = "DBT_HELPERS_NO_PLUGIN_CACHE"
+
+_METADATA_SUFFIXES = (".dist-info", ".egg-info")
+
+
+def default_plugin_cache_path() -> Path:
+    """Return this environment's cache file, so interpreters and virtualenvs do not overwrite each other's."""
+    base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    environment = hashlib.md5(sys.prefix.encode(), usedforsecurity=False).hexdigest()[:16]
+    return Path(base) / "dbt_helpers" / f"plugin_registry-{environment}.json"
+
+
+def distributions_fingerprint(paths: Iterable[str] | None = None) -> str:
+    """Return a digest of the interpreter and of the distribution metadata found on the import path."""
+    digest = hashlib.md5(usedforsecurity=False)
+    digest.update(f"{sys.executable}\0{sys.version}".encode())
+    for path in sys.path if paths is None else paths:
+        try:
+            with os.scandir(path or ".") as entries:
+                found = sorted(
+                    (entry.name, entry.stat().st_mtime_ns)
+                    for entry in entries
+                    if entry.name.endswith(_METADATA_SUFFIXES)
+                )
+        except OSError:
+            # Zip archives and missing directories hold no installed distributions
+            continue
+        digest.update(f"\0{path}\0{found!r}".encode())
+    return digest.hexdigest()
+
+
+class PluginCache:
+    """Entry points of a fixed set of groups, read from the cache file while the fingerprint matches.
+
+    The cache is resolved once per instance; `hit` tells whether it was read from the file.
+    """
+
+    def __init__(self, path: Path, groups: Iterable[str]):
+        self.path = path
+        self.groups = tuple(groups)
+        self.hit: bool | None = None
+        self._entry_points: dict[str, list[list[str]]] | None = None
+
+    def entry_points(self, group: str) -> list[importlib.metadata.EntryPoint]:
+        """Return the entry points registered in a group."""
+        if group not in self.groups:
+            return list(importlib.metadata.entry_points(group=group))
+        if self._entry_points is None:
+            self._entry_points = self._resolve()
+        return [importlib.metadata.EntryPoint(name, value, group) for name, value in self._entry_points[group]]
+
+    def _resolve(self) -> dict[str, list[list[str]]]:
+        fingerprint = distributions_fingerprint()
+        cached = self._load(fingerprint)
+        self.hit = cached is not None
+        if cached is not None:
+            return cached
+        all_entry_points = importlib.metadata.entry_points()
+        groups = {
+            group: [[entry_point.name, entry_point.value] for entry_point in all_entry_points.select(group=group)]
+            for group in self.groups
+        }
+        self._save(fingerprint, groups)
+        return groups
+
+    def _load(self, fingerprint: str) -> dict[str, list[list[str]]] | None:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != PLUGIN_CACHE_VERSION
+            or data.get("fingerprint") != fingerprint
+            or not all(group in data.get("groups", {}) for group in self.groups)
+        ):
+            return None
+        groups: dict[str, list[list[str]]] = data["groups"]
+        return groups
+
+    def _save(self, fingerprint: str, groups: dict[str, list[list[str]]]) -> None:
+        data: dict[str, Any] = {"version": PLUGIN_CACHE_VERSION, "fingerprint": fingerprint, "groups": groups}
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(data, sort_keys=True), encoding="utf-8")
+            tmp_path.replace(self.path)
+        except OSError:
+            # An unwritable cache directory only costs the next process another scan
+            with contextlib.suppress(OSError):
+                tmp_path.unlink(missing_ok=True)
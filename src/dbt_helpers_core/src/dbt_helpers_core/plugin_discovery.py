@@ -1,31 +1,127 @@
 import importlib.metadata
-from typing import TypeVar
+import os
+import threading
+from collections.abc import Iterable, Iterator, Mapping
+from typing import Any, Generic, TypeVar
 
 from dbt_helpers_sdk import CatalogClient, SchemaAdapter, ToolEmitter
 
+from .plugin_cache import NO_PLUGIN_CACHE_ENV, PluginCache, default_plugin_cache_path
+
 T = TypeVar("T")
 
+WAREHOUSE_PLUGINS_GROUP = "dbt_helpers.warehouse_plugins"
+TOOL_PLUGINS_GROUP = "dbt_helpers.tool_plugins"
+SCHEMA_PLUGINS_GROUP = "dbt_helpers.schema_plugins"
+PLUGIN_GROUPS = (WAREHOUSE_PLUGINS_GROUP, TOOL_PLUGINS_GROUP, SCHEMA_PLUGINS_GROUP)
+
+
+class PluginRegistry(Mapping[str, T], Generic[T]):
+    """Plugins of one entry-point group, by name.
+
+    Names are resolved from the entry points without importing anything; a plugin's module
+    is imported and its class instantiated on first access, so selecting one plugin does not
+    import the SDKs of the others. Instances are reused for the lifetime of the registry;
+    `create` returns an instance of its own to a caller that must not share its state.
+    """
+
+    def __init__(
+        self,
+        group: str,
+        expected_type: type[T],
+        entry_points: Iterable[importlib.metadata.EntryPoint] | None = None,
+    ):
+        self.group = group
+        self.expected_type = expected_type
+        if entry_points is None:
+            entry_points = importlib.metadata.entry_points(group=group)
+        self._entry_points = {entry_point.name: entry_point for entry_point in entry_points}
+        self._instances: dict[str, T] = {}
+        self._lock = threading.Lock()
 
-def discover_plugins(group: str, expected_type: type[T]) -> dict[str, T]:
-    """Discover and instantiate plugins of a specific type registered via entry points."""
-    plugins = {}
-    entry_points = importlib.metadata.entry_points(group=group)
-    for entry_point in entry_points:
-        plugin_class = entry_point.load()
-        # Instantiate the plugin
+    def __getitem__(self, name: str) -> T:
+        """Return the plugin instance, loading its entry point on first access."""
+        with self._lock:
+            instance = self._instances.get(name)
+            if instance is None:
+                instance = self._load(name)
+                self._instances[name] = instance
+            return instance
+
+    def create(self, name: str) -> T:
+        """Return a new instance of the plugin, not shared with other callers."""
+        return self._load(name)
+
+    def _load(self, name: str) -> T:
+        plugin_class = self._entry_points[name].load()
         instance = plugin_class()
-        if isinstance(instance, expected_type):
-            plugins[entry_point.name] = instance
-    return plugins
+        if not isinstance(instance, self.expected_type):
+            raise TypeError(f"Plugin '{name}' in {self.group} is not a {self.expected_type.__name__}")
+        return instance
+
+    def __contains__(self, name: object) -> bool:
+        """Whether a plugin of this name is installed, without loading it."""
+        return name in self._entry_points
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the names of the installed plugins."""
+        return iter(self._entry_points)
+
+    def __len__(self) -> int:
+        """Return the number of installed plugins."""
+        return len(self._entry_points)
+
+
+# Registries of this process by group, and the entry points they were resolved from; see invalidate_plugins
+_registries: dict[str, PluginRegistry[Any]] = {}
+_plugin_cache: PluginCache | None = None
+_registries_lock = threading.Lock()
+
+
+def _entry_points(group: str) -> list[importlib.metadata.EntryPoint]:
+    global _plugin_cache  # pylint: disable=global-statement
+    if os.environ.get(NO_PLUGIN_CACHE_ENV):
+        return list(importlib.metadata.entry_points(group=group))
+    if _plugin_cache is None:
+        _plugin_cache = PluginCache(default_plugin_cache_path(), PLUGIN_GROUPS)
+    return _plugin_cache.entry_points(group)
+
+
+def discover_plugins(group: str, expected_type: type[T]) -> PluginRegistry[T]:
+    """Return the registry of plugins registered via entry points in a group, shared within the process.
+
+    Entry points of the plugin groups come from the persistent plugin cache (see plugin_cache) unless
+    `DBT_HELPERS_NO_PLUGIN_CACHE` is set.
+    """
+    with _registries_lock:
+        registry = _registries.get(group)
+        if registry is None:
+            registry = PluginRegistry(group, expected_type, _entry_points(group))
+            _registries[group] = registry
+        return registry
+
+
+def invalidate_plugins(group: str | None = None) -> None:
+    """Forget the registry of a group (or of all groups), e.g. after installing plugins.
+
+    The next discovery resolves the entry points again and creates fresh plugin instances.
+    """
+    global _plugin_cache  # pylint: disable=global-statement
+    with _registries_lock:
+        _plugin_cache = None
+        if group is None:
+            _registries.clear()
+        else:
+            _registries.pop(group, None)
 
 
-def get_warehouse_plugins() -> dict[str, CatalogClient]:
-    return discover_plugins("dbt_helpers.warehouse_plugins", CatalogClient)
+def get_warehouse_plugins() -> PluginRegistry[CatalogClient]:
+    return discover_plugins(WAREHOUSE_PLUGINS_GROUP, CatalogClient)
 
 
-def get_tool_plugins() -> dict[str, ToolEmitter]:
-    return discover_plugins("dbt_helpers.tool_plugins", ToolEmitter)
+def get_tool_plugins() -> PluginRegistry[ToolEmitter]:
+    return discover_plugins(TOOL_PLUGINS_GROUP, ToolEmitter)
 
 
-def get_schema_plugins() -> dict[str, SchemaAdapter]:
-    return discover_plugins("dbt_helpers.schema_plugins", SchemaAdapter)
+def get_schema_plugins() -> PluginRegistry[SchemaAdapter]:
+    return discover_plugins(SCHEMA_PLUGINS_GROUP, SchemaAdapter)
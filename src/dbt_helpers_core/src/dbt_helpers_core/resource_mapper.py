@@ -1,11 +1,19 @@
+from collections.abc import Iterable, Iterator
+
 from dbt_helpers_sdk import CatalogRelation, DbtColumnIR, DbtResourceIR
 
 
 def map_catalog_to_ir(
-    relations: list[CatalogRelation], project_alias_map: dict[str, str] | None = None
+    relations: Iterable[CatalogRelation], project_alias_map: dict[str, str] | None = None
 ) -> list[DbtResourceIR]:
     """Map warehouse catalog relations to dbt Intermediate Representation (IR)."""
-    ir_resources = []
+    return list(iter_catalog_to_ir(relations, project_alias_map))
+
+
+def iter_catalog_to_ir(
+    relations: Iterable[CatalogRelation], project_alias_map: dict[str, str] | None = None
+) -> Iterator[DbtResourceIR]:
+    """Lazily map catalog relations to IR, one resource per relation as it arrives."""
     alias_map = project_alias_map or {}
     for rel in relations:
         columns = [
@@ -21,6 +29,10 @@ def map_catalog_to_ir(
         # Standardize metadata extraction
         metadata = rel.metadata.copy()
         metadata["identifier"] = rel.name
+        # Warehouse name and schema fingerprint, for skipping unchanged relations on later syncs
+        metadata["relation_name"] = rel.full_name
+        if rel.fingerprint is not None:
+            metadata["fingerprint"] = rel.fingerprint
 
         # Apply project aliases to namespace parts
         parts = list(rel.namespace.parts)
@@ -44,17 +56,14 @@ def map_catalog_to_ir(
         if "labels" in rel.metadata:
             meta.update(rel.metadata["labels"])
 
-        ir_resources.append(
-            DbtResourceIR(
-                name=rel.dbt_name or rel.name,
-                description=rel.metadata.get("description"),
-                columns=columns,
-                meta=meta,
-                tags=tags,
-                config=config,
-            )
+        resource = DbtResourceIR(
+            name=rel.dbt_name or rel.name,
+            description=rel.metadata.get("description"),
+            columns=columns,
+            meta=meta,
+            tags=tags,
+            config=config,
         )
         # Tag the resource with extraction metadata
-        ir_resources[-1].meta["_extraction_metadata"] = metadata
-
-    return ir_resources
+        resource.meta["_extraction_metadata"] = metadata
+        yield resource
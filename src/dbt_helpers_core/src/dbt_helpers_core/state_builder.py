@@ -1,8 +1,25 @@
+import contextlib
+import hashlib
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Any
 
 import ruamel.yaml
 from pydantic import BaseModel, Field
 
+# Bump when the parse cache layout changes so stale caches are discarded
+STATE_CACHE_VERSION = 1
+
+# Below this many YAML files to parse, starting worker processes costs more than it saves: each
+# spawned worker spends about 0.3 s importing, while a file parses in under 2 ms
+PARALLEL_PARSE_THRESHOLD = 1000
+
+# YAML parser of a worker process, created by its first shard
+_worker_yaml: ruamel.yaml.YAML | None = None
+
 
 class ProjectState(BaseModel):
     """Represents the current state of a dbt project."""
@@ -14,61 +31,219 @@ class ProjectState(BaseModel):
 
 
 class StateBuilder:
-    """Builds the ProjectState by scanning the dbt project directory."""
-
-    def __init__(self, project_dir: Path):
+    """Builds the ProjectState by scanning the dbt project directory.
+
+    With a cache path, the resources found in each YAML file are persisted with the file's
+    size and mtime, and only files whose size or mtime changed are parsed again; with
+    hash_contents, such a file is not parsed either when its content hash is unchanged
+    (e.g. touched by a checkout). `cache_stats` reports the counts of the last build.
+
+    With a manifest path, the state is read from a fresh dbt `manifest.json` instead, and
+    the files are scanned only when the manifest is missing or stale (see manifest_state).
+
+    When at least parallel_threshold YAML files must be parsed, they are sharded across
+    `processes` worker processes (default: the CPU count); 1 keeps the parse serial.
+    """
+
+    def __init__(
+        self,
+        project_dir: Path,
+        cache_path: Path | None = None,
+        hash_contents: bool = False,
+        manifest_path: Path | None = None,
+        processes: int | None = None,
+        parallel_threshold: int = PARALLEL_PARSE_THRESHOLD,
+    ):
+        if processes is not None and processes < 1:
+            raise ValueError(f"processes must be >= 1, got {processes}")
         self.project_dir = project_dir
         self.yaml = ruamel.yaml.YAML(typ="safe")
+        self.cache_path = cache_path
+        self.hash_contents = hash_contents
+        self.manifest_path = manifest_path
+        self.processes = processes or os.cpu_count() or 1
+        self.parallel_threshold = parallel_threshold
+        self.cache_stats: dict[str, int] = {}
+        self._cache_dirty = False
 
     def build_state(self) -> ProjectState:
-        """Scan the project directory and return a ProjectState object."""
+        """Scan the project directory (or read the manifest) and return a ProjectState object."""
+        if self.manifest_path is not None:
+            # manifest_state builds on ProjectState
+            from .manifest_state import load_manifest_state  # pylint: disable=import-outside-toplevel,cyclic-import
+
+            manifest_state = load_manifest_state(self.project_dir, self.manifest_path)
+            if manifest_state is not None:
+                self.cache_stats = {"manifest": len(manifest_state.models) + len(manifest_state.sources)}
+                return manifest_state
+
         state = ProjectState()
+        self.cache_stats = {"reparsed": 0, "cached": 0, "removed": 0}
+        self._cache_dirty = False
 
         # Scan models directory (or root if needed, but dbt convention is models/)
         models_dir = self.project_dir / "models"
         if not models_dir.exists():
             return state
 
+        cached_files = self._load_cache()
+        files: dict[str, dict[str, Any]] = {}
+        # YAML files in scan order, which decides between resources defined in several files
+        yaml_files: list[tuple[Path, dict[str, Any]]] = []
+        to_parse: list[tuple[Path, dict[str, Any]]] = []
+
         for file_path in models_dir.rglob("*"):
             if file_path.suffix == ".sql":
                 # filename is model name
                 model_name = file_path.stem
                 state.models[model_name] = file_path.relative_to(self.project_dir)
             elif file_path.suffix in (".yml", ".yaml"):
-                self._parse_yaml_state(file_path, state)
-
+                relative_path = file_path.relative_to(self.project_dir)
+                key = relative_path.as_posix()
+                entry = self._yaml_entry(file_path, cached_files.get(key))
+                if entry is None:
+                    continue
+                files[key] = entry
+                yaml_files.append((relative_path, entry))
+                if "sources" not in entry:
+                    to_parse.append((file_path, entry))
+
+        self._parse_yaml_files(to_parse)
+        for relative_path, entry in yaml_files:
+            self._merge_yaml_resources(relative_path, entry["sources"], entry["models"], state)
+
+        self.cache_stats["removed"] = len(cached_files.keys() - files.keys())
+        if self.cache_stats["reparsed"] or self.cache_stats["removed"] or self._cache_dirty:
+            self._save_cache(files)
         return state
 
-    def _parse_yaml_state(self, file_path: Path, state: ProjectState):
-        """Parse a YAML file and update the state with discovered resources."""
+    def _yaml_entry(self, file_path: Path, cached: dict[str, Any] | None) -> dict[str, Any] | None:
+        """Return the file's fingerprint, with its resources from the cached entry when the file is unchanged."""
+        try:
+            stat = file_path.stat()
+        except OSError:
+            # Skip inaccessible files for now
+            return None
+        entry: dict[str, Any] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+        if cached is not None and (cached.get("size"), cached.get("mtime_ns")) == (stat.st_size, stat.st_mtime_ns):
+            self.cache_stats["cached"] += 1
+            return cached
+
+        if self.hash_contents:
+            try:
+                entry["sha256"] = hashlib.sha256(file_path.read_bytes()).hexdigest()
+            except OSError:
+                return None
+            if cached is not None and cached.get("sha256") == entry["sha256"]:
+                # Touched but unchanged: keep the resources, record the new size and mtime
+                self.cache_stats["cached"] += 1
+                self._cache_dirty = True
+                return {**cached, **entry}
+
+        self.cache_stats["reparsed"] += 1
+        return entry
+
+    def _parse_yaml_files(self, to_parse: list[tuple[Path, dict[str, Any]]]) -> None:
+        """Add the resources of each file to its entry, parsing in worker processes when there are many files."""
+        processes = min(self.processes, len(to_parse))
+        if processes <= 1 or len(to_parse) < self.parallel_threshold:
+            for file_path, entry in to_parse:
+                entry["sources"], entry["models"] = _parse_yaml_resources(self.yaml, file_path)
+            return
+
+        # A few shards per worker even out files of uneven size; each shard's results return in one message
+        shard_size = -(-len(to_parse) // (processes * 4))
+        shards = [
+            [str(file_path) for file_path, _ in to_parse[start : start + shard_size]]
+            for start in range(0, len(to_parse), shard_size)
+        ]
+        # Spawned rather than forked: the daemon builds states from request threads
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=processes, mp_context=context) as executor:
+            results = [resources for shard in executor.map(_parse_yaml_shard, shards) for resources in shard]
+        for (_, entry), (sources, models) in zip(to_parse, results, strict=True):
+            entry["sources"], entry["models"] = sources, models
+
+    def _merge_yaml_resources(self, relative_path: Path, sources: list[str], models: list[str], state: ProjectState):
+        """Update the state with the resources discovered in a YAML file."""
+        for key in sources:
+            state.sources[key] = relative_path
+        for model_name in models:
+            if model_name not in state.models:
+                # We prioritize .sql files for model locations,
+                # but .yml might contain the schema definition
+                state.models[model_name] = relative_path
+
+    def _load_cache(self) -> dict[str, dict[str, Any]]:
+        if self.cache_path is None:
+            return {}
         try:
-            with file_path.open(encoding="utf-8") as f:
-                data = self.yaml.load(f)
-
-            if not data:
-                return
-
-            # Parse sources
-            if "sources" in data:
-                for source in data["sources"]:
-                    source_name = source.get("name")
-                    if not source_name:
-                        continue
-                    for table in source.get("tables", []):
-                        table_name = table.get("name")
-                        if table_name:
-                            key = f"{source_name}.{table_name}"
-                            state.sources[key] = file_path.relative_to(self.project_dir)
-
-            # Parse model patches
-            if "models" in data:
-                for model in data["models"]:
-                    model_name = model.get("name")
-                    if model_name and model_name not in state.models:
-                        # We prioritize .sql files for model locations,
-                        # but .yml might contain the schema definition
-                        state.models[model_name] = file_path.relative_to(self.project_dir)
-
-        except Exception:  # pylint: disable=broad-exception-caught
-            # Skip invalid YAML files or inaccessible files for now
+            data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            # A missing or corrupt cache only means every file is parsed again
+            return {}
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != STATE_CACHE_VERSION
+            or data.get("hash_contents") != self.hash_contents
+        ):
+            return {}
+        files: dict[str, dict[str, Any]] = data.get("files", {})
+        return files
+
+    def _save_cache(self, files: dict[str, dict[str, Any]]) -> None:
+        if self.cache_path is None:
             return
+        data = {"version": STATE_CACHE_VERSION, "hash_contents": self.hash_contents, "files": files}
+        tmp_path = self.cache_path.with_name(f"{self.cache_path.name}.{os.getpid()}.tmp")
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(data, sort_keys=True), encoding="utf-8")
+            tmp_path.replace(self.cache_path)
+        except OSError:
+            # An unwritable cache only costs the next build a full parse
+            with contextlib.suppress(OSError):
+                tmp_path.unlink(missing_ok=True)
+
+
+def _parse_yaml_resources(yaml: ruamel.yaml.YAML, file_path: Path) -> tuple[list[str], list[str]]:
+    """Return the "source_name.table_name" keys and the model names defined in a YAML file."""
+    sources: list[str] = []
+    models: list[str] = []
+    try:
+        with file_path.open(encoding="utf-8") as f:
+            data = yaml.load(f)
+
+        if not data:
+            return sources, models
+
+        # Parse sources
+        if "sources" in data:
+            for source in data["sources"]:
+                source_name = source.get("name")
+                if not source_name:
+                    continue
+                for table in source.get("tables", []):
+                    table_name = table.get("name")
+                    if table_name:
+                        sources.append(f"{source_name}.{table_name}")
+
+        # Parse model patches
+        if "models" in data:
+            for model in data["models"]:
+                model_name = model.get("name")
+                if model_name:
+                    models.append(model_name)
+
+    except Exception:  # pylint: disable=broad-exception-caught
+        # Skip invalid YAML files or inaccessible files for now
+        return [], []
+    return sources, models
+
+
+def _parse_yaml_shard(paths: list[str]) -> list[tuple[list[str], list[str]]]:
+    """Parse YAML files in a worker process and return the resources of each, in order."""
+    global _worker_yaml  # pylint: disable=global-statement
+    if _worker_yaml is None:
+        _worker_yaml = ruamel.yaml.YAML(typ="safe")
+    return [_parse_yaml_resources(_worker_yaml, Path(path)) for path in paths]
@@ -5,9 +5,11 @@ from dbt_helpers_sdk import (
     DbtResourceIR,
     Plan,
     UpdateYamlFile,
+    iter_catalog,
 )
 
-from ..resource_mapper import map_catalog_to_ir
+from ..fingerprint_store import fingerprint_entry
+from ..resource_mapper import iter_catalog_to_ir
 
 
 class ModelScaffoldService:
@@ -21,11 +23,9 @@ class ModelScaffoldService:
         wh_plugin = self.orch.get_warehouse_plugin()
         schema_plugin = self.orch.get_schema_plugin()
 
-        # 2. Read Catalog
-        relations = wh_plugin.read_catalog(scope, self.orch.config.warehouse.connection)
-
-        # 3. Map to IR
-        ir_resources = map_catalog_to_ir(relations, self.orch.config.project_alias_map)
+        # 2. Stream the catalog and 3. map to IR, so rendering overlaps with warehouse reads
+        relations = iter_catalog(wh_plugin, scope, self.orch.warehouse_connection)
+        ir_resources = iter_catalog_to_ir(relations, self.orch.config.project_alias_map)
 
         # 4. Create Plan
         plan = Plan()
@@ -83,8 +83,11 @@ class ModelScaffoldService:
         wh_plugin = self.orch.get_warehouse_plugin()
         schema_plugin = self.orch.get_schema_plugin()
 
-        relations = wh_plugin.read_catalog(scope, self.orch.config.warehouse.connection)
-        new_ir_resources = map_catalog_to_ir(relations, self.orch.config.project_alias_map)
+        relations = iter_catalog(wh_plugin, scope, self.orch.warehouse_connection)
+        if self.orch.changed_only:
+            # Unchanged relations whose model still exists are not mapped or diffed
+            relations = self.orch.fingerprint_store.iter_changed("models", relations, project_state.models)
+        new_ir_resources = iter_catalog_to_ir(relations, self.orch.config.project_alias_map)
 
         path_to_new_irs: dict[Path, list[DbtResourceIR]] = {}
         for new_ir in new_ir_resources:
@@ -95,6 +98,8 @@ class ModelScaffoldService:
                 path_to_new_irs[path].append(new_ir)
 
         plan = Plan()
+        in_sync: dict[str, list[str]] = {}
+        pending: dict[str, list[str]] = {}
         for path, new_irs in path_to_new_irs.items():
             full_path = self.orch.project_dir / path
             if full_path.exists():
@@ -107,8 +112,12 @@ class ModelScaffoldService:
                     if current_ir:
                         patches = schema_plugin.calculate_patch(current_ir, new_ir)
                         all_patches.extend(patches)
+                        (pending if patches else in_sync).update(fingerprint_entry(new_ir, new_ir.name))
 
                 if all_patches:
                     plan.add_op(UpdateYamlFile(path=path, patch_ops=all_patches))
 
+        if self.orch.changed_only:
+            self.orch.fingerprint_store.record({"models": in_sync})
+            plan.fingerprints = {"models": pending} if pending else {}
         return plan
@@ -1,9 +1,10 @@
 from dbt_helpers_sdk import (
     CreateFile,
     Plan,
+    iter_catalog,
 )
 
-from ..resource_mapper import map_catalog_to_ir
+from ..resource_mapper import iter_catalog_to_ir
 
 
 class SnapshotScaffoldService:
@@ -17,8 +18,8 @@ class SnapshotScaffoldService:
         wh_plugin = self.orch.get_warehouse_plugin()
         schema_plugin = self.orch.get_schema_plugin()
 
-        relations = wh_plugin.read_catalog(scope, self.orch.config.warehouse.connection)
-        ir_resources = map_catalog_to_ir(relations, self.orch.config.project_alias_map)
+        relations = iter_catalog(wh_plugin, scope, self.orch.warehouse_connection)
+        ir_resources = iter_catalog_to_ir(relations, self.orch.config.project_alias_map)
 
         plan = Plan()
 
@@ -33,9 +34,13 @@ class SnapshotScaffoldService:
             # Resolve path
             sql_path = self.orch.project_dir / self.orch.path_policy.resolve_path_for_resource(res, "snapshot")
 
+            # Use the warehouse primary key when the catalog reports one; a composite key is a list
+            primary_key = extraction_meta.get("primary_key") or ["id"]
+            unique_key = primary_key[0] if len(primary_key) == 1 else primary_key
+
             # Generate Snapshot SQL content
             snapshot_config = {
-                "unique_key": "id",
+                "unique_key": unique_key,
                 "strategy": "check",
                 "check_cols": "all",
                 "target_schema": "snapshots",
@@ -8,9 +8,11 @@ from dbt_helpers_sdk import (
     Plan,
     SchemaAdapter,
     UpdateYamlFile,
+    iter_catalog,
 )
 
-from ..resource_mapper import map_catalog_to_ir
+from ..fingerprint_store import fingerprint_entry
+from ..resource_mapper import iter_catalog_to_ir
 
 if TYPE_CHECKING:
     from ..orchestrator import Orchestrator
@@ -31,14 +33,19 @@ class SourceSyncService:
         wh_plugin = self.orch.get_warehouse_plugin()
         schema_plugin: SchemaAdapter = self.orch.get_schema_plugin()
 
-        # 2. Read Catalog
-        relations = wh_plugin.read_catalog(scope, self.orch.config.warehouse.connection)
-
-        # 3. Map to IR and apply project aliases
-        ir_resources = map_catalog_to_ir(relations, self.orch.config.project_alias_map)
+        # 2. Stream the catalog and 3. map to IR with project aliases as relations arrive
+        relations = iter_catalog(wh_plugin, scope, self.orch.warehouse_connection)
+        if self.orch.changed_only:
+            # Unchanged relations whose source still exists are not mapped, rendered or diffed
+            relations = self.orch.fingerprint_store.iter_changed("sources", relations, project_state.sources)
+        ir_resources = iter_catalog_to_ir(relations, self.orch.config.project_alias_map)
 
         # 4. Create Plan
         plan = Plan()
+        # Fingerprints of resources already in sync, and of those the plan brings in sync
+        in_sync: dict[str, list[str]] = {}
+        pending: dict[str, list[str]] = {}
+        resource_ids: dict[str, str] = {}
 
         # Group resources by their target or existing path
         path_to_resources: dict[Path, list[DbtResourceIR]] = {}
@@ -47,6 +54,7 @@ class SourceSyncService:
             extraction_meta = res.meta.get("_extraction_metadata", {})
             source_name = extraction_meta.get("source_name", "default")
             resource_id = f"{source_name}.{res.name}"
+            resource_ids[res.name] = resource_id
 
             if resource_id in project_state.sources:
                 target_path = project_state.sources[resource_id]
@@ -82,11 +90,14 @@ class SourceSyncService:
 
                 for new_ir in resources:
                     current_ir = next((r for r in current_irs if r.name == new_ir.name), None)
+                    entry = fingerprint_entry(new_ir, resource_ids[new_ir.name])
                     if current_ir:
                         patches = schema_plugin.calculate_patch(current_ir, new_ir)
                         all_patches.extend(patches)
+                        (pending if patches else in_sync).update(entry)
                     else:
                         new_resources_to_add.append(new_ir)
+                        pending.update(entry)
 
                 if new_resources_to_add:
                     # Render new resources and add them to the file
@@ -118,7 +129,12 @@ class SourceSyncService:
                 # Import logic: create new file
                 source_yaml = self._render_new_source(resources, schema_plugin)
                 plan.add_op(CreateFile(path=path, content=source_yaml))
+                for res in resources:
+                    pending.update(fingerprint_entry(res, resource_ids[res.name]))
 
+        if self.orch.changed_only:
+            self.orch.fingerprint_store.record({"sources": in_sync})
+            plan.fingerprints = {"sources": pending} if pending else {}
         return plan
 
     def _render_new_source(self, resources: list[DbtResourceIR], schema_plugin: SchemaAdapter) -> str:
@@ -0,0 +1,224 @@
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from dbt_helpers_core.daemon.client import DaemonClient, RemoteOrchestrator, connect_daemon
+from dbt_helpers_core.daemon.protocol import (
+    INVALID_PARAMS,
+    METHOD_NOT_FOUND,
+    NO_DAEMON_ENV,
+    PROTOCOL_VERSION,
+    SOCKET_ENV,
+    DaemonError,
+    default_socket_path,
+)
+from dbt_helpers_core.daemon.server import DaemonServer
+from dbt_helpers_core.plugin_discovery import PluginRegistry
+from dbt_helpers_sdk import CatalogNamespace, CatalogRelation, Plan
+
+
+class MockWarehousePlugin:
+    """Mock warehouse plugin reporting cache statistics and counting releases of its file locks."""
+
+    def __init__(self):
+        self.cache_stats = {"hits": 0, "misses": 1}
+        self.closed = 0
+        self.released = 0
+
+    def close(self):
+        self.closed += 1
+
+    def release_file_locks(self):
+        self.released += 1
+
+    def read_catalog(self, scope, connection_config):  # noqa: ARG002  # pylint: disable=unused-argument
+        # Relative database paths would resolve against it
+        self.working_dir = str(Path.cwd())
+        return [CatalogRelation(namespace=CatalogNamespace(parts=["raw"]), name="users", kind="table", columns=[])]
+
+
+class MockSchemaPlugin:  # pylint: disable=unused-argument
+    """Mock schema plugin rendering fixed source YAML."""
+
+    def render_source_yaml(
+        self, resources, target_version, source_name="raw", database=None, context=None  # noqa: ARG002
+    ):
+        return "version: 2\nsources:\n  - name: raw\n"
+
+    def parse_source_yaml(self, content):  # noqa: ARG002
+        return []
+
+
+@unittest.skipUnless(hasattr(__import__("socket"), "AF_UNIX"), "Unix domain sockets are not available")
+class TestDaemon(unittest.TestCase):
+    """Tests for the dbth serve daemon and its client."""
+
+    def setUp(self):
+        # Short base directory: Unix socket paths are limited to about 100 bytes
+        self.test_dir = Path(tempfile.mkdtemp(prefix="dbth"))
+        self.addCleanup(shutil.rmtree, self.test_dir, True)
+        self.socket_path = self.test_dir / "run" / "daemon.sock"
+        self.project_dir = self.test_dir / "project"
+        self.project_dir.mkdir()
+        (self.project_dir / "dbt_helpers.yml").write_text("warehouse:\n  plugin: mock_wh\n", encoding="utf-8")
+
+        entry_point = MagicMock()
+        entry_point.name = "mock_wh"
+        entry_point.load.return_value = MockWarehousePlugin
+        warehouse_plugins = PluginRegistry("dbt_helpers.warehouse_plugins", object, [entry_point])
+        for patcher in (
+            patch("dbt_helpers_core.orchestrator.get_warehouse_plugins", return_value=warehouse_plugins),
+            patch("dbt_helpers_core.orchestrator.get_schema_plugins", return_value={"dbt": MockSchemaPlugin()}),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.server = DaemonServer(self.socket_path)
+        thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        thread.start()
+
+        def stop():
+            self.server.shutdown()
+            self.server.server_close()
+            thread.join()
+
+        self.addCleanup(stop)
+        self.client = DaemonClient(self.socket_path, timeout=10)
+
+    def test_socket_is_private(self):
+        self.assertEqual(self.socket_path.stat().st_mode & 0o777, 0o600)
+        self.assertEqual(self.socket_path.parent.stat().st_mode & 0o777, 0o700)
+
+    def test_ping(self):
+        result = self.client.call("ping")
+        self.assertEqual(result["protocol"], PROTOCOL_VERSION)
+        self.assertEqual(result["pid"], os.getpid())
+
+    def test_plan_reuses_the_project_orchestrator(self):
+        remote = RemoteOrchestrator(self.client, self.project_dir)
+
+        first = remote.generate_source_plan(["raw"])
+        second = remote.generate_source_plan(["raw"])
+
+        self.assertIsInstance(first, Plan)
+        self.assertEqual(first.to_json(), second.to_json())
+        self.assertEqual([op.op_kind for op in first.ops], ["create_file"])
+        self.assertEqual(remote.catalog_cache_stats, {"hits": 0, "misses": 1})
+        self.assertEqual(self.client.call("ping")["projects"], [str(self.project_dir.resolve())])
+        project = self.server.project(str(self.project_dir))
+        self.assertEqual(len(project._orchestrators), 1)  # pylint: disable=protected-access
+
+    def test_plan_reloads_a_changed_config(self):
+        remote = RemoteOrchestrator(self.client, self.project_dir)
+        remote.generate_source_plan(["raw"])
+        project = self.server.project(str(self.project_dir))
+        before = project.orchestrator(True, False, False)
+
+        config = "warehouse:\n  plugin: mock_wh\nowner: analytics\n"
+        (self.project_dir / "dbt_helpers.yml").write_text(config, encoding="utf-8")
+        remote.generate_source_plan(["raw"])
+
+        after = project.orchestrator(True, False, False)
+        self.assertIsNot(before, after)
+        self.assertEqual(after.config.owner, "analytics")
+
+    def test_apply_writes_the_plan(self):
+        remote = RemoteOrchestrator(self.client, self.project_dir)
+        plan = remote.generate_source_plan(["raw"])
+        seen = []
+
+        remote.apply_plan(plan, callback=seen.append)
+
+        self.assertEqual(len(seen), len(plan.ops))
+        self.assertTrue(plan.ops[0].path.exists())
+
+    def test_errors(self):
+        with self.assertRaises(DaemonError) as ctx:
+            self.client.call("compile")
+        self.assertEqual(ctx.exception.code, METHOD_NOT_FOUND)
+
+        with self.assertRaises(DaemonError) as ctx:
+            self.client.call("plan", {"project_dir": str(self.project_dir), "operation": "drop_all", "scope": []})
+        self.assertEqual(ctx.exception.code, INVALID_PARAMS)
+
+        (self.project_dir / "dbt_helpers.yml").write_text("warehouse:\n  plugin: missing\n", encoding="utf-8")
+        with self.assertRaisesRegex(DaemonError, "Warehouse plugin 'missing' not found"):
+            RemoteOrchestrator(self.client, self.project_dir).generate_source_plan(["raw"])
+
+    def test_refuses_to_replace_a_running_daemon(self):
+        with self.assertRaisesRegex(DaemonError, "already running"):
+            DaemonServer(self.socket_path)
+
+    def test_projects_have_their_own_warehouse_plugins(self):
+        """Concurrently served projects neither share catalog statistics nor close each other's connections."""
+        other_dir = self.test_dir / "other"
+        other_dir.mkdir()
+        shutil.copy(self.project_dir / "dbt_helpers.yml", other_dir / "dbt_helpers.yml")
+        RemoteOrchestrator(self.client, self.project_dir).generate_source_plan(["raw"])
+        RemoteOrchestrator(self.client, other_dir).generate_source_plan(["raw"])
+
+        plugin = self.server.project(str(self.project_dir)).orchestrator(True, False, False).get_warehouse_plugin()
+        other = self.server.project(str(other_dir)).orchestrator(True, False, False).get_warehouse_plugin()
+        self.assertIsNot(plugin, other)
+        other.cache_stats["misses"] = 5
+        RemoteOrchestrator(self.client, other_dir).generate_source_plan(["raw"])
+
+        self.assertEqual(plugin.cache_stats, {"hits": 0, "misses": 1})
+        self.assertEqual((plugin.released, other.released), (1, 2))
+        self.assertEqual((plugin.closed, other.closed), (0, 0))
+
+    def test_connect_daemon(self):
+        self.assertIsNotNone(connect_daemon(self.socket_path))
+        self.assertIsNone(connect_daemon(self.test_dir / "missing.sock"))
+        with patch.dict(os.environ, {NO_DAEMON_ENV: "1"}):
+            self.assertIsNone(connect_daemon(self.socket_path))
+
+    def test_connect_daemon_requires_a_private_socket(self):
+        """A socket in a directory others can enter, or owned by another user, is not trusted."""
+        self.socket_path.parent.chmod(0o755)
+        self.assertIsNone(connect_daemon(self.socket_path))
+        self.socket_path.parent.chmod(0o700)
+        with patch("os.getuid", return_value=os.getuid() + 1):
+            self.assertIsNone(connect_daemon(self.socket_path))
+        self.assertIsNotNone(connect_daemon(self.socket_path))
+
+    def test_connect_daemon_with_other_settings(self):
+        """A daemon seeing other credentials or configuration would plan differently: plan locally."""
+        with patch.dict(os.environ, {"GOOGLE_APPLICATION_CREDENTIALS": str(self.test_dir / "key.json")}):
+            self.assertIsNone(connect_daemon(self.socket_path))
+        with patch.dict(os.environ, {"DBT_HELPERS_TOKEN_CACHE_KEY": "other"}):
+            self.assertIsNone(connect_daemon(self.socket_path))
+        # Variables that editors, hooks and shells set differently do not affect plans
+        with patch.dict(os.environ, {"EDITOR": "vim", "SHLVL": "3", "TERM": "dumb", NO_DAEMON_ENV: ""}):
+            self.assertIsNotNone(connect_daemon(self.socket_path))
+
+    def test_plan_runs_in_the_client_working_directory(self):
+        """Clients in any directory use the daemon, which plans in the client's directory."""
+        cwd = Path.cwd()
+        self.addCleanup(os.chdir, cwd)
+        os.chdir(self.project_dir)
+        client = connect_daemon(self.socket_path)
+        self.assertIsNotNone(client)
+
+        RemoteOrchestrator(client, Path()).generate_source_plan(["raw"])
+        plugin = self.server.project(str(self.project_dir)).orchestrator(True, False, False).get_warehouse_plugin()
+        self.assertEqual(plugin.working_dir, str(self.project_dir.resolve()))
+
+        os.chdir(self.test_dir)
+        RemoteOrchestrator(client, self.project_dir).generate_source_plan(["raw"])
+        self.assertEqual(plugin.working_dir, str(self.test_dir.resolve()))
+
+
+class TestDefaultSocketPath(unittest.TestCase):
+    """Tests for the per-user daemon socket location."""
+
+    def test_default_socket_path(self):
+        custom = Path(tempfile.gettempdir()) / "custom.sock"
+        with patch.dict(os.environ, {SOCKET_ENV: str(custom)}):
+            self.assertEqual(default_socket_path(), custom)
+        with patch.dict(os.environ, {SOCKET_ENV: "", "XDG_RUNTIME_DIR": "/run/user/1000"}):
+            self.assertEqual(default_socket_path(), Path("/run/user/1000/dbt_helpers/daemon.sock"))
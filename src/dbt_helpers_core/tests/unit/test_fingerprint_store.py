@@ -0,0 +1,58 @@
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from dbt_helpers_core.fingerprint_store import FingerprintStore, fingerprint_entry
+from dbt_helpers_sdk import CatalogNamespace, CatalogRelation, DbtResourceIR
+
+
+def _relation(fingerprint: str | None) -> CatalogRelation:
+    return CatalogRelation(
+        namespace=CatalogNamespace(parts=["raw"]), name="users", kind="table", columns=[], fingerprint=fingerprint
+    )
+
+
+class TestFingerprintStore(unittest.TestCase):
+    """Tests for the FingerprintStore class."""
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.path = self.test_dir / ".dbt_helpers" / "fingerprints.json"
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_record_persists_per_workflow(self):
+        FingerprintStore(self.path).record({"sources": {"raw.users": ["abc", "raw.users"]}})
+
+        store = FingerprintStore(self.path)
+        self.assertTrue(store.is_unchanged("sources", _relation("abc"), {"raw.users"}))
+        self.assertFalse(store.is_unchanged("models", _relation("abc"), {"raw.users"}))
+
+    def test_changed_missing_or_unfingerprinted_relations_are_not_skipped(self):
+        store = FingerprintStore(self.path)
+        store.record({"sources": {"raw.users": ["abc", "raw.users"]}})
+
+        self.assertFalse(store.is_unchanged("sources", _relation("def"), {"raw.users"}))
+        self.assertFalse(store.is_unchanged("sources", _relation(None), {"raw.users"}))
+        # The resource was removed from the project since it was synced
+        self.assertFalse(store.is_unchanged("sources", _relation("abc"), set()))
+        self.assertEqual(
+            list(store.iter_changed("sources", [_relation("abc"), _relation("def")], {"raw.users"})),
+            [_relation("def")],
+        )
+
+    def test_corrupt_store_is_empty(self):
+        self.path.parent.mkdir(parents=True)
+        self.path.write_text("{not json")
+
+        store = FingerprintStore(self.path)
+        self.assertFalse(store.is_unchanged("sources", _relation("abc"), {"raw.users"}))
+
+    def test_fingerprint_entry(self):
+        resource = DbtResourceIR(
+            name="users", meta={"_extraction_metadata": {"relation_name": "raw.users", "fingerprint": "abc"}}
+        )
+        self.assertEqual(fingerprint_entry(resource, "raw.users"), {"raw.users": ["abc", "raw.users"]})
+        self.assertEqual(fingerprint_entry(DbtResourceIR(name="users"), "raw.users"), {})
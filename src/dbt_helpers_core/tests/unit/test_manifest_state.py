@@ -0,0 +1,130 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from dbt_helpers_core.manifest_state import iter_manifest_entries, load_manifest_state
+from dbt_helpers_core.state_builder import StateBuilder
+
+
+def _manifest() -> dict:
+    return {
+        "metadata": {"dbt_version": "1.9.0", "project_name": "shop"},
+        "nodes": {
+            "model.shop.stg_users": {
+                "resource_type": "model",
+                "package_name": "shop",
+                "name": "stg_users",
+                "original_file_path": "models/staging/stg_users.sql",
+                "patch_path": "shop://models/staging/stg_users.yml",
+            },
+            "test.shop.unique_stg_users_id": {
+                "resource_type": "test",
+                "package_name": "shop",
+                "name": "unique_stg_users_id",
+                "original_file_path": "models/staging/stg_users.yml",
+            },
+            "model.utils.calendar": {
+                "resource_type": "model",
+                "package_name": "utils",
+                "name": "calendar",
+                "original_file_path": "models/calendar.sql",
+            },
+        },
+        "sources": {
+            "source.shop.raw.users": {
+                "resource_type": "source",
+                "package_name": "shop",
+                "source_name": "raw",
+                "name": "users",
+                "original_file_path": "models/staging/sources.yml",
+            },
+        },
+        "macros": {f"macro.shop.m{i}": {"macro_sql": "{% macro m() %}select 1{% endmacro %}" * 20} for i in range(50)},
+        "parent_map": {"model.shop.stg_users": ["source.shop.raw.users"]},
+        "disabled": {},
+    }
+
+
+class TestManifestState(unittest.TestCase):
+    """Tests for hydrating the project state from a dbt manifest."""
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.test_dir)
+        staging_dir = self.test_dir / "models" / "staging"
+        staging_dir.mkdir(parents=True)
+        (staging_dir / "stg_users.sql").write_text("select 1")
+        (staging_dir / "stg_users.yml").write_text("models:\n  - name: stg_users\n")
+        (staging_dir / "sources.yml").write_text("sources:\n  - name: raw\n    tables:\n      - name: users\n")
+        self.manifest_path = self.test_dir / "target" / "manifest.json"
+        self.write_manifest(_manifest())
+
+    def write_manifest(self, manifest: dict):
+        self.manifest_path.parent.mkdir(exist_ok=True)
+        self.manifest_path.write_text(json.dumps(manifest), encoding="utf-8")
+        # The manifest was written after the project files it was parsed from
+        newest = max(path.stat().st_mtime_ns for path in (self.test_dir / "models").rglob("*.*"))
+        os.utime(self.manifest_path, ns=(newest + 1_000_000_000, newest + 1_000_000_000))
+
+    def test_iter_manifest_entries_streams_small_chunks(self):
+        """Entries are decoded the same whatever the read size."""
+        with patch("dbt_helpers_core.manifest_state._CHUNK_SIZE", 7):
+            entries = list(iter_manifest_entries(self.manifest_path))
+
+        self.assertEqual(
+            [(section, key) for section, key, _ in entries],
+            [
+                ("metadata", ""),
+                ("nodes", "model.shop.stg_users"),
+                ("nodes", "test.shop.unique_stg_users_id"),
+                ("nodes", "model.utils.calendar"),
+                ("sources", "source.shop.raw.users"),
+            ],
+        )
+        self.assertEqual(entries[4][2], _manifest()["sources"]["source.shop.raw.users"])
+
+    def test_load_manifest_state(self):
+        """Models and sources of the root project are read from the manifest."""
+        state = load_manifest_state(self.test_dir, self.manifest_path)
+
+        self.assertEqual(state, StateBuilder(self.test_dir).build_state())
+        self.assertEqual(state.models, {"stg_users": Path("models/staging/stg_users.sql")})
+        self.assertEqual(state.sources, {"raw.users": Path("models/staging/sources.yml")})
+
+    def test_load_manifest_state_stale(self):
+        """A manifest older than a referenced or new project file, or referencing a deleted file, is not used."""
+        newer = self.manifest_path.stat().st_mtime_ns + 1_000_000_000
+        yaml_path = self.test_dir / "models" / "staging" / "stg_users.yml"
+        os.utime(yaml_path, ns=(newer, newer))
+        self.assertIsNone(load_manifest_state(self.test_dir, self.manifest_path))
+
+        self.write_manifest(_manifest())
+        new_model = self.test_dir / "models" / "stg_orders.sql"
+        new_model.write_text("select 2")
+        newer = self.manifest_path.stat().st_mtime_ns + 1_000_000_000
+        os.utime(new_model, ns=(newer, newer))
+        self.assertIsNone(load_manifest_state(self.test_dir, self.manifest_path))
+
+        new_model.unlink()
+        self.write_manifest(_manifest())
+        yaml_path.unlink()
+        self.assertIsNone(load_manifest_state(self.test_dir, self.manifest_path))
+
+    def test_load_manifest_state_missing_or_invalid(self):
+        self.assertIsNone(load_manifest_state(self.test_dir, self.test_dir / "missing.json"))
+        self.manifest_path.write_text('{"metadata": {}, "nodes": {"model.x": ', encoding="utf-8")
+        self.assertIsNone(load_manifest_state(self.test_dir, self.manifest_path))
+
+    def test_state_builder_falls_back_to_the_scan(self):
+        builder = StateBuilder(self.test_dir, manifest_path=self.manifest_path)
+        builder.build_state()
+        self.assertEqual(builder.cache_stats, {"manifest": 2})
+
+        self.manifest_path.unlink()
+        state = builder.build_state()
+        self.assertEqual(builder.cache_stats, {"reparsed": 2, "cached": 0, "removed": 0})
+        self.assertEqual(state.sources, {"raw.users": Path("models/staging/sources.yml")})
@@ -2,10 +2,10 @@ import shutil
 import tempfile
 import unittest
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from dbt_helpers_core.orchestrator import Orchestrator
-from dbt_helpers_sdk import CatalogNamespace, CatalogRelation, CreateFile, Plan
+from dbt_helpers_sdk import CatalogNamespace, CatalogRelation, CreateFile, DbtResourceIR, PatchOp, Plan
 
 
 class MockWarehousePlugin:
@@ -42,6 +42,10 @@ class MockSchemaPlugin:  # pylint: disable=unused-argument
     def render_model_doc(self, resource, context=None):  # noqa: ARG002
         return "mock model doc"
 
+    def render_snapshot_sql(self, resource, config, database=None):  # noqa: ARG002
+        self.snapshot_configs = {**getattr(self, "snapshot_configs", {}), resource.name: config}
+        return "mock snapshot sql"
+
     def parse_source_yaml(self, content):  # noqa: ARG002
         return []
 
@@ -152,6 +156,155 @@ sources:
             self.assertEqual(yml_op.op_kind, "create_file")
             self.assertEqual(yml_op.content, "mock model yaml")
 
+    def test_orchestrator_scaffold_snapshots_uses_primary_keys(self):
+        """Test that snapshot unique keys come from catalog primary keys, defaulting to id."""
+        project_dir = self.test_dir / "snapshot_project"
+        project_dir.mkdir()
+        (project_dir / "dbt_helpers.yml").write_text("warehouse:\n  plugin: mock_wh\ntarget_version: fusion")
+
+        mock_wh = MagicMock()
+        mock_wh.read_catalog.return_value = [
+            CatalogRelation(
+                namespace=CatalogNamespace(parts=["raw"]), name=name, kind="table", columns=[], metadata=metadata
+            )
+            for name, metadata in [
+                ("users", {"primary_key": ["user_id"]}),
+                ("order_lines", {"primary_key": ["order_id", "line_no"]}),
+                ("events", {}),
+            ]
+        ]
+        mock_schema = MockSchemaPlugin()
+
+        with (
+            patch("dbt_helpers_core.orchestrator.get_warehouse_plugins", return_value={"mock_wh": mock_wh}),
+            patch("dbt_helpers_core.orchestrator.get_schema_plugins", return_value={"dbt": mock_schema}),
+        ):
+            Orchestrator(project_dir).scaffold_snapshots(["raw"])
+
+        unique_keys = {name: config["unique_key"] for name, config in mock_schema.snapshot_configs.items()}
+        self.assertEqual(
+            unique_keys, {"users": "user_id", "order_lines": ["order_id", "line_no"], "events": "id"}
+        )
+
+    def test_orchestrator_warehouse_connection_catalog_cache(self):
+        """The catalog cache directory is injected into the connection unless disabled."""
+        project_dir = self.test_dir / "cache_project"
+        project_dir.mkdir()
+        (project_dir / "dbt_helpers.yml").write_text(
+            "warehouse:\n  plugin: mock_wh\n  connection:\n    project: my-project\n"
+        )
+
+        connection = Orchestrator(project_dir).warehouse_connection
+        self.assertEqual(connection["project"], "my-project")
+        self.assertEqual(connection["catalog_cache_dir"], str(project_dir / ".dbt_helpers" / "cache"))
+
+        connection = Orchestrator(project_dir, use_catalog_cache=False).warehouse_connection
+        self.assertNotIn("catalog_cache_dir", connection)
+
+    def test_orchestrator_catalog_cache_stats(self):
+        """Cache statistics are read from the warehouse plugin used for the last read."""
+        project_dir = self.test_dir / "stats_project"
+        project_dir.mkdir()
+        (project_dir / "dbt_helpers.yml").write_text("warehouse:\n  plugin: mock_wh\n")
+        mock_wh = MockWarehousePlugin()
+        mock_wh.cache_stats = {"hits": 3, "misses": 1, "bytes_read": 10, "bytes_written": 5}
+
+        with patch("dbt_helpers_core.orchestrator.get_warehouse_plugins", return_value={"mock_wh": mock_wh}):
+            orchestrator = Orchestrator(project_dir)
+            self.assertIsNone(orchestrator.catalog_cache_stats)
+            orchestrator.get_warehouse_plugin()
+            self.assertEqual(orchestrator.catalog_cache_stats["hits"], 3)
+
+    def test_orchestrator_catalog_request_stats(self):
+        """Request statistics are read from the warehouse plugin and are None when unsupported."""
+        project_dir = self.test_dir / "request_stats_project"
+        project_dir.mkdir()
+        (project_dir / "dbt_helpers.yml").write_text("warehouse:\n  plugin: mock_wh\n")
+        mock_wh = MockWarehousePlugin()
+
+        with patch("dbt_helpers_core.orchestrator.get_warehouse_plugins", return_value={"mock_wh": mock_wh}):
+            orchestrator = Orchestrator(project_dir)
+            orchestrator.get_warehouse_plugin()
+            self.assertIsNone(orchestrator.catalog_request_stats)
+            mock_wh.request_stats = {"proj": {"requests": 4, "retries": 1}}
+            self.assertEqual(orchestrator.catalog_request_stats["proj"]["retries"], 1)
+
+    def test_orchestrator_catalog_file_stats(self):
+        """Per-file statistics are read from the warehouse plugin and are None when unsupported."""
+        project_dir = self.test_dir / "file_stats_project"
+        project_dir.mkdir()
+        (project_dir / "dbt_helpers.yml").write_text("warehouse:\n  plugin: mock_wh\n")
+        mock_wh = MockWarehousePlugin()
+
+        with patch("dbt_helpers_core.orchestrator.get_warehouse_plugins", return_value={"mock_wh": mock_wh}):
+            orchestrator = Orchestrator(project_dir)
+            orchestrator.get_warehouse_plugin()
+            self.assertIsNone(orchestrator.catalog_file_stats)
+            mock_wh.file_stats = {"sales.duckdb": {"seconds": 0.5, "relations": 3}}
+            self.assertEqual(orchestrator.catalog_file_stats["sales.duckdb"]["relations"], 3)
+
+    def test_orchestrator_releases_warehouse_connections(self):
+        """File locks are released after each catalog operation unless kept; other pooled resources stay open."""
+        project_dir = self.test_dir / "release_project"
+        project_dir.mkdir()
+        (project_dir / "dbt_helpers.yml").write_text("warehouse:\n  plugin: mock_wh\n")
+
+        for keep, expected_releases in ((False, 1), (True, 0)):
+            mock_wh = MockWarehousePlugin()
+            mock_wh.close = MagicMock()
+            mock_wh.release_file_locks = MagicMock()
+            plugins = {"mock_wh": mock_wh}
+            with (
+                patch("dbt_helpers_core.orchestrator.get_warehouse_plugins", return_value=plugins),
+                patch("dbt_helpers_core.orchestrator.get_schema_plugins", return_value={"dbt": MockSchemaPlugin()}),
+            ):
+                Orchestrator(project_dir, keep_warehouse_connections=keep).generate_source_plan(["raw"])
+            self.assertEqual(mock_wh.release_file_locks.call_count, expected_releases)
+            mock_wh.close.assert_not_called()
+
+    def test_orchestrator_sync_sources_changed_only(self):
+        """Test that changed_only skips relations whose fingerprint was recorded as in sync."""
+        project_dir = self.test_dir / "changed_only_project"
+        (project_dir / "models" / "raw").mkdir(parents=True)
+        (project_dir / "dbt_helpers.yml").write_text("warehouse:\n  plugin: mock_wh\n")
+        (project_dir / "models" / "raw" / "sources.yml").write_text(
+            "version: 2\nsources:\n  - name: raw\n    tables:\n      - name: users\n"
+        )
+        relation = CatalogRelation(
+            namespace=CatalogNamespace(parts=["raw"]), name="users", kind="table", columns=[], fingerprint="v1"
+        )
+        mock_wh = MagicMock()
+        mock_wh.read_catalog.return_value = [relation]
+        mock_schema = MagicMock()
+        mock_schema.parse_source_yaml.return_value = [DbtResourceIR(name="users")]
+        mock_schema.calculate_patch.return_value = []
+
+        def sync():
+            with (
+                patch("dbt_helpers_core.orchestrator.get_warehouse_plugins", return_value={"mock_wh": mock_wh}),
+                patch("dbt_helpers_core.orchestrator.get_schema_plugins", return_value={"dbt": mock_schema}),
+            ):
+                orchestrator = Orchestrator(project_dir, changed_only=True)
+                return orchestrator, orchestrator.sync_sources(["raw"])
+
+        # In sync: recorded right away, then skipped without parsing or diffing
+        _, plan = sync()
+        self.assertEqual((plan.ops, plan.fingerprints), ([], {}))
+        _, plan = sync()
+        self.assertEqual(plan.ops, [])
+        self.assertEqual(mock_schema.calculate_patch.call_count, 1)
+
+        # Changed: the fingerprint is recorded only when the plan is applied
+        relation.fingerprint = "v2"
+        mock_schema.calculate_patch.return_value = [PatchOp(op="delete_key", path=["sources", 0, "description"])]
+        _, plan = sync()
+        self.assertEqual(plan.fingerprints, {"sources": {"raw.users": ["v2", "raw.users"]}})
+        orchestrator, plan = sync()
+        self.assertEqual(mock_schema.calculate_patch.call_count, 3)
+        orchestrator.apply_plan(plan)
+        _, plan = sync()
+        self.assertEqual(mock_schema.calculate_patch.call_count, 3)
+
     def test_orchestrator_apply_plan(self):
         project_dir = self.test_dir / "apply_project"
         project_dir.mkdir()
@@ -0,0 +1,125 @@
+import importlib.metadata
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from dbt_helpers_core.plugin_cache import PluginCache, default_plugin_cache_path, distributions_fingerprint
+from dbt_helpers_core.plugin_discovery import WAREHOUSE_PLUGINS_GROUP, get_warehouse_plugins, invalidate_plugins
+
+GROUPS = ("dbt_helpers.warehouse_plugins", "dbt_helpers.schema_plugins")
+
+
+def _scan(**kwargs):
+    """Stand-in for importlib.metadata.entry_points with one warehouse and one schema plugin."""
+    entry_points = importlib.metadata.EntryPoints(
+        [
+            importlib.metadata.EntryPoint("duckdb", "dbt_helpers_wh_duckdb.plugin:Plugin", GROUPS[0]),
+            importlib.metadata.EntryPoint("dbt", "dbt_helpers_schema_dbt.adapter:Adapter", GROUPS[1]),
+        ]
+    )
+    return entry_points.select(**kwargs) if kwargs else entry_points
+
+
+class TestPluginCache(unittest.TestCase):
+    """Tests for the persistent plugin entry point cache."""
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.site_packages = self.test_dir / "site-packages"
+        (self.site_packages / "dbt_helpers_wh_duckdb-0.1.0.dist-info").mkdir(parents=True)
+        self.cache_path = self.test_dir / "cache" / "plugin_registry.json"
+        patcher = patch("sys.path", [str(self.site_packages)])
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_miss_scans_once_and_records_all_groups(self):
+        """A miss scans the metadata once for all groups and writes the cache file."""
+        with patch("importlib.metadata.entry_points", side_effect=_scan) as scan:
+            cache = PluginCache(self.cache_path, GROUPS)
+            warehouses = cache.entry_points(GROUPS[0])
+            schemas = cache.entry_points(GROUPS[1])
+
+        scan.assert_called_once_with()
+        self.assertFalse(cache.hit)
+        self.assertEqual(warehouses, list(_scan(group=GROUPS[0])))
+        self.assertEqual([ep.name for ep in schemas], ["dbt"])
+        self.assertEqual(json.loads(self.cache_path.read_text())["fingerprint"], distributions_fingerprint())
+
+    def test_hit_does_not_scan(self):
+        """While the installed distributions are unchanged, entry points come from the file."""
+        with patch("importlib.metadata.entry_points", side_effect=_scan):
+            PluginCache(self.cache_path, GROUPS).entry_points(GROUPS[0])
+
+        with patch("importlib.metadata.entry_points", side_effect=AssertionError("scanned")):
+            cache = PluginCache(self.cache_path, GROUPS)
+            warehouses = cache.entry_points(GROUPS[0])
+
+        self.assertTrue(cache.hit)
+        self.assertEqual(warehouses[0].value, "dbt_helpers_wh_duckdb.plugin:Plugin")
+
+    def test_installing_a_distribution_invalidates(self):
+        """A new, removed or rewritten *.dist-info directory changes the fingerprint."""
+        fingerprint = distributions_fingerprint()
+        (self.site_packages / "other-1.0.dist-info").mkdir()
+        self.assertNotEqual(distributions_fingerprint(), fingerprint)
+        (self.site_packages / "unrelated.py").touch()
+        fingerprint = distributions_fingerprint()
+        os.utime(self.site_packages / "other-1.0.dist-info", ns=(0, 0))
+        self.assertNotEqual(distributions_fingerprint(), fingerprint)
+
+        with patch("importlib.metadata.entry_points", side_effect=_scan):
+            PluginCache(self.cache_path, GROUPS).entry_points(GROUPS[0])
+        (self.site_packages / "dbt_helpers_wh_duckdb-0.1.0.dist-info").rename(
+            self.site_packages / "dbt_helpers_wh_duckdb-0.2.0.dist-info"
+        )
+        with patch("importlib.metadata.entry_points", side_effect=_scan) as scan:
+            cache = PluginCache(self.cache_path, GROUPS)
+            cache.entry_points(GROUPS[0])
+
+        self.assertFalse(cache.hit)
+        scan.assert_called_once()
+
+    def test_corrupt_or_unwritable_cache_falls_back_to_scan(self):
+        """A corrupt cache file is rescanned; an unwritable cache directory is not an error."""
+        self.cache_path.parent.mkdir(parents=True)
+        self.cache_path.write_text("{not json")
+        with patch("importlib.metadata.entry_points", side_effect=_scan):
+            cache = PluginCache(self.cache_path, GROUPS)
+            self.assertEqual([ep.name for ep in cache.entry_points(GROUPS[0])], ["duckdb"])
+
+        blocked = self.test_dir / "blocked"
+        blocked.write_text("a file, not a directory")
+        with patch("importlib.metadata.entry_points", side_effect=_scan):
+            cache = PluginCache(blocked / "plugin_registry.json", GROUPS)
+            self.assertEqual([ep.name for ep in cache.entry_points(GROUPS[1])], ["dbt"])
+
+    def test_discovery_uses_cache_under_user_cache_dir(self):
+        """Plugin discovery resolves names through the cache in $XDG_CACHE_HOME/dbt_helpers."""
+        invalidate_plugins()
+        self.addCleanup(invalidate_plugins)
+        env = {"XDG_CACHE_HOME": str(self.test_dir / "xdg")}
+        with patch.dict(os.environ, env), patch("importlib.metadata.entry_points", side_effect=_scan):
+            registry = get_warehouse_plugins()
+            cache_path = default_plugin_cache_path()
+
+        self.assertEqual(registry.group, WAREHOUSE_PLUGINS_GROUP)
+        self.assertEqual(list(registry), ["duckdb"])
+        self.assertEqual(list((self.test_dir / "xdg" / "dbt_helpers").iterdir()), [cache_path])
+
+    def test_default_path_is_per_environment(self):
+        """Each interpreter prefix (virtualenv) has its own cache file in the user cache directory."""
+        with patch.dict(os.environ, {"XDG_CACHE_HOME": str(self.test_dir)}):
+            current = default_plugin_cache_path()
+            with patch.object(sys, "prefix", str(self.test_dir / "other-venv")):
+                other = default_plugin_cache_path()
+
+        self.assertEqual((current.parent, other.parent), (self.test_dir / "dbt_helpers",) * 2)
+        self.assertNotEqual(current, other)
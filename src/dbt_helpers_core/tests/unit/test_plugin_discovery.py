@@ -0,0 +1,83 @@
+import os
+import unittest
+from unittest.mock import MagicMock, patch
+
+from dbt_helpers_core.plugin_cache import NO_PLUGIN_CACHE_ENV
+from dbt_helpers_core.plugin_discovery import (
+    WAREHOUSE_PLUGINS_GROUP,
+    PluginRegistry,
+    discover_plugins,
+    get_warehouse_plugins,
+    invalidate_plugins,
+)
+from dbt_helpers_sdk import CatalogClient
+
+
+class FakeWarehousePlugin(CatalogClient):
+    """Warehouse plugin registered through a fake entry point."""
+
+    def read_catalog(self, scope, connection_config):  # noqa: ARG002  # pylint: disable=unused-argument
+        return []
+
+
+def _entry_point(name, plugin_class):
+    entry_point = MagicMock()
+    entry_point.name = name
+    entry_point.load.return_value = plugin_class
+    return entry_point
+
+
+class TestPluginDiscovery(unittest.TestCase):
+    """Tests for lazy plugin discovery."""
+
+    def setUp(self):
+        self.fake = _entry_point("fake", FakeWarehousePlugin)
+        self.other = _entry_point("other", MagicMock(side_effect=ImportError("heavy SDK")))
+        self.not_a_plugin = _entry_point("not_a_plugin", object)
+        patcher = patch(
+            "importlib.metadata.entry_points", return_value=[self.fake, self.other, self.not_a_plugin]
+        )
+        self.entry_points = patcher.start()
+        self.addCleanup(patcher.stop)
+        # The fake entry points are not recorded in the persistent plugin cache
+        env_patcher = patch.dict(os.environ, {NO_PLUGIN_CACHE_ENV: "1"})
+        env_patcher.start()
+        self.addCleanup(env_patcher.stop)
+        invalidate_plugins()
+        self.addCleanup(invalidate_plugins)
+
+    def test_names_resolve_without_loading(self):
+        """Listing and membership do not import any plugin module."""
+        registry = PluginRegistry(WAREHOUSE_PLUGINS_GROUP, CatalogClient)
+
+        self.assertEqual(list(registry), ["fake", "other", "not_a_plugin"])
+        self.assertIn("fake", registry)
+        self.assertNotIn("missing", registry)
+        for entry_point in (self.fake, self.other, self.not_a_plugin):
+            entry_point.load.assert_not_called()
+
+    def test_only_selected_plugin_is_loaded_once(self):
+        """Accessing a plugin loads and instantiates it once; the others stay unloaded."""
+        registry = PluginRegistry(WAREHOUSE_PLUGINS_GROUP, CatalogClient)
+
+        plugin = registry["fake"]
+
+        self.assertIsInstance(plugin, FakeWarehousePlugin)
+        self.assertIs(registry["fake"], plugin)
+        self.fake.load.assert_called_once()
+        self.other.load.assert_not_called()
+        with self.assertRaises(KeyError):
+            registry["missing"]  # pylint: disable=pointless-statement
+        with self.assertRaises(TypeError):
+            registry["not_a_plugin"]  # pylint: disable=pointless-statement
+
+    def test_registry_is_shared_until_invalidated(self):
+        """The process-wide registry reuses instances until it is invalidated."""
+        plugin = get_warehouse_plugins()["fake"]
+        self.assertIs(discover_plugins(WAREHOUSE_PLUGINS_GROUP, CatalogClient)["fake"], plugin)
+        self.entry_points.assert_called_once()
+
+        invalidate_plugins(WAREHOUSE_PLUGINS_GROUP)
+
+        self.assertIsNot(get_warehouse_plugins()["fake"], plugin)
+        self.assertEqual(self.entry_points.call_count, 2)
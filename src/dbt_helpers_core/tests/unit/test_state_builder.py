@@ -1,7 +1,9 @@
+import os
 import shutil
 import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
 from dbt_helpers_core.state_builder import StateBuilder
 
@@ -60,3 +62,94 @@ sources:
 
         self.assertIn("stg_users", state.models)
         self.assertEqual(state.models["stg_users"], Path("models/staging/stg_users.sql"))
+
+    def _write_project(self):
+        models_dir = self.test_dir / "models"
+        models_dir.mkdir()
+        (models_dir / "sources.yml").write_text("sources:\n  - name: raw\n    tables:\n      - name: users\n")
+        (models_dir / "users.yml").write_text("models:\n  - name: users\n")
+        return models_dir
+
+    def test_state_builder_parse_cache(self):
+        """Unchanged YAML files are read from the parse cache; changed and deleted files are handled."""
+        models_dir = self._write_project()
+        cache_path = self.test_dir / ".dbt_helpers" / "state_cache.json"
+
+        builder = StateBuilder(self.test_dir, cache_path=cache_path)
+        first = builder.build_state()
+        self.assertEqual(builder.cache_stats, {"reparsed": 2, "cached": 0, "removed": 0})
+        self.assertTrue(cache_path.exists())
+
+        builder = StateBuilder(self.test_dir, cache_path=cache_path)
+        self.assertEqual(builder.build_state(), first)
+        self.assertEqual(builder.cache_stats, {"reparsed": 0, "cached": 2, "removed": 0})
+
+        (models_dir / "sources.yml").write_text("sources:\n  - name: raw\n    tables:\n      - name: orders\n")
+        (models_dir / "users.yml").unlink()
+        state = builder.build_state()
+        self.assertEqual(builder.cache_stats, {"reparsed": 1, "cached": 0, "removed": 1})
+        self.assertEqual(state.sources, {"raw.orders": Path("models/sources.yml")})
+        self.assertEqual(state.models, {})
+
+    def test_state_builder_parse_cache_hash_contents(self):
+        """With content hashes, a touched but unchanged file is not parsed again."""
+        models_dir = self._write_project()
+        cache_path = self.test_dir / ".dbt_helpers" / "state_cache.json"
+        builder = StateBuilder(self.test_dir, cache_path=cache_path, hash_contents=True)
+        builder.build_state()
+
+        stat = (models_dir / "users.yml").stat()
+        os.utime(models_dir / "users.yml", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        state = builder.build_state()
+
+        self.assertEqual(builder.cache_stats, {"reparsed": 0, "cached": 2, "removed": 0})
+        self.assertEqual(state.models, {"users": Path("models/users.yml")})
+        # The new mtime was recorded, so the next build trusts the file's stat again
+        self.assertIn(str(stat.st_mtime_ns + 1_000_000_000), cache_path.read_text(encoding="utf-8"))
+
+    def test_state_builder_sql_wins_over_yaml(self):
+        models_dir = self._write_project()
+        (models_dir / "staging").mkdir()
+        (models_dir / "staging" / "users.sql").write_text("select 1")
+        cache_path = self.test_dir / ".dbt_helpers" / "state_cache.json"
+
+        for _ in range(2):
+            state = StateBuilder(self.test_dir, cache_path=cache_path).build_state()
+            self.assertEqual(state.models["users"], Path("models/staging/users.sql"))
+
+    def test_state_builder_parallel_parse(self):
+        """Parsing in worker processes gives the serial result, including the precedence between files."""
+        models_dir = self._write_project()
+        (models_dir / "users.sql").write_text("select 1")
+        for i in range(6):
+            (models_dir / f"dup_{i}.yml").write_text(
+                f"models:\n  - name: shared\n  - name: only_{i}\n"
+                "sources:\n  - name: raw\n    tables:\n      - name: users\n"
+            )
+        (models_dir / "invalid.yml").write_text("models: [unclosed")
+
+        serial = StateBuilder(self.test_dir, processes=1).build_state()
+        builder = StateBuilder(self.test_dir, processes=2, parallel_threshold=1)
+        parallel = builder.build_state()
+
+        self.assertEqual(parallel, serial)
+        self.assertEqual(parallel.models["users"], Path("models/users.sql"))
+        self.assertEqual(builder.cache_stats, {"reparsed": 9, "cached": 0, "removed": 0})
+
+    def test_state_builder_rejects_invalid_processes(self):
+        with self.assertRaises(ValueError):
+            StateBuilder(self.test_dir, processes=0)
+
+    def test_state_builder_parses_serially_below_the_threshold(self):
+        """Worker processes default to the CPU count, but are only started for many files to parse."""
+        models_dir = self._write_project()
+        for i in range(3):
+            (models_dir / f"model_{i}.yml").write_text(f"models:\n  - name: model_{i}\n")
+        builder = StateBuilder(self.test_dir)
+        self.assertEqual(builder.processes, os.cpu_count() or 1)
+
+        with patch("dbt_helpers_core.state_builder.ProcessPoolExecutor") as executor:
+            state = builder.build_state()
+
+        executor.assert_not_called()
+        self.assertEqual(sorted(state.models), ["model_0", "model_1", "model_2", "users"])
@@ -1,6 +1,6 @@
 from .dbt_resource import DbtColumnIR, DbtResourceIR
-from .interfaces import CatalogClient, SchemaAdapter, ToolEmitter
-from .models import CatalogColumn, CatalogNamespace, CatalogRelation
+from .interfaces import CatalogClient, SchemaAdapter, StreamingCatalogClient, ToolEmitter, iter_catalog
+from .models import CatalogColumn, CatalogNamespace, CatalogRelation, schema_fingerprint
 from .plan import (
     AddDiagnostics,
     CreateFile,
@@ -25,6 +25,9 @@ __all__ = [
     "Plan",
     "PlannedOp",
     "SchemaAdapter",
+    "StreamingCatalogClient",
     "ToolEmitter",
     "UpdateYamlFile",
+    "iter_catalog",
+    "schema_fingerprint",
 ]
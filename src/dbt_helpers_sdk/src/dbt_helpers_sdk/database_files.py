@@ -0,0 +1,48 @@
+"""Helpers shared by the catalog clients of file-based databases (DuckDB, SQLite)."""
+
+from pathlib import Path
+from typing import Any
+
+
+def is_glob(path: str) -> bool:
+    """Whether a configured database path is a glob pattern rather than a file."""
+    return any(char in path for char in "*?[")
+
+
+def resolve_db_paths(connection_config: dict[str, Any], default_path: str) -> list[str]:
+    """Return the database files to read: `db_paths` (a list) or `db_path`, defaulting to the plugin's path.
+
+    Entries of `db_paths` may be glob patterns, expanded to the matching files in sorted order.
+    """
+    db_paths = connection_config.get("db_paths")
+    if db_paths is None:
+        return [str(connection_config.get("db_path", default_path))]
+    if isinstance(db_paths, str) or not db_paths:
+        raise ValueError("db_paths must be a non-empty list of database files or glob patterns")
+    resolved: list[str] = []
+    for path in map(str, db_paths):
+        resolved.extend(_expand_glob(path) if is_glob(path) else [path])
+    # A file matched by several patterns is read once
+    return list(dict.fromkeys(resolved))
+
+
+def _expand_glob(pattern: str) -> list[str]:
+    """Return the files matching a glob pattern, in the pattern's absolute or relative form, sorted."""
+    path = Path(pattern)
+    # Path.glob takes a pattern relative to the path it is called on
+    root = Path(path.anchor) if path.is_absolute() else Path()
+    return sorted(str(match) for match in root.glob(str(path.relative_to(root))))
+
+
+def attach_aliases(db_paths: list[str]) -> list[str]:
+    """Return the database name each file is attached under: its file stem."""
+    aliases = [Path(path).stem for path in db_paths]
+    duplicates = sorted({alias for alias in aliases if aliases.count(alias) > 1})
+    if duplicates:
+        raise ValueError(f"db_paths must have distinct file names; duplicated: {duplicates}")
+    return aliases
+
+
+def quote_identifier(value: str) -> str:
+    """Quote a SQL identifier with double quotes."""
+    return '"' + value.replace('"', '""') + '"'
@@ -1,3 +1,4 @@
+from collections.abc import Iterator
 from typing import Any, Protocol, runtime_checkable
 
 from .dbt_resource import DbtResourceIR
@@ -13,6 +14,23 @@ class CatalogClient(Protocol):
         """Read catalog metadata for the given scope."""
 
 
+@runtime_checkable
+class StreamingCatalogClient(CatalogClient, Protocol):
+    """Optional extension of CatalogClient that yields relations as they are read."""
+
+    def iter_catalog(self, scope: list[str], connection_config: dict[str, Any]) -> Iterator[CatalogRelation]:
+        """Yield catalog relations for the given scope in the same order as read_catalog."""
+
+
+def iter_catalog(
+    client: CatalogClient, scope: list[str], connection_config: dict[str, Any]
+) -> Iterator[CatalogRelation]:
+    """Stream relations from a client, falling back to read_catalog for non-streaming plugins."""
+    if isinstance(client, StreamingCatalogClient):
+        return client.iter_catalog(scope, connection_config)
+    return iter(client.read_catalog(scope, connection_config))
+
+
 @runtime_checkable
 class ToolEmitter(Protocol):
     """Protocol for generating a plan based on catalog metadata."""
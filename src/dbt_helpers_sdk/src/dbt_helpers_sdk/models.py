@@ -1,3 +1,5 @@
+import hashlib
+from collections.abc import Iterable
 from typing import Any
 
 from pydantic import BaseModel, Field
@@ -26,7 +28,17 @@ class CatalogRelation(BaseModel):
     columns: list[CatalogColumn]
     dbt_name: str | None = None
     metadata: dict[str, Any] = Field(default_factory=dict)
+    # Hash of the ordered column names and types (see schema_fingerprint); None if the plugin does not compute one
+    fingerprint: str | None = None
 
     @property
     def full_name(self) -> str:
         return f"{self.namespace}.{self.name}"
+
+
+def schema_fingerprint(columns: Iterable[CatalogColumn]) -> str:
+    """Return the md5 hex digest of `name:data_type` for each column, joined by commas in column order.
+
+    Plugins may compute the same digest in the warehouse (e.g. `md5(string_agg(...))`).
+    """
+    return hashlib.md5(",".join(f"{c.name}:{c.data_type}" for c in columns).encode(), usedforsecurity=False).hexdigest()
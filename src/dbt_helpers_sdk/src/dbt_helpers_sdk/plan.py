@@ -43,6 +43,9 @@ PlannedOp = CreateFile | UpdateYamlFile | DeleteFile | AddDiagnostics
 class Plan(BaseModel):
     """A collection of planned operations to be applied to a dbt project."""
     ops: list[PlannedOp] = Field(default_factory=list)
+    # Relation schema fingerprints to record once the plan is applied, per workflow
+    # ({workflow: {relation full name: [fingerprint, resource id]}})
+    fingerprints: dict[str, dict[str, list[str]]] = Field(default_factory=dict)
 
     def add_op(self, op: PlannedOp) -> None:
         self.ops.append(op)
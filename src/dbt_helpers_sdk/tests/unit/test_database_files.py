@@ -0,0 +1,52 @@
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from dbt_helpers_sdk.database_files import attach_aliases, quote_identifier, resolve_db_paths
+
+
+class TestDatabaseFiles(unittest.TestCase):
+    """Tests for the helpers of file-based database catalog clients."""
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.test_dir)
+
+    def test_resolve_db_paths(self):
+        self.assertEqual(resolve_db_paths({}, ":memory:"), [":memory:"])
+        self.assertEqual(resolve_db_paths({"db_path": "a.duckdb"}, ":memory:"), ["a.duckdb"])
+        self.assertEqual(resolve_db_paths({"db_paths": ["a.duckdb", "b.duckdb"]}, ":memory:"), ["a.duckdb", "b.duckdb"])
+        with self.assertRaises(ValueError):
+            resolve_db_paths({"db_paths": "a.duckdb"}, ":memory:")
+        with self.assertRaises(ValueError):
+            resolve_db_paths({"db_paths": []}, ":memory:")
+
+    def test_resolve_db_paths_expands_globs(self):
+        for name in ("b", "a", "c"):
+            (self.test_dir / f"{name}.duckdb").touch()
+        pattern = str(self.test_dir / "[ab].duckdb")
+        extra = str(self.test_dir / "c.duckdb")
+
+        resolved = resolve_db_paths({"db_paths": [pattern, extra, str(self.test_dir / "a.duckdb")]}, ":memory:")
+
+        self.assertEqual(resolved, [str(self.test_dir / f"{name}.duckdb") for name in ("a", "b", "c")])
+        self.assertEqual(resolve_db_paths({"db_paths": [str(self.test_dir / "*.db")]}, ":memory:"), [])
+
+        # A relative pattern matches relative to the working directory and yields relative paths
+        self.addCleanup(os.chdir, Path.cwd())
+        os.chdir(self.test_dir.parent)
+        relative = f"{self.test_dir.name}/[bc].duckdb"
+        self.assertEqual(
+            resolve_db_paths({"db_paths": [relative]}, ":memory:"),
+            [f"{self.test_dir.name}/b.duckdb", f"{self.test_dir.name}/c.duckdb"],
+        )
+
+    def test_attach_aliases_must_be_distinct(self):
+        self.assertEqual(attach_aliases(["x/sales.duckdb", "y/marketing.db"]), ["sales", "marketing"])
+        with self.assertRaises(ValueError):
+            attach_aliases(["x/sales.duckdb", "y/sales.sqlite"])
+
+    def test_quote_identifier(self):
+        self.assertEqual(quote_identifier('my "db"'), '"my ""db"""')
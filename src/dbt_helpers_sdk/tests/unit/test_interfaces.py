@@ -0,0 +1,48 @@
+import unittest
+from collections.abc import Iterator
+
+from dbt_helpers_sdk.interfaces import StreamingCatalogClient, iter_catalog
+from dbt_helpers_sdk.models import CatalogNamespace, CatalogRelation
+
+
+def _relation(name: str) -> CatalogRelation:
+    return CatalogRelation(namespace=CatalogNamespace(parts=["db"]), name=name, kind="table", columns=[])
+
+
+class ListOnlyClient:
+    def __init__(self):
+        self.calls = 0
+
+    def read_catalog(self, scope, connection_config):  # noqa: ARG002  # pylint: disable=unused-argument
+        self.calls += 1
+        return [_relation(name) for name in scope]
+
+
+class StreamingClient(ListOnlyClient):
+    def __init__(self):
+        super().__init__()
+        self.yielded: list[str] = []
+
+    def iter_catalog(self, scope, connection_config):  # noqa: ARG002  # pylint: disable=unused-argument
+        for name in scope:
+            self.yielded.append(name)
+            yield _relation(name)
+
+
+class TestIterCatalog(unittest.TestCase):
+    """Tests for the iter_catalog streaming adapter."""
+
+    def test_streaming_client_is_consumed_lazily(self):
+        client = StreamingClient()
+        self.assertIsInstance(client, StreamingCatalogClient)
+        relations = iter_catalog(client, ["a", "b"], {})
+        self.assertIsInstance(relations, Iterator)
+        self.assertEqual(next(relations).name, "a")
+        self.assertEqual(client.yielded, ["a"])
+        self.assertEqual(client.calls, 0)
+
+    def test_falls_back_to_read_catalog(self):
+        client = ListOnlyClient()
+        self.assertNotIsInstance(client, StreamingCatalogClient)
+        self.assertEqual([r.name for r in iter_catalog(client, ["a", "b"], {})], ["a", "b"])
+        self.assertEqual(client.calls, 1)
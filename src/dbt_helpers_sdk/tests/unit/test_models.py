@@ -1,7 +1,7 @@
 import unittest
 
 from dbt_helpers_sdk.dbt_resource import DbtColumnIR, DbtResourceIR
-from dbt_helpers_sdk.models import CatalogColumn, CatalogNamespace, CatalogRelation
+from dbt_helpers_sdk.models import CatalogColumn, CatalogNamespace, CatalogRelation, schema_fingerprint
 
 
 class TestModels(unittest.TestCase):
@@ -16,6 +16,14 @@ class TestModels(unittest.TestCase):
         relation = CatalogRelation(namespace=namespace, name="my_table", kind="table", columns=[])
         self.assertEqual(relation.full_name, "project.dataset.my_table")
 
+    def test_schema_fingerprint(self):
+        columns = [CatalogColumn(name="id", data_type="INTEGER"), CatalogColumn(name="name", data_type="VARCHAR")]
+        fingerprint = schema_fingerprint(columns)
+        self.assertEqual(fingerprint, "754902d6abcb037fc2c699881d29f0af")
+        self.assertNotEqual(schema_fingerprint(reversed(columns)), fingerprint)
+        retyped = [columns[0], CatalogColumn(name="name", data_type="TEXT")]
+        self.assertNotEqual(schema_fingerprint(retyped), fingerprint)
+
     def test_catalog_column_defaults(self):
         column = CatalogColumn(name="id", data_type="INTEGER")
         self.assertTrue(column.nullable)
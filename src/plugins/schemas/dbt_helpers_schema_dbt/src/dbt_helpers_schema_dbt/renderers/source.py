@@ -42,11 +42,9 @@ class SourceRenderer(BaseRenderer):
         for source in data["sources"]:
             source_name = source["name"]
             for table in source.get("tables", []):
-                # Normalization: Look in both config and top-level
+                # Normalization: Look in both config and top-level (e.g. dbt-duckdb's external_location)
                 config = table.get("config", {})
-                meta = table.get("meta", {})
-                if not meta:
-                    meta = config.get("meta", {})
+                meta = {**config.get("meta", {}), **table.get("meta", {})}
 
                 # Flatten 'labels' if it exists in meta
                 if "labels" in meta:
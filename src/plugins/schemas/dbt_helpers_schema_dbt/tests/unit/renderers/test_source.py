@@ -58,6 +58,24 @@ class TestSourceRenderer(unittest.TestCase):
         self.assertIn("database", data["sources"][0])
         self.assertIn("var(", data["sources"][0]["database"])
 
+    def test_render_source_yaml_external_location(self):
+        """external_location is rendered in the table-level meta, where dbt-duckdb reads it, not as a label."""
+        location = "read_parquet('/data/raw/orders/**/*.parquet', union_by_name = true)"
+        resource = DbtResourceIR(
+            name="orders",
+            meta={"external_location": location, "owner": "alice"},
+            columns=[DbtColumnIR(name="id")],
+        )
+
+        yaml_content = self.renderer.render_yaml([resource], target_version="dbt")
+        table = yaml.safe_load(yaml_content)["sources"][0]["tables"][0]
+
+        self.assertEqual(table["meta"], {"external_location": location})
+        self.assertEqual(table["config"]["meta"]["labels"], {"owner": "alice"})
+        # Both parse back into the resource's meta
+        parsed = self.renderer.parse_yaml(yaml_content)[0]
+        self.assertEqual((parsed.meta["external_location"], parsed.meta["owner"]), (location, "alice"))
+
     def test_render_source_yaml_multiple_tables(self):
         """Multiple resources produce multiple table entries under one source."""
         resources = [
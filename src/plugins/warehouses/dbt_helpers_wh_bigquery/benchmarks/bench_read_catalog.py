@@ -0,0 +1,82 @@
+"""Benchmark read_catalog latency against a local stand-in endpoint for several worker counts.
+
+Tables are synthetic flat tables by default, or replayed from a fixture written by
+`record_fixture.py` or `synthetic.py` with --fixture. The stand-in server runs in a
+child process unless --in-process is given. --memory reports the peak Python heap
+allocated while reading (tracemalloc; slows the run down).
+
+Usage:
+    uv run python benchmarks/bench_read_catalog.py --tables 300 --latency-ms 20 --workers 1 4 16
+    uv run python benchmarks/bench_read_catalog.py --fixture fixtures/synthetic_10k.json.gz --workers 8 32 --memory
+"""
+
+import argparse
+import time
+import tracemalloc
+from pathlib import Path
+
+from fixtures import load_fixture
+from stand_in_server import StandInProcess, StandInServer
+from synthetic import synthetic_table
+
+from dbt_helpers_wh_bigquery.plugin import BigQueryWarehousePlugin
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--project", default="bench")
+    parser.add_argument("--datasets", type=int, default=2)
+    parser.add_argument("--tables", type=int, default=200, help="Tables per dataset")
+    parser.add_argument("--columns", type=int, default=20, help="Columns per table")
+    parser.add_argument("--fixture", type=Path, help="Replay tables from a fixture instead of generating them")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="Injected latency per request")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Extra uniform random latency per request")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32])
+    parser.add_argument("--memory", action="store_true", help="Report peak traced memory per run")
+    parser.add_argument("--in-process", action="store_true", help="Serve from a thread in the benchmark process")
+    args = parser.parse_args()
+
+    if args.fixture:
+        tables = load_fixture(args.fixture)
+    else:
+        tables = {
+            (args.project, f"dataset_{d}"): [
+                synthetic_table(args.project, f"dataset_{d}", f"table_{t:05d}", args.columns)
+                for t in range(args.tables)
+            ]
+            for d in range(args.datasets)
+        }
+    server_cls = StandInServer if args.in_process else StandInProcess
+    server = server_cls(tables, latency_s=args.latency_ms / 1000, jitter_s=args.jitter_ms / 1000)
+    scope = [f"{project}.{dataset}" for project, dataset in server.tables]
+    n_tables = sum(len(resources) for resources in server.tables.values())
+    plugin = BigQueryWarehousePlugin()
+
+    with server:
+        print(f"{len(scope)} datasets, {n_tables} tables, {args.latency_ms:.0f}+{args.jitter_ms:.0f} ms per request")
+        print(f"{'workers':>8} {'seconds':>9} {'tables/s':>9} {'speedup':>8} {'first(s)':>9} {'peak MiB':>9}")
+        baseline = None
+        for workers in args.workers:
+            connection_config = {"project": args.project, "api_endpoint": server.api_endpoint, "max_workers": workers}
+            if args.memory:
+                tracemalloc.start()
+            start = time.perf_counter()
+            first = None
+            count = 0
+            for _ in plugin.iter_catalog(scope, connection_config):
+                first = first or time.perf_counter() - start
+                count += 1
+            elapsed = time.perf_counter() - start
+            peak = "-"
+            if args.memory:
+                peak = f"{tracemalloc.get_traced_memory()[1] / 2**20:.1f}"
+                tracemalloc.stop()
+            baseline = baseline or elapsed
+            print(
+                f"{workers:>8} {elapsed:>9.2f} {count / elapsed:>9.1f} {baseline / elapsed:>7.1f}x "
+                f"{first or 0:>9.2f} {peak:>9}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Micro-benchmark schema-to-column mapping on a synthetic very wide nested schema.
+
+The schema has --fields leaf fields: top-level RECORDs that repeat the same
+sub-struct, nested --depth levels deep. Compares the previous recursive mapping
+(kept here as a reference) with SchemaMapper in nested and flattened mode.
+
+Usage:
+    uv run python benchmarks/bench_schema_mapping.py --fields 10000 --depth 3
+    uv run python benchmarks/bench_schema_mapping.py --fields 10000 --depth 6 --repeat 10
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+from typing import Any
+
+from google.cloud.bigquery.schema import SchemaField
+
+from dbt_helpers_wh_bigquery.schema_mapping import _FIELD_TYPE_TO_SQL, SchemaMapper
+
+
+def _reference_sql_type(field: Any) -> str:
+    """The recursive mapping SchemaMapper replaced (parameterized types omitted)."""
+    base_type = _FIELD_TYPE_TO_SQL.get(field.field_type, field.field_type)
+    if base_type == "STRUCT":
+        inner = ", ".join(f"{f.name} {_reference_sql_type(f)}" for f in field.fields)
+        base_type = f"STRUCT<{inner}>"
+    return f"ARRAY<{base_type}>" if field.mode == "REPEATED" else base_type
+
+
+def wide_schema(n_fields: int, depth: int, leaves_per_struct: int = 50) -> list[SchemaField]:
+    """Build a schema of ~n_fields leaves from repeated identical sub-structs."""
+
+    def struct(name: str, level: int) -> dict[str, Any]:
+        if level == 0:
+            fields = [{"name": f"leaf_{i}", "type": "STRING", "mode": "NULLABLE"} for i in range(leaves_per_struct)]
+        else:
+            fields = [struct(f"{name}_{i}", level - 1) for i in range(2)]
+        return {"name": name, "type": "RECORD", "mode": "NULLABLE", "fields": fields}
+
+    leaves_per_top = leaves_per_struct * 2 ** (depth - 1)
+    n_top = max(1, n_fields // leaves_per_top)
+    return [SchemaField.from_api_repr(struct(f"event_{i}", depth - 1)) for i in range(n_top)]
+
+
+def _time(fn: Callable[[], Any], repeat: int) -> tuple[float, Any]:
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fields", type=int, default=10_000, help="Approximate number of leaf fields")
+    parser.add_argument("--depth", type=int, default=3, help="STRUCT nesting depth")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    schema = wide_schema(args.fields, args.depth)
+    runs = {
+        "recursive (reference)": lambda: [_reference_sql_type(f) for f in schema],
+        "SchemaMapper nested": lambda: SchemaMapper().columns(schema),
+        "SchemaMapper flattened": lambda: SchemaMapper(flatten=True).columns(schema),
+    }
+    print(f"{len(schema)} top-level fields, ~{args.fields} leaves, depth {args.depth}")
+    for name, fn in runs.items():
+        seconds, result = _time(fn, args.repeat)
+        print(f"{name:>24}: {seconds * 1000:8.1f} ms  ({len(result)} columns)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""Compressed catalog fixtures replayed by the stand-in server.
+
+A fixture is gzip-compressed JSON holding `tables.get` resources per dataset:
+
+    {"version": 1, "datasets": [{"project": ..., "dataset": ..., "tables": [<table resource>, ...]}]}
+
+Fixtures are written by `record_fixture.py` (from a real project) or
+`synthetic.py` (generated), and loaded with `load_fixture` into the
+`{(project, dataset): [table resources]}` mapping that `StandInServer` serves.
+"""
+
+import gzip
+import json
+from pathlib import Path
+from typing import Any
+
+FIXTURE_VERSION = 1
+
+Tables = dict[tuple[str, str], list[dict[str, Any]]]
+
+
+def save_fixture(path: Path, tables: Tables) -> int:
+    """Write tables to a gzip JSON fixture and return the compressed size in bytes."""
+    payload = {
+        "version": FIXTURE_VERSION,
+        "datasets": [
+            {"project": project, "dataset": dataset, "tables": resources}
+            for (project, dataset), resources in tables.items()
+        ],
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        json.dump(payload, f, separators=(",", ":"))
+    return path.stat().st_size
+
+
+def load_fixture(path: Path) -> Tables:
+    """Read a fixture written by save_fixture."""
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        payload = json.load(f)
+    if payload.get("version") != FIXTURE_VERSION:
+        raise ValueError(f"Unsupported fixture version {payload.get('version')!r} in {path}")
+    return {(entry["project"], entry["dataset"]): entry["tables"] for entry in payload["datasets"]}
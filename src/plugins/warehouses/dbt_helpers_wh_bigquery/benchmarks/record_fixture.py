@@ -0,0 +1,80 @@
+"""Record list_tables/get_table responses from a real BigQuery project into a fixture.
+
+The fixture can then be replayed offline with `bench_read_catalog.py --fixture`.
+Scope items use the plugin's syntax, including globs (e.g. `my-project.raw_*`).
+
+Usage:
+    uv run python benchmarks/record_fixture.py --project my-project raw_* staging --out fixtures/prod.json.gz
+"""
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from fixtures import Tables, save_fixture
+from google.cloud import bigquery
+
+from dbt_helpers_wh_bigquery.client_pool import ClientPool
+from dbt_helpers_wh_bigquery.scope import TableFilter, expand_scope, parse_scope_pattern
+
+# Descriptive fields dropped with --redact; schemas, partitioning and clustering are kept
+_REDACTED_TABLE_KEYS = ("description", "labels", "friendlyName")
+
+
+def _redact(resource: dict[str, Any]) -> dict[str, Any]:
+    for key in _REDACTED_TABLE_KEYS:
+        resource.pop(key, None)
+    pending = list(resource.get("schema", {}).get("fields", []))
+    while pending:
+        field = pending.pop()
+        field.pop("description", None)
+        field.pop("policyTags", None)
+        pending.extend(field.get("fields", []))
+    return resource
+
+
+def record(client: bigquery.Client, scope: list[str], project: str | None, max_workers: int, redact: bool) -> Tables:
+    """Fetch table resources for the scope, keeping listing order within each dataset."""
+    patterns = [parse_scope_pattern(item, project) for item in scope]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        selections = expand_scope(patterns, lambda p: [d.dataset_id for d in client.list_datasets(p)], executor)
+
+        def fetch(reference: Any) -> dict[str, Any]:
+            resource = client.get_table(reference).to_api_repr()
+            return _redact(resource) if redact else resource
+
+        tables: Tables = {}
+        for selection in selections:
+            items = client.list_tables(bigquery.DatasetReference(selection.project, selection.dataset))
+            references = [item.reference for item in items if TableFilter().selects(selection, item.table_id)]
+            tables[(selection.project, selection.dataset)] = list(executor.map(fetch, references))
+            print(f"{selection.project}.{selection.dataset}: {len(references)} tables")
+    return tables
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("scope", nargs="+", help="Scope items (dataset, project.dataset, globs)")
+    parser.add_argument("--project", help="Default project for scope items without one")
+    parser.add_argument("--keyfile", help="Service account keyfile (default: application default credentials)")
+    parser.add_argument("--impersonate-service-account")
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--redact", action="store_true", help="Drop descriptions, labels and policy tags")
+    parser.add_argument("--out", type=Path, required=True, help="Fixture path (gzip JSON)")
+    args = parser.parse_args()
+
+    connection_config = {
+        "project": args.project,
+        "keyfile": args.keyfile,
+        "impersonate_service_account": args.impersonate_service_account,
+    }
+    client = ClientPool().get_client(connection_config, pool_size=args.workers)
+    tables = record(client, args.scope, args.project, args.workers, args.redact)
+    size = save_fixture(args.out, tables)
+    n_tables = sum(len(resources) for resources in tables.values())
+    print(f"Recorded {n_tables} tables in {len(tables)} datasets to {args.out} ({size / 1024:.0f} KiB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""Local stand-in for the BigQuery REST metadata endpoints used by the plugin.
+
+Serves `datasets.list`, `tables.list` and `tables.get` from in-memory table
+resources (synthetic, or replayed from a recorded fixture) with injected
+per-request latency, so read_catalog can be exercised through `api_endpoint`
+without network access or an emulator container.
+"""
+
+import json
+import multiprocessing
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qs, urlparse
+
+from fixtures import Tables, load_fixture
+
+_DATASETS_PATH = re.compile(r"^/bigquery/v2/projects/([^/]+)/datasets$")
+_TABLES_PATH = re.compile(r"^/bigquery/v2/projects/([^/]+)/datasets/([^/]+)/tables(?:/([^/]+))?$")
+
+
+class StandInServer:
+    """Threaded HTTP server answering BigQuery metadata requests from memory.
+
+    Each request sleeps `latency_s` plus a uniform random `0..jitter_s` before answering.
+    """
+
+    def __init__(
+        self,
+        tables: Tables,
+        latency_s: float = 0.0,
+        page_size: int = 1000,
+        jitter_s: float = 0.0,
+        seed: int = 0,
+    ):
+        self.tables = tables
+        self.latency_s = latency_s
+        self.jitter_s = jitter_s
+        self.page_size = page_size
+        self.request_count = 0
+        self._by_id = {key: {t["tableReference"]["tableId"]: t for t in resources} for key, resources in tables.items()}
+        self._rng = random.Random(seed)  # noqa: S311  # nosec B311
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    @classmethod
+    def from_fixture(cls, path: Path, **kwargs: Any) -> "StandInServer":
+        """Serve the tables of a recorded or synthetic fixture."""
+        return cls(load_fixture(path), **kwargs)
+
+    @property
+    def api_endpoint(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    def __enter__(self) -> "StandInServer":
+        """Start serving in a background thread."""
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Stop serving and close the socket."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def handle(self, path: str) -> tuple[int, dict[str, Any]]:
+        """Resolve a request path to a status code and JSON body."""
+        with self._lock:
+            self.request_count += 1
+            delay = self.latency_s + (self._rng.uniform(0, self.jitter_s) if self.jitter_s else 0.0)
+        if delay:
+            time.sleep(delay)
+
+        parsed = urlparse(path)
+        query = parse_qs(parsed.query)
+        datasets_match = _DATASETS_PATH.match(parsed.path)
+        if datasets_match:
+            project_id = datasets_match.group(1)
+            dataset_ids = [dataset for project, dataset in self.tables if project == project_id]
+            return 200, {
+                "kind": "bigquery#datasetList",
+                "datasets": [
+                    {"kind": "bigquery#dataset", "datasetReference": {"projectId": project_id, "datasetId": d}}
+                    for d in dataset_ids
+                ],
+            }
+
+        match = _TABLES_PATH.match(parsed.path)
+        if not match:
+            return 404, {"error": {"code": 404, "message": f"Not found: {parsed.path}"}}
+        project_id, dataset_id, table_id = match.groups()
+        tables = self.tables.get((project_id, dataset_id))
+        if tables is None:
+            return 404, {"error": {"code": 404, "message": f"Not found: Dataset {project_id}:{dataset_id}"}}
+
+        if table_id:
+            table = self._by_id[(project_id, dataset_id)].get(table_id)
+            if table is None:
+                return 404, {"error": {"code": 404, "message": f"Not found: Table {table_id}"}}
+            return 200, table
+
+        start = int(query.get("pageToken", ["0"])[0])
+        page = tables[start : start + self.page_size]
+        body: dict[str, Any] = {
+            "kind": "bigquery#tableList",
+            "totalItems": len(tables),
+            "tables": [
+                {"kind": "bigquery#table", "tableReference": t["tableReference"], "type": t.get("type", "TABLE")}
+                for t in page
+            ],
+        }
+        if start + self.page_size < len(tables):
+            body["nextPageToken"] = str(start + self.page_size)
+        return 200, body
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_GET(self) -> None:  # noqa: N802
+                status, body = server.handle(self.path)
+                payload = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format: str, *args: Any) -> None:  # noqa: ARG002  # pylint: disable=redefined-builtin
+                return
+
+        return Handler
+
+
+def _serve(tables: Tables, kwargs: dict[str, Any], endpoint: Any, stop: Any) -> None:
+    with StandInServer(tables, **kwargs) as server:
+        endpoint.put(server.api_endpoint)
+        stop.wait()
+
+
+class StandInProcess:
+    """Runs a StandInServer in a child process so serving does not compete with the client for the GIL."""
+
+    def __init__(self, tables: Tables, **kwargs: Any):
+        self.tables = tables
+        context = multiprocessing.get_context("spawn")
+        self._endpoint = context.Queue()
+        self._stop = context.Event()
+        self._process = context.Process(target=_serve, args=(tables, kwargs, self._endpoint, self._stop), daemon=True)
+        self.api_endpoint = ""
+
+    def __enter__(self) -> "StandInProcess":
+        """Start the server process and wait for its endpoint."""
+        self._process.start()
+        self.api_endpoint = self._endpoint.get(timeout=60)
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Stop the server process."""
+        self._stop.set()
+        self._process.join(timeout=10)
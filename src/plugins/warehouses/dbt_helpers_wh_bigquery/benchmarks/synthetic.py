@@ -0,0 +1,126 @@
+"""Synthetic BigQuery catalogs for offline benchmarks.
+
+`synthetic_catalog` generates a deterministic mix of table shapes:
+
+- narrow tables with 5-30 flat columns of varied (including parameterized) types,
+- wide tables with 200-1000 columns,
+- nested tables with STRUCT/ARRAY<STRUCT> fields up to `max_depth` levels deep,
+- a share of views, and time partitioning and clustering on some tables.
+
+Run as a script to write a fixture for `bench_read_catalog.py --fixture`:
+
+    uv run python benchmarks/synthetic.py --tables 10000 --out fixtures/synthetic_10k.json.gz
+"""
+
+import argparse
+import random
+from pathlib import Path
+from typing import Any
+
+from fixtures import Tables, save_fixture
+
+_SCALAR_TYPES = ("STRING", "INTEGER", "FLOAT", "BOOLEAN", "TIMESTAMP", "DATE", "BYTES", "NUMERIC", "JSON", "GEOGRAPHY")
+
+
+def synthetic_table(project_id: str, dataset_id: str, table_id: str, n_columns: int = 10) -> dict[str, Any]:
+    """Build a `tables.get` resource with a flat schema of `n_columns` fields."""
+    return {
+        "kind": "bigquery#table",
+        "tableReference": {"projectId": project_id, "datasetId": dataset_id, "tableId": table_id},
+        "type": "TABLE",
+        "schema": {"fields": [{"name": f"col_{i}", "type": "STRING", "mode": "NULLABLE"} for i in range(n_columns)]},
+    }
+
+
+def _scalar_field(rng: random.Random, name: str) -> dict[str, Any]:
+    field: dict[str, Any] = {
+        "name": name,
+        "type": rng.choice(_SCALAR_TYPES),
+        "mode": rng.choice(("NULLABLE", "REQUIRED")),
+    }
+    if field["type"] == "STRING" and rng.random() < 0.2:
+        field["maxLength"] = str(rng.choice((16, 64, 255)))
+    elif field["type"] == "NUMERIC" and rng.random() < 0.5:
+        field["precision"], field["scale"] = "18", "4"
+    if rng.random() < 0.3:
+        field["description"] = f"Synthetic column {name}"
+    return field
+
+
+def _nested_field(rng: random.Random, name: str, depth: int, max_depth: int) -> dict[str, Any]:
+    if depth >= max_depth or rng.random() < 0.4:
+        return _scalar_field(rng, name)
+    return {
+        "name": name,
+        "type": "RECORD",
+        "mode": rng.choice(("NULLABLE", "REPEATED")),
+        "fields": [_nested_field(rng, f"{name}_{i}", depth + 1, max_depth) for i in range(rng.randint(2, 6))],
+    }
+
+
+def synthetic_resource(
+    rng: random.Random, project_id: str, dataset_id: str, table_id: str, max_depth: int = 4
+) -> dict[str, Any]:
+    """Build one `tables.get` resource with a randomly chosen shape."""
+    shape = rng.random()
+    if shape < 0.70:
+        fields = [_scalar_field(rng, f"col_{i}") for i in range(rng.randint(5, 30))]
+    elif shape < 0.85:
+        fields = [_scalar_field(rng, f"col_{i}") for i in range(rng.randint(200, 1000))]
+    else:
+        fields = [_scalar_field(rng, "id")]
+        fields += [_nested_field(rng, f"rec_{i}", 0, max_depth) for i in range(rng.randint(3, 12))]
+
+    resource: dict[str, Any] = {
+        "kind": "bigquery#table",
+        "tableReference": {"projectId": project_id, "datasetId": dataset_id, "tableId": table_id},
+        "type": "VIEW" if rng.random() < 0.05 else "TABLE",
+        "schema": {"fields": fields},
+        "lastModifiedTime": str(1_700_000_000_000 + rng.randint(0, 10**10)),
+    }
+    if rng.random() < 0.5:
+        resource["description"] = f"Synthetic table {dataset_id}.{table_id}"
+    if rng.random() < 0.2:
+        resource["labels"] = {"team": rng.choice(("data", "growth", "finance")), "tier": "bronze"}
+    if resource["type"] == "TABLE" and rng.random() < 0.3:
+        resource["timePartitioning"] = {"type": "DAY"}
+        resource["clustering"] = {"fields": [fields[0]["name"]]}
+    return resource
+
+
+def synthetic_catalog(
+    project_id: str = "bench",
+    n_tables: int = 10_000,
+    n_datasets: int = 20,
+    max_depth: int = 4,
+    seed: int = 0,
+) -> Tables:
+    """Generate n_tables resources spread evenly over n_datasets, reproducibly for a seed."""
+    rng = random.Random(seed)  # noqa: S311  # nosec B311
+    tables: Tables = {}
+    for t in range(n_tables):
+        dataset_id = f"dataset_{t % n_datasets:03d}"
+        table_id = f"table_{t // n_datasets:05d}"
+        tables.setdefault((project_id, dataset_id), []).append(
+            synthetic_resource(rng, project_id, dataset_id, table_id, max_depth)
+        )
+    return tables
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--project", default="bench")
+    parser.add_argument("--tables", type=int, default=10_000)
+    parser.add_argument("--datasets", type=int, default=20)
+    parser.add_argument("--max-depth", type=int, default=4, help="Maximum STRUCT nesting depth")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", type=Path, required=True, help="Fixture path (gzip JSON)")
+    args = parser.parse_args()
+
+    tables = synthetic_catalog(args.project, args.tables, args.datasets, args.max_depth, args.seed)
+    size = save_fixture(args.out, tables)
+    print(f"Wrote {args.tables} tables in {len(tables)} datasets to {args.out} ({size / 1024:.0f} KiB)")
+
+
+if __name__ == "__main__":
+    main()
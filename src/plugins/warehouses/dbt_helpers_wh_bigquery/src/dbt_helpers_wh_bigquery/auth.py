@@ -1,13 +1,140 @@
 """Authentication utilities for BigQuery, including Service Account Impersonation."""
 
+import datetime
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
 from typing import Any
 
+import google.auth.transport.requests
 from google.auth import default
 from google.auth.impersonated_credentials import Credentials as ImpersonatedCredentials
 from google.oauth2 import service_account
 
 _BQ_SCOPES = ["https://www.googleapis.com/auth/cloud-platform"]
 _DEFAULT_LIFETIME = 3600
+_DEFAULT_TOKEN_CACHE_SKEW = 300
+_TOKEN_CACHE_KEY_ENV = "DBT_HELPERS_TOKEN_CACHE_KEY"  # noqa: S105  # nosec B105
+
+
+def _utcnow() -> datetime.datetime:
+    # google-auth compares naive UTC datetimes for token expiry
+    return datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+
+
+def _default_token_cache_dir() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "dbt_helpers" / "tokens"
+
+
+def _source_principal(creds: Any, config: dict[str, Any]) -> str:
+    """Identify the principal behind source credentials for use in a cache key."""
+    for attr in ("service_account_email", "signer_email", "account"):
+        value = getattr(creds, attr, None)
+        if isinstance(value, str) and value:
+            return value
+    refresh_token = getattr(creds, "refresh_token", None)
+    if isinstance(refresh_token, str) and refresh_token:
+        return "refresh_token:" + hashlib.sha256(refresh_token.encode("utf-8")).hexdigest()[:16]
+    return str(config.get("keyfile") or "application-default")
+
+
+class TokenCache:
+    """Encrypted on-disk cache of impersonated access tokens.
+
+    Entries are keyed by source principal, target principal and scopes, and are
+    Fernet-encrypted with the given key, which comes from `DBT_HELPERS_TOKEN_CACHE_KEY`
+    so that it is never stored next to the entries it protects.
+    A cached token is only used while it is valid for at least `skew_seconds` more,
+    both by its expiry and by the configured impersonation lifetime.
+    """
+
+    def __init__(self, cache_dir: Path, key: bytes, skew_seconds: int = _DEFAULT_TOKEN_CACHE_SKEW):
+        try:
+            from cryptography.fernet import Fernet  # pylint: disable=import-outside-toplevel
+        except ImportError as e:
+            raise ImportError(
+                "The impersonation token cache requires 'cryptography'. "
+                "Install it with: pip install 'dbt-helpers-wh-bigquery[token-cache]'"
+            ) from e
+        self.cache_dir = cache_dir
+        self.skew = datetime.timedelta(seconds=skew_seconds)
+        try:
+            self._fernet = Fernet(key)
+        except ValueError as e:
+            raise ValueError(
+                f"{_TOKEN_CACHE_KEY_ENV} must be a Fernet key (32 url-safe base64-encoded bytes), "
+                "e.g. from `python -c 'from cryptography.fernet import Fernet; print(Fernet.generate_key().decode())'`"
+            ) from e
+
+    @staticmethod
+    def cache_key(source_principal: str, target_principal: str, scopes: list[str]) -> str:
+        payload = json.dumps([source_principal, target_principal, sorted(scopes)])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.token"
+
+    def load(self, key: str, lifetime: int) -> tuple[str, datetime.datetime] | None:
+        """Return (token, expiry) if a cached token is still usable, else None."""
+        from cryptography.fernet import InvalidToken  # pylint: disable=import-outside-toplevel
+
+        path = self._path(key)
+        if not path.exists():
+            return None
+        try:
+            entry = json.loads(self._fernet.decrypt(path.read_bytes()))
+            expiry = datetime.datetime.fromisoformat(entry["expiry"])
+            issued_at = datetime.datetime.fromisoformat(entry["issued_at"])
+        except (OSError, ValueError, KeyError, InvalidToken):
+            return None
+        usable_until = min(expiry, issued_at + datetime.timedelta(seconds=lifetime))
+        if _utcnow() + self.skew >= usable_until:
+            return None
+        return entry["token"], expiry
+
+    def store(self, key: str, token: str, expiry: datetime.datetime) -> None:
+        """Encrypt and write a token atomically with owner-only permissions."""
+        self.cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        entry = {"token": token, "expiry": expiry.isoformat(), "issued_at": _utcnow().isoformat()}
+        path = self._path(key)
+        # A unique temporary name keeps concurrent writers of the same entry apart
+        fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, prefix=f".{key}.", suffix=".tmp")
+        tmp_path = Path(tmp_name)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(self._fernet.encrypt(json.dumps(entry).encode("utf-8")))
+            tmp_path.replace(path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+
+def _apply_token_cache(creds: Any, source_creds: Any, config: dict[str, Any], lifetime: int) -> None:
+    """Seed impersonated credentials from the token cache, or refresh and store a new token.
+
+    Without a key in `DBT_HELPERS_TOKEN_CACHE_KEY` the cache is not used, as if it were disabled.
+    """
+    env_key = os.environ.get(_TOKEN_CACHE_KEY_ENV)
+    if not env_key:
+        return
+    cache_dir = config.get("token_cache_dir")
+    cache = TokenCache(
+        Path(cache_dir) if cache_dir else _default_token_cache_dir(),
+        env_key.encode("utf-8"),
+        skew_seconds=config.get("token_cache_skew_seconds", _DEFAULT_TOKEN_CACHE_SKEW),
+    )
+    key = TokenCache.cache_key(
+        _source_principal(source_creds, config), config["impersonate_service_account"], _BQ_SCOPES
+    )
+    cached = cache.load(key, lifetime)
+    if cached:
+        creds.token, creds.expiry = cached
+        return
+    creds.refresh(google.auth.transport.requests.Request())
+    if creds.token and creds.expiry:
+        cache.store(key, creds.token, creds.expiry)
 
 
 def get_credentials(config: dict[str, Any]) -> Any:
@@ -22,6 +149,11 @@ def get_credentials(config: dict[str, Any]) -> Any:
         config: Connection configuration. May include:
             - keyfile: Path to service account JSON keyfile
             - impersonate_service_account: Email of target SA to impersonate
+            - impersonation_lifetime: Lifetime in seconds of impersonated tokens
+            - token_cache: Cache impersonated tokens on disk across invocations, encrypted with
+              the key in DBT_HELPERS_TOKEN_CACHE_KEY (without it, tokens are not cached)
+            - token_cache_dir: Directory for the token cache (defaults to the user cache dir)
+            - token_cache_skew_seconds: Minimum remaining validity for a cached token
 
     Returns:
         google.auth.Credentials suitable for BigQuery client.
@@ -36,10 +168,14 @@ def get_credentials(config: dict[str, Any]) -> Any:
         creds, _ = default(scopes=_BQ_SCOPES)
 
     if config.get("impersonate_service_account"):
+        source_creds = creds
+        lifetime = config.get("impersonation_lifetime", _DEFAULT_LIFETIME)
         creds = ImpersonatedCredentials(
-            source_credentials=creds,
+            source_credentials=source_creds,
             target_principal=config["impersonate_service_account"],
             target_scopes=_BQ_SCOPES,
-            lifetime=config.get("impersonation_lifetime", _DEFAULT_LIFETIME),
+            lifetime=lifetime,
         )
+        if config.get("token_cache"):
+            _apply_token_cache(creds, source_creds, config, lifetime)
     return creds
@@ -0,0 +1,108 @@
+"""Persistent, change-aware cache of mapped BigQuery catalog relations.
+
+Each dataset is stored as one JSON file holding, per table, the mapped
+CatalogRelation and the table's `last_modified_time` (epoch milliseconds) at the
+time it was fetched. A cached relation is reused only while the table's current
+`last_modified_time` matches, so `get_table` runs only for new or modified tables.
+"""
+
+import json
+from pathlib import Path
+from typing import Any
+
+from dbt_helpers_sdk import CatalogRelation
+
+# Bump when the mapping in plugin.py changes so stale entries are discarded
+CACHE_VERSION = 2
+
+_LAST_MODIFIED_SQL = "SELECT table_id, last_modified_time FROM {qualifier}.__TABLES__"
+
+
+def last_modified_ms(table: Any) -> int | None:
+    """Return a Table's modification time in epoch milliseconds."""
+    modified = getattr(table, "modified", None)
+    return round(modified.timestamp() * 1000) if modified else None
+
+
+def read_last_modified(client: Any, qualifier: str, location: str | None = None) -> dict[str, int]:
+    """Return {table_id: last_modified_time} for a dataset with one `__TABLES__` query."""
+    rows = client.query(_LAST_MODIFIED_SQL.format(qualifier=qualifier), location=location).result()
+    return {row["table_id"]: int(row["last_modified_time"]) for row in rows}
+
+
+class DatasetCache:
+    """Cached relations of one dataset, loaded from and saved to a JSON file."""
+
+    def __init__(self, path: Path, stats: dict[str, int]):
+        self.path = path
+        self.stats = stats
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            raw = self.path.read_bytes()
+            data = json.loads(raw)
+        except (OSError, ValueError):
+            # A corrupt or unreadable cache file is treated as empty
+            return
+        self.stats["bytes_read"] += len(raw)
+        if data.get("version") == CACHE_VERSION:
+            self._entries = data.get("tables", {})
+
+    def get(self, table_id: str, last_modified: int | None) -> CatalogRelation | None:
+        """Return the cached relation if the table has not changed since it was cached."""
+        entry = self._entries.get(table_id)
+        if entry is None or last_modified is None or entry["last_modified_time"] != last_modified:
+            self.stats["misses"] += 1
+            return None
+        self.stats["hits"] += 1
+        return CatalogRelation.model_validate(entry["relation"])
+
+    def put(self, table_id: str, last_modified: int | None, relation: CatalogRelation) -> None:
+        if last_modified is None:
+            return
+        self._entries[table_id] = {
+            "last_modified_time": last_modified,
+            "relation": relation.model_dump(mode="json"),
+        }
+        self._dirty = True
+
+    def retain(self, table_ids: set[str]) -> None:
+        """Drop entries for tables that no longer exist."""
+        stale = set(self._entries) - table_ids
+        for table_id in stale:
+            del self._entries[table_id]
+        self._dirty = self._dirty or bool(stale)
+
+    def save(self) -> None:
+        """Write the cache file atomically if anything changed."""
+        if not self._dirty:
+            return
+        payload = json.dumps({"version": CACHE_VERSION, "tables": self._entries}, sort_keys=True).encode("utf-8")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp_path.write_bytes(payload)
+        tmp_path.replace(self.path)
+        self.stats["bytes_written"] += len(payload)
+        self._dirty = False
+
+
+class CatalogCache:
+    """Directory of per-dataset caches with aggregated hit/miss/byte statistics.
+
+    A variant (e.g. a non-default column mode) keeps its own files, so relations
+    mapped with different settings never replace each other.
+    """
+
+    def __init__(self, cache_dir: Path, variant: str | None = None):
+        self.cache_dir = cache_dir
+        self.variant = variant
+        self.stats = {"hits": 0, "misses": 0, "bytes_read": 0, "bytes_written": 0}
+
+    def dataset(self, project_id: str, dataset_id: str) -> DatasetCache:
+        suffix = f".{self.variant}.json" if self.variant else ".json"
+        return DatasetCache(self.cache_dir / "bigquery" / project_id / f"{dataset_id}{suffix}", self.stats)
@@ -0,0 +1,95 @@
+"""Reusable BigQuery clients and credentials for repeated catalog reads in one process."""
+
+import json
+import threading
+from typing import Any
+
+from google.api_core.client_options import ClientOptions
+from google.auth.credentials import AnonymousCredentials
+from google.auth.transport.requests import AuthorizedSession
+from google.cloud import bigquery
+from requests.adapters import HTTPAdapter
+
+from .auth import get_credentials
+
+# Connection keys that affect how credentials are resolved
+_CREDENTIAL_KEYS = (
+    "api_endpoint",
+    "keyfile",
+    "impersonate_service_account",
+    "impersonation_lifetime",
+    "token_cache",
+    "token_cache_dir",
+)
+# Connection keys that affect the client itself (credentials, project, endpoint, pool size)
+_CLIENT_KEYS = (*_CREDENTIAL_KEYS, "project")
+
+
+def _config_key(connection_config: dict[str, Any], keys: tuple[str, ...], *extra: Any) -> str:
+    return json.dumps([[k, connection_config.get(k)] for k in keys] + list(extra), default=str)
+
+
+class ClientPool:
+    """Thread-safe pool of BigQuery clients keyed by connection config.
+
+    Credentials are resolved once per authentication config and shared between
+    clients; google-auth refreshes expired tokens lazily on the next request. Each
+    client gets its own authorized HTTP session whose connection pool is sized to
+    the fetch concurrency, so concurrent metadata requests reuse connections.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._credentials: dict[str, Any] = {}
+        self._clients: dict[str, bigquery.Client] = {}
+        self._sessions: list[AuthorizedSession] = []
+
+    def get_client(self, connection_config: dict[str, Any], pool_size: int) -> bigquery.Client:
+        """Return a client for the connection config, creating it on first use."""
+        client_key = _config_key(connection_config, _CLIENT_KEYS, pool_size)
+        with self._lock:
+            client = self._clients.get(client_key)
+            if client is None:
+                client = self._create_client(connection_config, pool_size)
+                self._clients[client_key] = client
+            return client
+
+    def _get_credentials(self, connection_config: dict[str, Any]) -> Any:
+        credential_key = _config_key(connection_config, _CREDENTIAL_KEYS)
+        creds = self._credentials.get(credential_key)
+        if creds is None:
+            # Use AnonymousCredentials when api_endpoint is set (emulator/testing)
+            if connection_config.get("api_endpoint"):
+                creds = AnonymousCredentials()
+            else:
+                creds = get_credentials(connection_config)
+            self._credentials[credential_key] = creds
+        return creds
+
+    def _create_client(self, connection_config: dict[str, Any], pool_size: int) -> bigquery.Client:
+        creds = self._get_credentials(connection_config)
+        session = AuthorizedSession(creds)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        self._sessions.append(session)
+
+        client_options = None
+        if connection_config.get("api_endpoint"):
+            client_options = ClientOptions(api_endpoint=connection_config["api_endpoint"])
+
+        return bigquery.Client(
+            project=connection_config.get("project"),
+            credentials=creds,
+            client_options=client_options,
+            _http=session,
+        )
+
+    def close(self) -> None:
+        """Close all pooled HTTP sessions and forget cached clients and credentials."""
+        with self._lock:
+            for session in self._sessions:
+                session.close()
+            self._sessions.clear()
+            self._clients.clear()
+            self._credentials.clear()
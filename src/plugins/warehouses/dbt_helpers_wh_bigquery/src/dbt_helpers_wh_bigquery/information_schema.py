@@ -0,0 +1,361 @@
+"""Bulk catalog reads from BigQuery INFORMATION_SCHEMA views.
+
+Instead of one `tables.get` request per table, a dataset is described by three
+queries (TABLES, COLUMNS joined with COLUMN_FIELD_PATHS, and TABLE_OPTIONS) whose
+rows are assembled into CatalogRelations in memory. The assembled relations match
+what the `tables.get` code path in `plugin.py` produces for the same tables.
+
+The same queries can also target a region-qualified INFORMATION_SCHEMA
+(`project`.`region-us`) filtered to a set of datasets, so many datasets in one
+project and location are read with three jobs in total.
+"""
+
+import re
+from collections.abc import Iterable
+from typing import Any
+
+from google.cloud import bigquery
+
+from dbt_helpers_sdk import CatalogColumn, CatalogNamespace, CatalogRelation, schema_fingerprint
+
+_TABLES_SQL = """
+SELECT table_schema, table_name, table_type, ddl
+FROM {qualifier}.INFORMATION_SCHEMA.TABLES
+WHERE {dataset_filter}
+ORDER BY table_schema, table_name
+"""
+
+_COLUMNS_SQL = """
+SELECT
+  c.table_schema,
+  c.table_name,
+  c.column_name,
+  c.ordinal_position,
+  c.is_nullable,
+  c.data_type,
+  c.clustering_ordinal_position,
+  p.description,
+  p.policy_tags
+FROM {qualifier}.INFORMATION_SCHEMA.COLUMNS AS c
+LEFT JOIN {qualifier}.INFORMATION_SCHEMA.COLUMN_FIELD_PATHS AS p
+  ON p.table_schema = c.table_schema
+  AND p.table_name = c.table_name
+  AND p.column_name = c.column_name
+  AND p.field_path = c.column_name
+WHERE {dataset_filter}
+ORDER BY c.table_schema, c.table_name, c.ordinal_position
+"""
+
+_TABLE_OPTIONS_SQL = """
+SELECT table_schema, table_name, option_name, option_value
+FROM {qualifier}.INFORMATION_SCHEMA.TABLE_OPTIONS
+WHERE option_name IN ('description', 'labels', 'partition_expiration_days')
+  AND {dataset_filter}
+"""
+
+_MS_PER_DAY = 24 * 60 * 60 * 1000
+
+# DDL clauses emitted by BigQuery start at column 0, column definitions are indented;
+# the table clauses follow the line closing the column list
+_COLUMN_LIST_END = re.compile(r"^\)", re.MULTILINE)
+_PARTITION_BY = re.compile(r"^PARTITION BY\s+(.+?)\s*$", re.MULTILINE)
+_RANGE_BUCKET = re.compile(
+    r"^RANGE_BUCKET\(\s*`?(\w+)`?\s*,\s*GENERATE_ARRAY\(\s*(-?\d+)\s*,\s*(-?\d+)\s*,\s*(-?\d+)\s*\)\s*\)$",
+    re.IGNORECASE,
+)
+_TIME_UNIT_FUNCTION = re.compile(r"^\w+\(\s*`?(\w+)`?", re.IGNORECASE)
+_BARE_COLUMN = re.compile(r"^`?(\w+)`?$")
+_PSEUDO_COLUMNS = frozenset({"_PARTITIONDATE", "_PARTITIONTIME"})
+
+_STRING_LITERAL = r'"((?:[^"\\]|\\.)*)"'
+_LABEL_ENTRY = re.compile(rf"STRUCT\(\s*{_STRING_LITERAL}\s*,\s*{_STRING_LITERAL}\s*\)")
+_ESCAPES = {"n": "\n", "r": "\r", "t": "\t"}
+
+
+def quote_identifier(*parts: str) -> str:
+    """Quote a (possibly multi-part) identifier for use in a FROM clause."""
+    for part in parts:
+        if not part or "`" in part or "\n" in part:
+            raise ValueError(f"Invalid BigQuery identifier part: {part!r}")
+    return ".".join(f"`{part}`" for part in parts)
+
+
+def region_qualifier(location: str) -> str:
+    """Return the INFORMATION_SCHEMA region qualifier for a dataset location (e.g. 'US' -> 'region-us')."""
+    return f"region-{location.lower()}"
+
+
+def normalize_type(type_str: str) -> str:
+    """Normalize an INFORMATION_SCHEMA data_type into the `_map_to_sql_type` format.
+
+    Drops nested field modifiers (`NOT NULL`, `OPTIONS(...)`, `DEFAULT ...`), strips
+    backquotes from field names and normalizes whitespace, e.g.
+    `STRUCT<a INT64 NOT NULL, b ARRAY<STRING>>` -> `STRUCT<a INT64, b ARRAY<STRING>>`.
+    """
+    parser = _TypeParser(type_str)
+    result = parser.parse_type()
+    parser.skip_ws()
+    if not parser.at_end():
+        raise ValueError(f"Unexpected trailing characters in type: {type_str!r}")
+    return result
+
+
+class _TypeParser:
+    """Minimal recursive-descent parser for BigQuery SQL type strings."""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.pos = 0
+
+    def at_end(self) -> bool:
+        return self.pos >= len(self.text)
+
+    def peek(self) -> str:
+        return self.text[self.pos] if self.pos < len(self.text) else ""
+
+    def skip_ws(self) -> None:
+        while self.peek().isspace():
+            self.pos += 1
+
+    def expect(self, char: str) -> None:
+        self.skip_ws()
+        if self.peek() != char:
+            raise ValueError(f"Expected {char!r} at position {self.pos} in type: {self.text!r}")
+        self.pos += 1
+
+    def identifier(self) -> str:
+        self.skip_ws()
+        if self.peek() == "`":
+            end = self.text.index("`", self.pos + 1)
+            name = self.text[self.pos + 1 : end]
+            self.pos = end + 1
+            return name
+        start = self.pos
+        while self.peek().isalnum() or self.peek() == "_":
+            self.pos += 1
+        if start == self.pos:
+            raise ValueError(f"Expected identifier at position {self.pos} in type: {self.text!r}")
+        return self.text[start : self.pos]
+
+    def parse_type(self) -> str:
+        base = self.identifier().upper()
+        self.skip_ws()
+        if self.peek() == "(":
+            self.pos += 1
+            end = self.text.index(")", self.pos)
+            params = [p.strip() for p in self.text[self.pos : end].split(",")]
+            self.pos = end + 1
+            base = f"{base}({', '.join(params)})"
+            self.skip_ws()
+        if self.peek() != "<":
+            return base
+
+        self.pos += 1
+        if base == "STRUCT":
+            fields: list[str] = []
+            self.skip_ws()
+            while self.peek() != ">":
+                name = self.identifier()
+                field_type = self.parse_type()
+                self._skip_field_modifiers()
+                fields.append(f"{name} {field_type}")
+                self.skip_ws()
+                if self.peek() == ",":
+                    self.pos += 1
+                    self.skip_ws()
+            self.expect(">")
+            return f"STRUCT<{', '.join(fields)}>"
+
+        inner = self.parse_type()
+        self.expect(">")
+        return f"{base}<{inner}>"
+
+    def _skip_field_modifiers(self) -> None:
+        """Skip everything up to the next top-level ',' or '>' (quote and paren aware)."""
+        depth = 0
+        quote = ""
+        while not self.at_end():
+            char = self.peek()
+            if quote:
+                if char == "\\":
+                    self.pos += 1
+                elif char == quote:
+                    quote = ""
+            elif char in ("'", '"'):
+                quote = char
+            elif char == "(":
+                depth += 1
+            elif char == ")":
+                depth -= 1
+            elif char in (",", ">") and depth == 0:
+                return
+            self.pos += 1
+
+
+def _unescape(value: str) -> str:
+    return re.sub(r"\\(.)", lambda m: _ESCAPES.get(m.group(1), m.group(1)), value)
+
+
+def parse_string_option(option_value: str | None) -> str | None:
+    r"""Parse a TABLE_OPTIONS string literal (e.g. `"my \"table\""`) into its value."""
+    if not option_value:
+        return None
+    match = re.fullmatch(_STRING_LITERAL, option_value.strip(), re.DOTALL)
+    return _unescape(match.group(1)) if match else option_value
+
+
+def parse_labels_option(option_value: str | None) -> dict[str, str]:
+    """Parse a TABLE_OPTIONS labels value (`[STRUCT("k", "v"), ...]`) into a dict."""
+    if not option_value:
+        return {}
+    return {_unescape(k): _unescape(v) for k, v in _LABEL_ENTRY.findall(option_value)}
+
+
+def parse_partitioning(ddl: str | None, expiration_days: str | None = None) -> dict[str, Any] | None:
+    """Derive the `_extract_partitioning` dict from a base table's DDL and expiration option.
+
+    Only the clauses after the column list are searched, never a query body.
+    """
+    column_list_end = _COLUMN_LIST_END.search(ddl or "")
+    match = _PARTITION_BY.search(ddl, column_list_end.end()) if ddl and column_list_end else None
+    if not match:
+        return None
+    expr = match.group(1)
+
+    range_match = _RANGE_BUCKET.match(expr)
+    if range_match:
+        field, start, end, interval = range_match.groups()
+        return {
+            "type": "range",
+            "field": field,
+            "range": {"start": int(start), "end": int(end), "interval": int(interval)},
+        }
+
+    column_match = _TIME_UNIT_FUNCTION.match(expr) or _BARE_COLUMN.match(expr)
+    field = column_match.group(1) if column_match else None
+    if field and field.upper() in _PSEUDO_COLUMNS:
+        field = None
+    expiration_ms = round(float(expiration_days) * _MS_PER_DAY) if expiration_days else None
+    return {"type": "time", "field": field, "expiration_ms": expiration_ms}
+
+
+def _table_key(row: Any) -> tuple[str, str]:
+    return row["table_schema"], row["table_name"]
+
+
+def _map_column(row: Any) -> CatalogColumn:
+    data_type = normalize_type(row["data_type"])
+    metadata: dict[str, Any] = {}
+    if row["policy_tags"]:
+        metadata["policy_tags"] = list(row["policy_tags"])
+    # REPEATED fields are reported as NOT NULL but are nullable in SchemaField terms
+    required = row["is_nullable"] == "NO" and not data_type.startswith("ARRAY<")
+    return CatalogColumn(
+        name=row["column_name"],
+        data_type=data_type,
+        description=row["description"] or None,
+        nullable=not required,
+        metadata=metadata,
+    )
+
+
+def assemble_relations(
+    project_id: str,
+    table_rows: Iterable[Any],
+    column_rows: Iterable[Any],
+    option_rows: Iterable[Any],
+) -> list[CatalogRelation]:
+    """Assemble CatalogRelations from INFORMATION_SCHEMA rows, in table row order."""
+    columns: dict[tuple[str, str], list[CatalogColumn]] = {}
+    clustering: dict[tuple[str, str], list[tuple[int, str]]] = {}
+    for row in column_rows:
+        key = _table_key(row)
+        columns.setdefault(key, []).append(_map_column(row))
+        if row["clustering_ordinal_position"] is not None:
+            clustering.setdefault(key, []).append((row["clustering_ordinal_position"], row["column_name"]))
+
+    options: dict[tuple[str, str], dict[str, str]] = {}
+    for row in option_rows:
+        options.setdefault(_table_key(row), {})[row["option_name"]] = row["option_value"]
+
+    relations = []
+    for row in table_rows:
+        key = _table_key(row)
+        dataset_id, table_id = key
+        table_options = options.get(key, {})
+
+        metadata: dict[str, Any] = {
+            "description": parse_string_option(table_options.get("description")),
+        }
+        labels = parse_labels_option(table_options.get("labels"))
+        if labels:
+            metadata["labels"] = labels
+
+        table_type = str(row["table_type"]).upper()
+        # The DDL of views holds their query, where a window clause can start a line with PARTITION BY
+        partitioning = (
+            parse_partitioning(row["ddl"], table_options.get("partition_expiration_days"))
+            if table_type == "BASE TABLE"
+            else None
+        )
+        if partitioning:
+            metadata["partitioning"] = partitioning
+
+        if key in clustering:
+            metadata["clustering"] = [name for _, name in sorted(clustering[key])]
+
+        table_columns = columns.get(key, [])
+        relations.append(
+            CatalogRelation(
+                namespace=CatalogNamespace(parts=[project_id, dataset_id]),
+                name=table_id,
+                kind="view" if table_type == "VIEW" else "table",
+                columns=table_columns,
+                dbt_name=f"{project_id}__{dataset_id}__{table_id}",
+                metadata=metadata,
+                # Hashed over the normalized types so it matches the `tables.get` path
+                fingerprint=schema_fingerprint(table_columns),
+            )
+        )
+    return relations
+
+
+def _run_queries(
+    client: Any,
+    project_id: str,
+    qualifier: str,
+    location: str | None,
+    dataset_ids: list[str] | None,
+) -> list[CatalogRelation]:
+    job_config = None
+    dataset_filter = "TRUE"
+    if dataset_ids is not None:
+        job_config = bigquery.QueryJobConfig(
+            query_parameters=[bigquery.ArrayQueryParameter("datasets", "STRING", dataset_ids)]
+        )
+        dataset_filter = "{alias}table_schema IN UNNEST(@datasets)"
+
+    def run(sql: str, alias: str = "") -> list[Any]:
+        query = sql.format(qualifier=qualifier, dataset_filter=dataset_filter.format(alias=alias))
+        return list(client.query(query, job_config=job_config, location=location).result())
+
+    return assemble_relations(project_id, run(_TABLES_SQL), run(_COLUMNS_SQL, alias="c."), run(_TABLE_OPTIONS_SQL))
+
+
+def read_dataset(client: Any, project_id: str, dataset_id: str, location: str | None = None) -> list[CatalogRelation]:
+    """Read all relations in a dataset with a fixed number of INFORMATION_SCHEMA queries."""
+    return _run_queries(client, project_id, quote_identifier(project_id, dataset_id), location, None)
+
+
+def read_region(
+    client: Any, project_id: str, location: str, dataset_ids: list[str]
+) -> dict[str, list[CatalogRelation]]:
+    """Read several datasets of one project and location with region-qualified queries.
+
+    Returns relations grouped per dataset; datasets without tables map to an empty list.
+    """
+    qualifier = quote_identifier(project_id, region_qualifier(location))
+    by_dataset: dict[str, list[CatalogRelation]] = {dataset_id: [] for dataset_id in dataset_ids}
+    for relation in _run_queries(client, project_id, qualifier, location, dataset_ids):
+        by_dataset.setdefault(relation.namespace.parts[1], []).append(relation)
+    return by_dataset
@@ -1,9 +1,12 @@
 """BigQuery warehouse plugin implementing CatalogClient."""
 
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
 from typing import Any
 
-from google.api_core.client_options import ClientOptions
-from google.auth.credentials import AnonymousCredentials
+from google.api_core.exceptions import GoogleAPIError
 from google.cloud import bigquery
 
 from dbt_helpers_sdk import (
@@ -11,82 +14,48 @@ from dbt_helpers_sdk import (
     CatalogColumn,
     CatalogNamespace,
     CatalogRelation,
+    schema_fingerprint,
 )
 
-from .auth import get_credentials
+from . import information_schema
+from .catalog_cache import CatalogCache, last_modified_ms, read_last_modified
+from .client_pool import ClientPool
+from .rate_limit import RequestScheduler, settings_for_project
+from .schema_mapping import SchemaMapper, resolve_column_mode
+from .scope import DatasetSelection, TableFilter, expand_scope, parse_scope_pattern
 
+# Default number of concurrent metadata requests issued by read_catalog
+_DEFAULT_MAX_WORKERS = 8
 
-def _parse_scope_item(item: str, default_project: str | None) -> tuple[str, str]:
-    """Parse a scope item into (project, dataset).
+# "api": list_tables + get_table per table; "information_schema": bulk queries per dataset;
+# "information_schema_region": bulk queries per (project, location) group of datasets
+_CATALOG_MODES = ("api", "information_schema", "information_schema_region")
 
-    If item contains a dot (e.g. 'other_project.dataset'), treat as project.dataset.
-    Otherwise, use default_project and item as dataset.
-    """
-    if "." in item:
-        parts = item.split(".", 1)
-        return parts[0], parts[1]
-    if default_project:
-        return default_project, item
-    raise ValueError(f"Cannot resolve scope '{item}': no project specified and item has no dot")
 
+def _resolve_max_workers(connection_config: dict[str, Any]) -> int:
+    """Return the size of the metadata fetch worker pool from the connection config."""
+    max_workers = connection_config.get("max_workers", _DEFAULT_MAX_WORKERS)
+    if isinstance(max_workers, bool) or not isinstance(max_workers, int) or max_workers < 1:
+        raise ValueError(f"Invalid max_workers '{max_workers}': must be a positive integer")
+    return max_workers
 
-# SDK field_type to standard SQL type name mapping
-_FIELD_TYPE_TO_SQL: dict[str, str] = {
-    "INTEGER": "INT64",
-    "FLOAT": "FLOAT64",
-    "BOOLEAN": "BOOL",
-    "RECORD": "STRUCT",
-}
+
+def _resolve_catalog_mode(connection_config: dict[str, Any]) -> str:
+    """Return the catalog read strategy from the connection config."""
+    catalog_mode = connection_config.get("catalog_mode", "api")
+    if catalog_mode not in _CATALOG_MODES:
+        raise ValueError(f"Invalid catalog_mode '{catalog_mode}'. Expected one of: {list(_CATALOG_MODES)}")
+    return str(catalog_mode)
 
 
 def _map_to_sql_type(field: Any) -> str:
     """Reconstruct the full BigQuery SQL type string from a SchemaField."""
-    raw_type = field.field_type or "STRING"
-    base_type = _FIELD_TYPE_TO_SQL.get(raw_type, raw_type)
-
-    # Handle parameterized types
-    if base_type == "STRING" and getattr(field, "max_length", None):
-        base_type = f"STRING({field.max_length})"
-    elif base_type == "BYTES" and getattr(field, "max_length", None):
-        base_type = f"BYTES({field.max_length})"
-    elif base_type in ("NUMERIC", "BIGNUMERIC") and getattr(field, "precision", None):
-        scale = getattr(field, "scale", None)
-        if scale is not None:
-            base_type = f"{base_type}({field.precision}, {scale})"
-        else:
-            base_type = f"{base_type}({field.precision})"
-
-    # Handle STRUCT (RECORD)
-    if base_type == "STRUCT":
-        sub_fields = getattr(field, "fields", None) or []
-        inner = ", ".join(f"{f.name} {_map_to_sql_type(f)}" for f in sub_fields)
-        base_type = f"STRUCT<{inner}>"
-
-    # Handle RANGE
-    if base_type == "RANGE":
-        range_elem = getattr(field, "range_element_type", None)
-        elem_type = getattr(range_elem, "element_type", "UNKNOWN") if range_elem else "UNKNOWN"
-        base_type = f"RANGE<{elem_type}>"
-
-    # Handle ARRAY (REPEATED mode)
-    if getattr(field, "mode", None) == "REPEATED":
-        return f"ARRAY<{base_type}>"
-    return base_type
+    return SchemaMapper().sql_type(field)
 
 
 def _map_schema_field(field: Any) -> CatalogColumn:
     """Map a BigQuery SchemaField to CatalogColumn."""
-    metadata: dict[str, Any] = {}
-    if hasattr(field, "policy_tags") and field.policy_tags:
-        names = getattr(field.policy_tags, "names", None) or []
-        metadata["policy_tags"] = list(names)
-    return CatalogColumn(
-        name=field.name,
-        data_type=_map_to_sql_type(field),
-        description=field.description or None,
-        nullable=field.mode != "REQUIRED" if field.mode else True,
-        metadata=metadata,
-    )
+    return SchemaMapper().columns([field])[0]
 
 
 def _extract_partitioning(table: Any) -> dict[str, Any] | None:
@@ -124,44 +93,237 @@ def _extract_clustering(table: Any) -> list[str] | None:
 class BigQueryWarehousePlugin(CatalogClient):
     """Catalog client for BigQuery."""
 
+    def __init__(self) -> None:
+        # Hit/miss/byte counters of the catalog cache for the last catalog read
+        self.cache_stats: dict[str, int] | None = None
+        # Per-project request/retry/throttling counters of API calls in the last catalog read
+        self.request_stats: dict[str, dict[str, Any]] | None = None
+        # Clients and credentials are reused across read_catalog calls on this instance
+        self._client_pool = ClientPool()
+
+    def close(self) -> None:
+        """Release pooled clients and HTTP sessions."""
+        self._client_pool.close()
+
     def read_catalog(self, scope: list[str], connection_config: dict[str, Any]) -> list[CatalogRelation]:
-        """Read catalog metadata for the given scope.
+        """Read catalog metadata for the given scope (see iter_catalog)."""
+        return list(self.iter_catalog(scope, connection_config))
+
+    def iter_catalog(self, scope: list[str], connection_config: dict[str, Any]) -> Iterator[CatalogRelation]:
+        """Yield catalog metadata for the given scope as it is read.
+
+        Scope items are 'dataset', 'project.dataset' or 'project.dataset.table'; without a
+        project, connection_config['project'] is used. Dataset and table parts may be globs
+        (e.g. 'project.raw_*', 'project.raw.events_*'): dataset globs are expanded with one
+        concurrent list_datasets call per project, and table globs plus
+        connection_config['include_tables'] / ['exclude_tables'] drop unwanted tables from
+        each listing before any per-table request is made.
+
+        Table listings and per-table metadata requests are fanned out over a bounded
+        worker pool (connection_config['max_workers']). Relations are yielded in scope
+        order, then in listing order within each dataset, regardless of completion order;
+        each one is yielded as soon as it and all relations before it are available.
+        Closing the iterator early cancels queued requests.
+
+        With connection_config['catalog_mode'] set to 'information_schema', each dataset
+        is read with a fixed number of INFORMATION_SCHEMA queries instead of one
+        get_table request per table. With 'information_schema_region', scope items are
+        grouped by project and location and each group is read with region-qualified
+        queries filtered to its datasets.
+
+        In 'api' mode, setting connection_config['catalog_cache_dir'] enables a persistent
+        cache of mapped relations; get_table then only runs for new or modified tables.
+        connection_config['column_mode'] = 'flattened' (api mode only) emits nested fields
+        as dotted-path columns with a parent reference instead of one STRUCT column.
+        list_tables and get_table calls go through a per-project RequestScheduler that
+        applies connection_config['rate_limit'] (overridden per project by
+        connection_config['project_rate_limits']), adapts concurrency when throttled and
+        retries rate-limit and transient errors with jittered backoff.
+        """
+        default_project = connection_config.get("project")
+        patterns = [parse_scope_pattern(scope_item, default_project) for scope_item in scope]
+        table_filter = TableFilter.from_config(connection_config)
+        max_workers = _resolve_max_workers(connection_config)
+        catalog_mode = _resolve_catalog_mode(connection_config)
+        column_mode = resolve_column_mode(connection_config)
+        if column_mode == "flattened" and catalog_mode != "api":
+            raise ValueError("column_mode 'flattened' is only supported with catalog_mode 'api'")
+        client = self._client_pool.get_client(connection_config, pool_size=max_workers)
+        # One mapper per read shares memoized STRUCT types across all tables
+        mapper = SchemaMapper(flatten=column_mode == "flattened")
+        cache_dir = connection_config.get("catalog_cache_dir")
+        cache = None
+        if cache_dir and catalog_mode == "api":
+            cache = CatalogCache(Path(cache_dir), variant=None if column_mode == "nested" else column_mode)
+        self.cache_stats = cache.stats if cache else None
+        schedulers = {
+            project_id: RequestScheduler(settings_for_project(connection_config, project_id), max_workers)
+            for project_id in dict.fromkeys(pattern.project for pattern in patterns)
+        }
 
-        Scope items are dataset IDs. If an item contains a dot (e.g. 'project.dataset'),
-        it is treated as project.dataset. Otherwise, connection_config['project'] is used.
+        def read_dataset(selection: DatasetSelection) -> list[CatalogRelation]:
+            relations = information_schema.read_dataset(
+                client, selection.project, selection.dataset, location=connection_config.get("location")
+            )
+            return [relation for relation in relations if table_filter.selects(selection, relation.name)]
+
+        # The scheduler owns retries, so the client's built-in retry is disabled (retry=None; the
+        # client accepts None although its annotation only allows a Retry)
+        def list_dataset_ids(project_id: str) -> list[str]:
+            return schedulers[project_id].call(
+                lambda: [item.dataset_id for item in client.list_datasets(project_id, retry=None)]  # type: ignore[arg-type]
+            )
+
+        def list_dataset(selection: DatasetSelection) -> list[Any]:
+            reference = bigquery.DatasetReference(selection.project, selection.dataset)
+            table_items = schedulers[selection.project].call(
+                lambda: list(client.list_tables(reference, retry=None))  # type: ignore[arg-type]
+            )
+            return [item for item in table_items if table_filter.selects(selection, item.table_id)]
+
+        def fetch_table(work_item: tuple[str, str, Any]) -> CatalogRelation:
+            project_id, dataset_id, table_ref = work_item
+            table = schedulers[project_id].call(client.get_table, table_ref, retry=None)
+            return self._map_table(table, project_id, dataset_id, mapper)
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            selections = expand_scope(patterns, list_dataset_ids, executor)
+            datasets = [(selection.project, selection.dataset) for selection in selections]
+            if catalog_mode == "information_schema":
+                for future in [executor.submit(read_dataset, selection) for selection in selections]:
+                    yield from future.result()
+                return
+            if catalog_mode == "information_schema_region":
+                relations = self._read_catalog_by_region(client, datasets, connection_config.get("location"), executor)
+                by_dataset = dict(zip(datasets, selections, strict=True))
+                yield from (
+                    relation
+                    for relation in relations
+                    if table_filter.selects(
+                        by_dataset[(relation.namespace.parts[0], relation.namespace.parts[1])], relation.name
+                    )
+                )
+                return
+
+            listing_futures = [executor.submit(list_dataset, selection) for selection in selections]
+            if cache is not None:
+                listings = [future.result() for future in listing_futures]
+                yield from self._read_catalog_cached(
+                    client, datasets, listings, cache, connection_config.get("location"), executor, schedulers, mapper
+                )
+                return
+
+            # Queue each dataset's fetches once its listing is in, and yield finished relations
+            # in submission order while later datasets are still being listed and fetched
+            pending: deque[Future[CatalogRelation]] = deque()
+            for selection, listing_future in zip(selections, listing_futures, strict=True):
+                pending.extend(
+                    executor.submit(fetch_table, (selection.project, selection.dataset, table_item.reference))
+                    for table_item in listing_future.result()
+                )
+                while pending and pending[0].done():
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            self.request_stats = {project_id: scheduler.stats for project_id, scheduler in schedulers.items()}
+
+    def _read_catalog_cached(
+        self,
+        client: Any,
+        datasets: list[tuple[str, str]],
+        listings: list[list[Any]],
+        cache: CatalogCache,
+        location: str | None,
+        executor: ThreadPoolExecutor,
+        schedulers: dict[str, RequestScheduler],
+        mapper: SchemaMapper,
+    ) -> list[CatalogRelation]:
+        """Resolve listed tables from the cache and fetch only new or modified ones.
+
+        tables.list carries no modification time, so each dataset's `last_modified_time`
+        values come from one `__TABLES__` query. If that query fails (e.g. no permission
+        to create jobs), every table of the dataset is treated as a miss.
         """
-        # Use AnonymousCredentials when api_endpoint is set (emulator/testing)
-        creds = AnonymousCredentials() if connection_config.get("api_endpoint") else get_credentials(connection_config)
-        client_options = None
-        if connection_config.get("api_endpoint"):
-            client_options = ClientOptions(api_endpoint=connection_config["api_endpoint"])
-
-        client = bigquery.Client(
-            project=connection_config.get("project"),
-            credentials=creds,
-            client_options=client_options,
-        )
 
-        default_project = connection_config.get("project")
-        relations: list[CatalogRelation] = []
+        def dataset_last_modified(dataset: tuple[str, str]) -> dict[str, int]:
+            try:
+                return read_last_modified(client, information_schema.quote_identifier(*dataset), location)
+            except GoogleAPIError:
+                return {}
+
+        last_modified = list(executor.map(dataset_last_modified, datasets))
+        results: list[CatalogRelation | None] = []
+        dataset_caches = []
+        misses = []
+        for (project_id, dataset_id), table_items, modified in zip(datasets, listings, last_modified, strict=True):
+            dataset_cache = cache.dataset(project_id, dataset_id)
+            dataset_cache.retain({item.table_id for item in table_items})
+            dataset_caches.append(dataset_cache)
+            for table_item in table_items:
+                relation = dataset_cache.get(table_item.table_id, modified.get(table_item.table_id))
+                if relation is None:
+                    misses.append((len(results), dataset_cache, project_id, dataset_id, table_item.reference))
+                results.append(relation)
+
+        def fetch_miss(miss: tuple[int, Any, str, str, Any]) -> tuple[Any, CatalogRelation]:
+            _, _, project_id, dataset_id, table_ref = miss
+            table = schedulers[project_id].call(client.get_table, table_ref, retry=None)
+            return table, self._map_table(table, project_id, dataset_id, mapper)
+
+        for (index, dataset_cache, *_), (table, relation) in zip(misses, executor.map(fetch_miss, misses), strict=True):
+            dataset_cache.put(table.table_id, last_modified_ms(table), relation)
+            results[index] = relation
+
+        for dataset_cache in dataset_caches:
+            dataset_cache.save()
+        return [relation for relation in results if relation is not None]
+
+    def _read_catalog_by_region(
+        self,
+        client: Any,
+        datasets: list[tuple[str, str]],
+        location: str | None,
+        executor: ThreadPoolExecutor,
+    ) -> list[CatalogRelation]:
+        """Read datasets grouped by (project, location) with one set of region-wide queries per group.
+
+        The configured location applies to every dataset; without one, each dataset's
+        location is looked up with a (concurrent) get_dataset call.
+        """
+        unique_datasets = list(dict.fromkeys(datasets))
+        if location:
+            locations = [location] * len(unique_datasets)
+        else:
+            locations = list(
+                executor.map(lambda ds: client.get_dataset(bigquery.DatasetReference(*ds)).location, unique_datasets)
+            )
+
+        groups: dict[tuple[str, str], list[str]] = {}
+        for (project_id, dataset_id), dataset_location in zip(unique_datasets, locations, strict=True):
+            groups.setdefault((project_id, dataset_location), []).append(dataset_id)
 
-        for scope_item in scope:
-            project_id, dataset_id = _parse_scope_item(scope_item, default_project)
-            dataset_ref = bigquery.DatasetReference(project_id, dataset_id)
+        def read_group(group: tuple[tuple[str, str], list[str]]) -> dict[str, list[CatalogRelation]]:
+            (project_id, group_location), dataset_ids = group
+            return information_schema.read_region(client, project_id, group_location, dataset_ids)
 
-            for table_item in client.list_tables(dataset_ref):
-                table = client.get_table(table_item.reference)
-                relation = self._map_table(table, project_id, dataset_id)
-                relations.append(relation)
+        by_dataset: dict[tuple[str, str], list[CatalogRelation]] = {}
+        for ((project_id, _), _), group_relations in zip(groups.items(), executor.map(read_group, groups.items()), strict=True):
+            for dataset_id, relations in group_relations.items():
+                by_dataset[(project_id, dataset_id)] = relations
 
-        return relations
+        return [relation for dataset in datasets for relation in by_dataset.get(dataset, [])]
 
-    def _map_table(self, table: Any, project_id: str, dataset_id: str) -> CatalogRelation:
+    def _map_table(
+        self, table: Any, project_id: str, dataset_id: str, mapper: SchemaMapper | None = None
+    ) -> CatalogRelation:
         """Map a BigQuery Table to CatalogRelation."""
         table_type = getattr(table, "table_type", "TABLE") or "TABLE"
         kind = "view" if str(table_type).upper() == "VIEW" else "table"
         namespace = CatalogNamespace(parts=[project_id, dataset_id])
-        columns = [_map_schema_field(f) for f in (table.schema or [])]
+        columns = (mapper or SchemaMapper()).columns(list(table.schema or []))
         dbt_name = f"{project_id}__{dataset_id}__{table.table_id}"
 
         metadata: dict[str, Any] = {
@@ -185,4 +347,5 @@ class BigQueryWarehousePlugin(CatalogClient):
             columns=columns,
             dbt_name=dbt_name,
             metadata=metadata,
+            fingerprint=schema_fingerprint(columns),
         )
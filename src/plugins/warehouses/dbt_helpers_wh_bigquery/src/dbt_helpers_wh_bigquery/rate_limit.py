@@ -0,0 +1,209 @@
+"""Adaptive rate limiting and retries for BigQuery metadata requests.
+
+A `RequestScheduler` wraps each metadata call with:
+
+- a token bucket capping requests per second (optional),
+- an AIMD concurrency limit: +1 slot per limit-worth of successful calls, halved
+  whenever the API answers with a rate-limit error,
+- retries with full-jitter exponential backoff for rate-limit and transient errors.
+
+Counters (requests, retries, throttled responses, time spent waiting on rate limits,
+time spent backing off from transient errors, effective QPS) are kept so throughput
+can be tuned per project.
+"""
+
+import random
+import threading
+import time
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+import requests
+from google.api_core import exceptions
+from google.auth import exceptions as auth_exceptions
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+_RETRYABLE_REASONS = frozenset({"rateLimitExceeded", "backendError", "internalError", "badGateway"})
+_TRANSIENT_ERRORS = (
+    exceptions.InternalServerError,
+    exceptions.BadGateway,
+    exceptions.ServiceUnavailable,
+    exceptions.GatewayTimeout,
+    # Transport errors, as retried by the client's own DEFAULT_RETRY, which the scheduler replaces
+    ConnectionError,
+    requests.exceptions.ConnectionError,
+    requests.exceptions.ChunkedEncodingError,
+    requests.exceptions.Timeout,
+    auth_exceptions.TransportError,
+)
+# Subclasses of the above that signal a persistent configuration or security problem
+_NON_TRANSIENT_ERRORS = (requests.exceptions.SSLError,)
+
+
+class RateLimitSettings(BaseModel):
+    """Per-project scheduler settings (`rate_limit` / `project_rate_limits` in the connection config)."""
+
+    qps: float | None = None
+    burst: int | None = None
+    min_concurrency: int = 1
+    max_attempts: int = 6
+    initial_backoff: float = 0.5
+    max_backoff: float = 32.0
+
+
+def _error_reasons(exc: BaseException) -> set[str]:
+    return {e.get("reason", "") for e in getattr(exc, "errors", None) or [] if isinstance(e, dict)}
+
+
+def is_throttled(exc: BaseException) -> bool:
+    """Return True if the error signals a rate limit (HTTP 429, or 403 rateLimitExceeded)."""
+    if isinstance(exc, exceptions.TooManyRequests):
+        return True
+    return isinstance(exc, exceptions.Forbidden) and "rateLimitExceeded" in _error_reasons(exc)
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """Return True for rate limits and transient server or connection errors."""
+    if isinstance(exc, _NON_TRANSIENT_ERRORS):
+        return False
+    if is_throttled(exc) or isinstance(exc, _TRANSIENT_ERRORS):
+        return True
+    return isinstance(exc, exceptions.GoogleAPICallError) and bool(_error_reasons(exc) & _RETRYABLE_REASONS)
+
+
+class TokenBucket:
+    """Thread-safe token bucket; `acquire` reserves a token and sleeps until it is available."""
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        clock: Callable[[], float] | None = None,
+        sleep: Callable[[float], None] | None = None,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock or time.monotonic
+        self._sleep = sleep or time.sleep
+        self._tokens = float(burst)
+        self._updated = self._clock()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take one token, returning the seconds spent waiting for it."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait:
+            self._sleep(wait)
+        return wait
+
+
+class AdaptiveConcurrency:
+    """AIMD concurrency limit shared by the worker threads of one project."""
+
+    def __init__(self, initial: int, minimum: int, maximum: int):
+        self.maximum = maximum
+        self.minimum = min(minimum, maximum)
+        self.limit = float(max(self.minimum, min(initial, maximum)))
+        self._in_flight = 0
+        self._cond = threading.Condition()
+
+    def acquire(self) -> None:
+        with self._cond:
+            while self._in_flight >= int(self.limit):
+                self._cond.wait()
+            self._in_flight += 1
+
+    def release(self, throttled: bool = False) -> None:
+        with self._cond:
+            self._in_flight -= 1
+            if throttled:
+                self.limit = max(float(self.minimum), self.limit / 2)
+            else:
+                self.limit = min(float(self.maximum), self.limit + 1 / self.limit)
+            self._cond.notify_all()
+
+
+class RequestScheduler:
+    """Runs metadata calls for one project under rate, concurrency and retry control."""
+
+    def __init__(
+        self,
+        settings: RateLimitSettings,
+        max_concurrency: int,
+        clock: Callable[[], float] | None = None,
+        sleep: Callable[[float], None] | None = None,
+        rng: Callable[[], float] | None = None,
+    ):
+        self.settings = settings
+        self._clock = clock or time.monotonic
+        self._sleep = sleep or time.sleep
+        self._rng = rng or random.random
+        self._bucket = None
+        if settings.qps:
+            burst = settings.burst or max(1, int(settings.qps))
+            self._bucket = TokenBucket(settings.qps, burst, clock=self._clock, sleep=self._sleep)
+        self._concurrency = AdaptiveConcurrency(max_concurrency, settings.min_concurrency, max_concurrency)
+        self._lock = threading.Lock()
+        self._started = self._clock()
+        self._counters = {"requests": 0, "retries": 0, "throttled": 0, "throttled_seconds": 0.0, "backoff_seconds": 0.0}
+
+    def _count(self, **increments: float) -> None:
+        with self._lock:
+            for name, value in increments.items():
+                self._counters[name] += value
+
+    def call(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Call fn under the scheduler, retrying retryable errors with jittered backoff."""
+        attempt = 0
+        while True:
+            if self._bucket:
+                waited = self._bucket.acquire()
+                if waited:
+                    self._count(throttled_seconds=waited)
+            self._concurrency.acquire()
+            throttled = False
+            try:
+                self._count(requests=1)
+                return fn(*args, **kwargs)
+            except Exception as e:
+                throttled = is_throttled(e)
+                attempt += 1
+                if not is_retryable(e) or attempt >= self.settings.max_attempts:
+                    raise
+            finally:
+                self._concurrency.release(throttled=throttled)
+
+            # Full jitter: sleep uniformly in [0, min(max_backoff, initial * 2^(attempt-1))]
+            backoff = self._rng() * min(self.settings.max_backoff, self.settings.initial_backoff * 2 ** (attempt - 1))
+            # Only waits caused by rate limits count as throttling
+            if throttled:
+                self._count(retries=1, throttled=1, throttled_seconds=backoff)
+            else:
+                self._count(retries=1, backoff_seconds=backoff)
+            self._sleep(backoff)
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Snapshot of counters, the current concurrency limit and effective QPS."""
+        with self._lock:
+            counters = dict(self._counters)
+        elapsed = max(self._clock() - self._started, 1e-9)
+        counters["throttled_seconds"] = round(counters["throttled_seconds"], 3)
+        counters["backoff_seconds"] = round(counters["backoff_seconds"], 3)
+        counters["concurrency_limit"] = int(self._concurrency.limit)
+        counters["effective_qps"] = round(counters["requests"] / elapsed, 2)
+        return counters
+
+
+def settings_for_project(connection_config: dict[str, Any], project_id: str) -> RateLimitSettings:
+    """Merge the default `rate_limit` block with `project_rate_limits[project_id]`."""
+    merged = dict(connection_config.get("rate_limit") or {})
+    merged.update((connection_config.get("project_rate_limits") or {}).get(project_id) or {})
+    return RateLimitSettings(**merged)
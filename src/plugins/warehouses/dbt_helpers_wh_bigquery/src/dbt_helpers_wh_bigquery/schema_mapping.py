@@ -0,0 +1,160 @@
+"""Map BigQuery SchemaFields to SQL type strings and CatalogColumns.
+
+Schemas are walked iteratively (no recursion limit on nesting) over their REST
+representation rather than SchemaField properties, and the type string of each
+distinct STRUCT body is built once per mapper: identical sub-structs, as found in
+wide event schemas, resolve to the same cached string.
+"""
+
+from typing import Any
+
+from google.cloud.bigquery.schema import SchemaField
+
+from dbt_helpers_sdk import CatalogColumn
+
+# SDK field_type to standard SQL type name mapping
+_FIELD_TYPE_TO_SQL: dict[str, str] = {
+    "INTEGER": "INT64",
+    "FLOAT": "FLOAT64",
+    "BOOLEAN": "BOOL",
+    "RECORD": "STRUCT",
+}
+
+_COLUMN_MODES = ("nested", "flattened")
+
+
+def resolve_column_mode(connection_config: dict[str, Any]) -> str:
+    """Return how nested fields become columns: 'nested' (default) or 'flattened'."""
+    column_mode = connection_config.get("column_mode", "nested")
+    if column_mode not in _COLUMN_MODES:
+        raise ValueError(f"Invalid column_mode '{column_mode}'. Expected one of: {list(_COLUMN_MODES)}")
+    return str(column_mode)
+
+
+def _api_repr(field: Any) -> dict[str, Any]:
+    """Return the REST representation of a field.
+
+    SchemaField.to_api_repr returns its backing dict without copying, while the
+    `fields` property builds new SchemaFields on every access. Other field-like
+    objects are converted from their attributes, leaving children unconverted.
+    """
+    if isinstance(field, dict):
+        return field
+    if isinstance(field, SchemaField):
+        return field.to_api_repr()
+    range_elem = getattr(field, "range_element_type", None)
+    policy_tags = getattr(field, "policy_tags", None)
+    return {
+        "name": field.name,
+        "type": field.field_type,
+        "mode": field.mode,
+        "description": field.description,
+        "fields": list(getattr(field, "fields", None) or []),
+        "maxLength": getattr(field, "max_length", None),
+        "precision": getattr(field, "precision", None),
+        "scale": getattr(field, "scale", None),
+        "rangeElementType": {"type": getattr(range_elem, "element_type", "UNKNOWN")} if range_elem else None,
+        "policyTags": {"names": list(getattr(policy_tags, "names", None) or [])} if policy_tags else None,
+    }
+
+
+def _base_type(field: dict[str, Any]) -> str:
+    raw_type = (field.get("type") or "STRING").upper()
+    return _FIELD_TYPE_TO_SQL.get(raw_type, raw_type)
+
+
+def _scalar_type(field: dict[str, Any], base_type: str) -> str:
+    """Apply type parameters (length, precision/scale, range element) to a non-STRUCT type."""
+    if base_type in ("STRING", "BYTES") and field.get("maxLength"):
+        return f"{base_type}({field['maxLength']})"
+    if base_type in ("NUMERIC", "BIGNUMERIC") and field.get("precision"):
+        if field.get("scale") is not None:
+            return f"{base_type}({field['precision']}, {field['scale']})"
+        return f"{base_type}({field['precision']})"
+    if base_type == "RANGE":
+        elem_type = (field.get("rangeElementType") or {}).get("type", "UNKNOWN")
+        return f"RANGE<{elem_type}>"
+    return base_type
+
+
+def _is_repeated(field: dict[str, Any]) -> bool:
+    return (field.get("mode") or "NULLABLE").upper() == "REPEATED"
+
+
+class SchemaMapper:
+    """Maps schema fields to types and columns, memoizing STRUCT bodies across calls.
+
+    With flatten=True, `columns` emits every nested field as its own column named by
+    its dotted path (`a`, `a.b`, `a.b.c`), with `metadata["parent"]` set to the path of
+    the enclosing field.
+    """
+
+    def __init__(self, flatten: bool = False):
+        self.flatten = flatten
+        self._struct_types: dict[tuple[tuple[str, str], ...], str] = {}
+
+    def _resolve_types(self, roots: list[dict[str, Any]]) -> tuple[dict[int, str], dict[int, list[dict[str, Any]]]]:
+        """Return (types, children) keyed by id() of every field representation under roots."""
+        types: dict[int, str] = {}
+        children: dict[int, list[dict[str, Any]]] = {}
+        stack: list[tuple[dict[str, Any], bool]] = [(root, False) for root in roots]
+        while stack:
+            field, children_done = stack.pop()
+            base_type = _base_type(field)
+            if not children_done:
+                sub_fields = [_api_repr(child) for child in field.get("fields") or ()] if base_type == "STRUCT" else []
+                children[id(field)] = sub_fields
+                if sub_fields:
+                    stack.append((field, True))
+                    stack.extend((child, False) for child in sub_fields)
+                    continue
+
+            if base_type == "STRUCT":
+                key = tuple((child["name"], types[id(child)]) for child in children[id(field)])
+                sql_type = self._struct_types.get(key)
+                if sql_type is None:
+                    sql_type = "STRUCT<" + ", ".join(f"{name} {child_type}" for name, child_type in key) + ">"
+                    self._struct_types[key] = sql_type
+            else:
+                sql_type = _scalar_type(field, base_type)
+            types[id(field)] = f"ARRAY<{sql_type}>" if _is_repeated(field) else sql_type
+        return types, children
+
+    def sql_type(self, field: Any) -> str:
+        """Reconstruct the full BigQuery SQL type string of a SchemaField."""
+        root = _api_repr(field)
+        types, _ = self._resolve_types([root])
+        return types[id(root)]
+
+    def columns(self, schema: list[Any]) -> list[CatalogColumn]:
+        """Map a table schema to columns, flattening nested fields if enabled."""
+        roots = [_api_repr(field) for field in schema]
+        types, children = self._resolve_types(roots)
+        if not self.flatten:
+            return [_column(field, field["name"], types[id(field)]) for field in roots]
+
+        columns = []
+        stack: list[tuple[dict[str, Any], str | None]] = [(field, None) for field in reversed(roots)]
+        while stack:
+            field, parent = stack.pop()
+            path = f"{parent}.{field['name']}" if parent else field["name"]
+            columns.append(_column(field, path, types[id(field)], parent))
+            stack.extend((child, path) for child in reversed(children[id(field)]))
+        return columns
+
+
+def _column(field: dict[str, Any], name: str, data_type: str, parent: str | None = None) -> CatalogColumn:
+    metadata: dict[str, Any] = {}
+    policy_tags = field.get("policyTags")
+    if policy_tags:
+        metadata["policy_tags"] = list(policy_tags.get("names") or [])
+    if parent:
+        metadata["parent"] = parent
+    mode = field.get("mode")
+    return CatalogColumn(
+        name=name,
+        data_type=data_type,
+        description=field.get("description") or None,
+        nullable=mode.upper() != "REQUIRED" if mode else True,
+        metadata=metadata,
+    )
@@ -0,0 +1,114 @@
+"""Scope patterns for BigQuery catalog reads.
+
+A scope item is `dataset`, `project.dataset` or `project.dataset.table`. The dataset and
+table parts may be shell-style globs (`*`, `?`, `[...]`), e.g. `project.*`, `project.raw_*`
+or `project.raw.events_*`. Dataset globs are expanded by listing the project's datasets;
+table globs, together with the `include_tables` / `exclude_tables` connection settings,
+select tables from each dataset listing before any table metadata is fetched.
+"""
+
+from collections.abc import Callable, Iterable
+from concurrent.futures import Executor
+from fnmatch import fnmatchcase
+from typing import Any, NamedTuple
+
+_GLOB_CHARS = frozenset("*?[")
+
+
+def is_glob(value: str) -> bool:
+    """Return True if value contains glob metacharacters."""
+    return any(c in _GLOB_CHARS for c in value)
+
+
+class ScopePattern(NamedTuple):
+    """A parsed scope item; dataset and table may be globs, table None selects all tables."""
+
+    project: str
+    dataset: str
+    table: str | None = None
+
+
+class DatasetSelection(NamedTuple):
+    """A concrete dataset to read and the table globs selected in it (None selects all tables)."""
+
+    project: str
+    dataset: str
+    tables: tuple[str, ...] | None = None
+
+
+def parse_scope_pattern(item: str, default_project: str | None) -> ScopePattern:
+    """Parse a scope item into a ScopePattern.
+
+    One part is a dataset in default_project, two parts are `project.dataset` and three
+    parts are `project.dataset.table`.
+    """
+    parts = item.split(".")
+    if len(parts) == 1:
+        if not default_project:
+            raise ValueError(f"Cannot resolve scope '{item}': no project specified and item has no dot")
+        parts = [default_project, *parts]
+    if len(parts) > 3 or not all(parts):
+        raise ValueError(f"Invalid scope '{item}': expected dataset, project.dataset or project.dataset.table")
+    if is_glob(parts[0]):
+        raise ValueError(f"Invalid scope '{item}': project IDs cannot be patterns")
+    return ScopePattern(*parts)
+
+
+def expand_scope(
+    patterns: list[ScopePattern],
+    list_dataset_ids: Callable[[str], Iterable[str]],
+    executor: Executor,
+) -> list[DatasetSelection]:
+    """Expand dataset globs into concrete datasets, listing each project's datasets once.
+
+    Datasets are returned in scope order (matches of one glob sorted by name) without
+    duplicates; table globs of scope items naming the same dataset are merged.
+    """
+    projects = list(dict.fromkeys(p.project for p in patterns if is_glob(p.dataset)))
+    listed = dict(zip(projects, executor.map(lambda project: sorted(list_dataset_ids(project)), projects), strict=True))
+
+    selections: dict[tuple[str, str], tuple[str, ...] | None] = {}
+    for pattern in patterns:
+        if is_glob(pattern.dataset):
+            dataset_ids = [d for d in listed[pattern.project] if fnmatchcase(d, pattern.dataset)]
+        else:
+            dataset_ids = [pattern.dataset]
+        for dataset_id in dataset_ids:
+            key = (pattern.project, dataset_id)
+            current = selections.get(key, ())
+            selections[key] = None if pattern.table is None or current is None else (*current, pattern.table)
+    return [DatasetSelection(project, dataset, tables) for (project, dataset), tables in selections.items()]
+
+
+def _glob_list(connection_config: dict[str, Any], key: str) -> list[str]:
+    value = connection_config.get(key) or []
+    if isinstance(value, str) or not all(isinstance(v, str) for v in value):
+        raise ValueError(f"Invalid {key} '{value}': must be a list of glob strings")
+    return list(value)
+
+
+class TableFilter:
+    """Selects tables by scope table globs plus configured include/exclude globs.
+
+    Include/exclude globs match the table ID, or `dataset.table` when the glob contains a dot.
+    """
+
+    def __init__(self, include: list[str] | None = None, exclude: list[str] | None = None):
+        self.include = include or []
+        self.exclude = exclude or []
+
+    @classmethod
+    def from_config(cls, connection_config: dict[str, Any]) -> "TableFilter":
+        return cls(_glob_list(connection_config, "include_tables"), _glob_list(connection_config, "exclude_tables"))
+
+    def selects(self, selection: DatasetSelection, table_id: str) -> bool:
+        """Return True if table_id in the selected dataset should be read."""
+        if selection.tables is not None and not any(fnmatchcase(table_id, p) for p in selection.tables):
+            return False
+
+        def matches(pattern: str) -> bool:
+            return fnmatchcase(f"{selection.dataset}.{table_id}" if "." in pattern else table_id, pattern)
+
+        if self.include and not any(matches(p) for p in self.include):
+            return False
+        return not any(matches(p) for p in self.exclude)
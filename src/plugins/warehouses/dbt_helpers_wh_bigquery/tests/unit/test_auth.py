@@ -1,9 +1,14 @@
 """Unit tests for BigQuery auth module."""
 
+import datetime
+import os
+import shutil
+import tempfile
 import unittest
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
-from dbt_helpers_wh_bigquery.auth import get_credentials
+from dbt_helpers_wh_bigquery.auth import TokenCache, get_credentials
 
 
 class TestGetCredentials(unittest.TestCase):
@@ -41,3 +46,112 @@ class TestGetCredentials(unittest.TestCase):
         call_kw = mock_impersonated.call_args[1]
         self.assertIs(call_kw["source_credentials"], mock_base)
         self.assertEqual(call_kw["target_principal"], "target@project.iam.gserviceaccount.com")
+
+
+class TestTokenCache(unittest.TestCase):
+    """Tests for the on-disk impersonation token cache."""
+
+    def setUp(self):
+        self.cache_dir = Path(tempfile.mkdtemp())
+        self.config = {
+            "impersonate_service_account": "target@project.iam.gserviceaccount.com",
+            "token_cache": True,
+            "token_cache_dir": str(self.cache_dir),
+        }
+        from cryptography.fernet import Fernet  # pylint: disable=import-outside-toplevel
+
+        self.key = Fernet.generate_key()
+        patcher = patch.dict(os.environ, {"DBT_HELPERS_TOKEN_CACHE_KEY": self.key.decode()})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def _run(self, mock_default, mock_impersonated, source_email="source@project.iam.gserviceaccount.com", **overrides):
+        """Resolve credentials with mocked source and impersonated credential objects."""
+        source = MagicMock(service_account_email=source_email)
+        mock_default.return_value = (source, "project-id")
+        impersonated = MagicMock(token=None, expiry=None)
+
+        def refresh(_request):
+            impersonated.token = f"token-for-{source_email}"
+            impersonated.expiry = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None) + datetime.timedelta(hours=1)
+
+        impersonated.refresh.side_effect = refresh
+        mock_impersonated.return_value = impersonated
+        return get_credentials({**self.config, **overrides})
+
+    @patch("dbt_helpers_wh_bigquery.auth.ImpersonatedCredentials")
+    @patch("dbt_helpers_wh_bigquery.auth.default")
+    def test_second_invocation_skips_token_exchange(self, mock_default, mock_impersonated):
+        """A fresh cached token is reused without calling refresh."""
+        first = self._run(mock_default, mock_impersonated)
+        first.refresh.assert_called_once()
+
+        second = self._run(mock_default, mock_impersonated)
+        second.refresh.assert_not_called()
+        self.assertEqual(second.token, first.token)
+        self.assertEqual(second.expiry, first.expiry)
+
+    @patch("dbt_helpers_wh_bigquery.auth.ImpersonatedCredentials")
+    @patch("dbt_helpers_wh_bigquery.auth.default")
+    def test_entries_are_encrypted_and_private(self, mock_default, mock_impersonated):
+        """Token files do not contain the plaintext token and are owner-only."""
+        creds = self._run(mock_default, mock_impersonated)
+        token_files = list(self.cache_dir.glob("*.token"))
+        self.assertEqual(len(token_files), 1)
+        self.assertNotIn(creds.token.encode(), token_files[0].read_bytes())
+        self.assertEqual(token_files[0].stat().st_mode & 0o777, 0o600)
+        # The key is not stored next to the entries
+        self.assertEqual([path.name for path in self.cache_dir.iterdir()], [token_files[0].name])
+
+    @patch("dbt_helpers_wh_bigquery.auth.ImpersonatedCredentials")
+    @patch("dbt_helpers_wh_bigquery.auth.default")
+    def test_not_used_without_a_key(self, mock_default, mock_impersonated):
+        """Without DBT_HELPERS_TOKEN_CACHE_KEY, credentials resolve as if the cache were disabled."""
+        del os.environ["DBT_HELPERS_TOKEN_CACHE_KEY"]
+        creds = self._run(mock_default, mock_impersonated)
+        creds.refresh.assert_not_called()
+        self.assertEqual(list(self.cache_dir.iterdir()), [])
+
+    def test_rejects_an_invalid_key(self):
+        with self.assertRaisesRegex(ValueError, "DBT_HELPERS_TOKEN_CACHE_KEY must be a Fernet key"):
+            TokenCache(self.cache_dir, b"not-a-key")
+
+    def test_other_key_cannot_read_entries(self):
+        """Entries written under another key are cache misses."""
+        from cryptography.fernet import Fernet  # pylint: disable=import-outside-toplevel
+
+        TokenCache(self.cache_dir, self.key).store("k", "token", datetime.datetime(2100, 1, 1))
+        self.assertIsNotNone(TokenCache(self.cache_dir, self.key).load("k", lifetime=3600))
+        self.assertIsNone(TokenCache(self.cache_dir, Fernet.generate_key()).load("k", lifetime=3600))
+
+    @patch("dbt_helpers_wh_bigquery.auth.ImpersonatedCredentials")
+    @patch("dbt_helpers_wh_bigquery.auth.default")
+    def test_keyed_by_source_principal(self, mock_default, mock_impersonated):
+        """A different source principal does not reuse another principal's token."""
+        self._run(mock_default, mock_impersonated, source_email="a@p.iam.gserviceaccount.com")
+        creds = self._run(mock_default, mock_impersonated, source_email="b@p.iam.gserviceaccount.com")
+        creds.refresh.assert_called_once()
+        self.assertEqual(creds.token, "token-for-b@p.iam.gserviceaccount.com")
+
+    @patch("dbt_helpers_wh_bigquery.auth.ImpersonatedCredentials")
+    @patch("dbt_helpers_wh_bigquery.auth.default")
+    def test_honours_lifetime_and_skew(self, mock_default, mock_impersonated):
+        """Tokens within the skew of expiry, or older than the lifetime, are refreshed."""
+        self._run(mock_default, mock_impersonated)
+        # Token expires in 1h; a 2h skew makes it unusable
+        creds = self._run(mock_default, mock_impersonated, token_cache_skew_seconds=7200)
+        creds.refresh.assert_called_once()
+        # A lifetime shorter than the skew also forces a refresh
+        creds = self._run(mock_default, mock_impersonated, impersonation_lifetime=60, token_cache_skew_seconds=120)
+        creds.refresh.assert_called_once()
+
+    @patch("dbt_helpers_wh_bigquery.auth.ImpersonatedCredentials")
+    @patch("dbt_helpers_wh_bigquery.auth.default")
+    def test_disabled_by_default(self, mock_default, mock_impersonated):
+        """Without token_cache, no exchange happens up front and nothing is written."""
+        creds = self._run(mock_default, mock_impersonated, token_cache=False)
+        creds.refresh.assert_not_called()
+        self.assertEqual(list(self.cache_dir.iterdir()), [])
@@ -0,0 +1,130 @@
+"""Unit tests for the persistent BigQuery catalog cache."""
+
+import datetime
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from google.api_core.exceptions import Forbidden
+from google.cloud.bigquery.schema import SchemaField
+
+from dbt_helpers_wh_bigquery.catalog_cache import CACHE_VERSION, CatalogCache
+from dbt_helpers_wh_bigquery.plugin import BigQueryWarehousePlugin
+
+
+def _epoch_ms(ms: int) -> datetime.datetime:
+    return datetime.datetime.fromtimestamp(ms / 1000, tz=datetime.timezone.utc)
+
+
+class TestCatalogCacheReadCatalog(unittest.TestCase):
+    """read_catalog only calls get_table for new or modified tables when the cache is enabled."""
+
+    def setUp(self):
+        self.cache_dir = Path(tempfile.mkdtemp())
+        # table_id -> (last_modified_ms, column names)
+        self.tables = {"a": (1000, ["id"]), "b": (2000, ["id", "name"])}
+        self.query_fails = False
+        patcher = patch("dbt_helpers_wh_bigquery.plugin.bigquery.Client")
+        self.client = patcher.start().return_value
+        self.addCleanup(patcher.stop)
+        self.client.list_tables.side_effect = lambda *_, **__: [
+            MagicMock(table_id=t, reference=t) for t in sorted(self.tables)
+        ]
+        self.client.get_table.side_effect = self._get_table
+        self.client.query.side_effect = self._query
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def _get_table(self, table_id, **_):
+        modified, columns = self.tables[table_id]
+        table = MagicMock()
+        table.table_id = table_id
+        table.table_type = "TABLE"
+        table.modified = _epoch_ms(modified)
+        table.schema = [SchemaField(c, "STRING") for c in columns]
+        table.description = None
+        table.labels = {}
+        table.time_partitioning = None
+        table.range_partitioning = None
+        table.clustering_fields = None
+        return table
+
+    def _query(self, sql, location=None):  # noqa: ARG002  # pylint: disable=unused-argument
+        if self.query_fails:
+            raise Forbidden("bigquery.jobs.create permission denied")
+        self.assertIn("`proj`.`ds`.__TABLES__", sql)
+        job = MagicMock()
+        job.result.return_value = [
+            {"table_id": t, "last_modified_time": modified} for t, (modified, _) in self.tables.items()
+        ]
+        return job
+
+    def _read(self, plugin=None):
+        plugin = plugin or BigQueryWarehousePlugin()
+        relations = plugin.read_catalog(
+            ["ds"],
+            {"project": "proj", "api_endpoint": "http://localhost", "catalog_cache_dir": str(self.cache_dir)},
+        )
+        return plugin, relations
+
+    def test_second_read_is_served_from_cache(self):
+        """Unchanged tables are not fetched again and relations are identical."""
+        plugin, first = self._read()
+        self.assertEqual(plugin.cache_stats["misses"], 2)
+        self.assertGreater(plugin.cache_stats["bytes_written"], 0)
+        self.assertTrue((self.cache_dir / "bigquery" / "proj" / "ds.json").exists())
+
+        self.client.get_table.reset_mock()
+        plugin, second = self._read()
+        self.client.get_table.assert_not_called()
+        self.assertEqual(second, first)
+        self.assertEqual(plugin.cache_stats["hits"], 2)
+        self.assertEqual(plugin.cache_stats["misses"], 0)
+        self.assertGreater(plugin.cache_stats["bytes_read"], 0)
+        self.assertEqual(plugin.cache_stats["bytes_written"], 0)
+
+    def test_modified_new_and_deleted_tables(self):
+        """Modified and new tables are refetched; deleted tables are dropped."""
+        self._read()
+        self.client.get_table.reset_mock()
+        self.tables["b"] = (3000, ["id", "name", "email"])
+        self.tables["c"] = (3000, ["x"])
+        del self.tables["a"]
+
+        plugin, relations = self._read()
+
+        self.assertEqual(sorted(c.args[0] for c in self.client.get_table.call_args_list), ["b", "c"])
+        self.assertEqual([r.name for r in relations], ["b", "c"])
+        self.assertEqual([c.name for c in relations[0].columns], ["id", "name", "email"])
+        self.assertEqual(plugin.cache_stats["hits"], 0)
+        cache = CatalogCache(self.cache_dir).dataset("proj", "ds")
+        self.assertIsNone(cache.get("a", 1000))
+
+    def test_failed_freshness_query_refetches_everything(self):
+        """Without __TABLES__ access every table is a miss, but the read still succeeds."""
+        self._read()
+        self.query_fails = True
+        self.client.get_table.reset_mock()
+        plugin, relations = self._read()
+        self.assertEqual(self.client.get_table.call_count, 2)
+        self.assertEqual(len(relations), 2)
+        self.assertEqual(plugin.cache_stats["misses"], 2)
+
+    def test_version_mismatch_discards_entries(self):
+        """Cache files written by another mapping version are ignored."""
+        self._read()
+        cache_file = self.cache_dir / "bigquery" / "proj" / "ds.json"
+        cache_file.write_text(cache_file.read_text().replace(f'"version": {CACHE_VERSION}', '"version": -1'))
+        self.client.get_table.reset_mock()
+        self._read()
+        self.assertEqual(self.client.get_table.call_count, 2)
+
+    def test_disabled_without_cache_dir(self):
+        """No cache directory means no freshness query and no stats."""
+        plugin = BigQueryWarehousePlugin()
+        plugin.read_catalog(["ds"], {"project": "proj", "api_endpoint": "http://localhost"})
+        self.client.query.assert_not_called()
+        self.assertIsNone(plugin.cache_stats)
@@ -0,0 +1,74 @@
+"""Unit tests for the BigQuery client pool."""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from dbt_helpers_wh_bigquery.client_pool import ClientPool
+from dbt_helpers_wh_bigquery.plugin import BigQueryWarehousePlugin
+
+
+@patch("dbt_helpers_wh_bigquery.client_pool.bigquery.Client")
+@patch("dbt_helpers_wh_bigquery.client_pool.get_credentials")
+class TestClientPool(unittest.TestCase):
+    """Tests for ClientPool."""
+
+    def test_reuses_client_and_credentials(self, mock_get_credentials, mock_client_cls):
+        """The same connection config resolves credentials and builds a client once."""
+        mock_client_cls.side_effect = lambda **_: MagicMock()
+        pool = ClientPool()
+        config = {"project": "proj", "impersonate_service_account": "sa@proj.iam.gserviceaccount.com"}
+
+        first = pool.get_client(config, pool_size=8)
+        second = pool.get_client(dict(config), pool_size=8)
+
+        self.assertIs(first, second)
+        mock_get_credentials.assert_called_once_with(config)
+        mock_client_cls.assert_called_once()
+
+    def test_shares_credentials_across_projects(self, mock_get_credentials, mock_client_cls):
+        """Clients for different projects with the same auth config share credentials."""
+        mock_client_cls.side_effect = lambda **_: MagicMock()
+        pool = ClientPool()
+
+        first = pool.get_client({"project": "a"}, pool_size=8)
+        second = pool.get_client({"project": "b"}, pool_size=8)
+
+        self.assertIsNot(first, second)
+        mock_get_credentials.assert_called_once()
+        creds = [c.kwargs["credentials"] for c in mock_client_cls.call_args_list]
+        self.assertIs(creds[0], creds[1])
+
+    def test_session_sized_to_concurrency(self, mock_get_credentials, mock_client_cls):  # noqa: ARG002  # pylint: disable=unused-argument
+        """The authorized HTTP session's connection pool matches the worker count."""
+        pool = ClientPool()
+        pool.get_client({"project": "proj"}, pool_size=32)
+
+        session = mock_client_cls.call_args.kwargs["_http"]
+        adapter = session.get_adapter("https://bigquery.googleapis.com")
+        self.assertEqual(adapter._pool_maxsize, 32)  # pylint: disable=protected-access
+
+    def test_close_forgets_clients(self, mock_get_credentials, mock_client_cls):
+        """close() drops pooled clients so the next call builds a new one."""
+        mock_client_cls.side_effect = lambda **_: MagicMock()
+        pool = ClientPool()
+        first = pool.get_client({"project": "proj"}, pool_size=8)
+        pool.close()
+        second = pool.get_client({"project": "proj"}, pool_size=8)
+        self.assertIsNot(first, second)
+        self.assertEqual(mock_get_credentials.call_count, 2)
+
+
+class TestPluginClientReuse(unittest.TestCase):
+    """read_catalog reuses pooled clients across calls."""
+
+    @patch("dbt_helpers_wh_bigquery.client_pool.bigquery.Client")
+    def test_repeated_reads_build_one_client(self, mock_client_cls):
+        """Several read_catalog calls with the same config construct a single client."""
+        mock_client_cls.return_value.list_tables.return_value = []
+        plugin = BigQueryWarehousePlugin()
+        config = {"project": "proj", "api_endpoint": "http://localhost"}
+
+        plugin.read_catalog(["ds"], config)
+        plugin.read_catalog(["ds"], config)
+
+        mock_client_cls.assert_called_once()
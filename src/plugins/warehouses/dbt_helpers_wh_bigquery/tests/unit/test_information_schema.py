@@ -0,0 +1,301 @@
+"""Unit tests for the INFORMATION_SCHEMA catalog mode."""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from google.cloud import bigquery
+from google.cloud.bigquery.schema import FieldElementType, PolicyTagList, SchemaField
+
+from dbt_helpers_sdk import schema_fingerprint
+from dbt_helpers_wh_bigquery.information_schema import (
+    assemble_relations,
+    normalize_type,
+    parse_labels_option,
+    parse_partitioning,
+    parse_string_option,
+    quote_identifier,
+)
+from dbt_helpers_wh_bigquery.plugin import (
+    BigQueryWarehousePlugin,
+    _extract_partitioning,
+    _map_to_sql_type,
+    _resolve_catalog_mode,
+)
+
+
+def _column_row(table_name, column_name, position, data_type, **kwargs):
+    row = {
+        "table_schema": "ds",
+        "table_name": table_name,
+        "column_name": column_name,
+        "ordinal_position": position,
+        "is_nullable": "YES",
+        "data_type": data_type,
+        "clustering_ordinal_position": None,
+        "description": None,
+        "policy_tags": [],
+    }
+    row.update(kwargs)
+    return row
+
+
+class TestNormalizeType(unittest.TestCase):
+    """normalize_type must agree with _map_to_sql_type for the same schema."""
+
+    def test_matches_schema_field_mapping(self):
+        """INFORMATION_SCHEMA type strings normalize to the get_table representation."""
+        cases = [
+            (SchemaField("s", "STRING", max_length=10), "STRING(10)"),
+            (SchemaField("n", "NUMERIC", precision=10, scale=2), "NUMERIC(10, 2)"),
+            (SchemaField("n", "BIGNUMERIC", precision=20), "BIGNUMERIC(20)"),
+            (SchemaField("a", "STRING", mode="REPEATED"), "ARRAY<STRING>"),
+            (SchemaField("r", "RANGE", range_element_type=FieldElementType("DATE")), "RANGE<DATE>"),
+            (
+                SchemaField(
+                    "rec",
+                    "RECORD",
+                    mode="REPEATED",
+                    fields=[
+                        SchemaField("x", "FLOAT64", mode="REQUIRED"),
+                        SchemaField(
+                            "inner", "RECORD", fields=[SchemaField("tags", "STRING", mode="REPEATED")]
+                        ),
+                    ],
+                ),
+                "ARRAY<STRUCT<x FLOAT64 NOT NULL, inner STRUCT<tags ARRAY<STRING>>>>",
+            ),
+        ]
+        for field, information_schema_type in cases:
+            self.assertEqual(normalize_type(information_schema_type), _map_to_sql_type(field))
+
+    def test_strips_field_options_and_quotes(self):
+        """Field OPTIONS, backquoted names and irregular spacing are normalized away."""
+        self.assertEqual(
+            normalize_type('STRUCT<`from` STRING OPTIONS(description="a, <b>"),b  NUMERIC( 5 ,1 )>'),
+            "STRUCT<from STRING, b NUMERIC(5, 1)>",
+        )
+
+    def test_invalid_type_raises(self):
+        """Unbalanced types raise ValueError."""
+        with self.assertRaises(ValueError):
+            normalize_type("STRUCT<a INT64")
+
+
+class TestOptionParsing(unittest.TestCase):
+    """Tests for TABLE_OPTIONS and DDL parsing helpers."""
+
+    def test_string_option(self):
+        """String literals are unquoted and unescaped."""
+        self.assertEqual(parse_string_option('"say \\"hi\\"\\nbye"'), 'say "hi"\nbye')
+        self.assertIsNone(parse_string_option(None))
+
+    def test_labels_option(self):
+        """Label arrays become dicts."""
+        self.assertEqual(
+            parse_labels_option('[STRUCT("env", "prod"), STRUCT("team", "data")]'),
+            {"env": "prod", "team": "data"},
+        )
+        self.assertEqual(parse_labels_option(None), {})
+
+    def test_quote_identifier_rejects_backticks(self):
+        """Identifiers containing backticks are rejected."""
+        self.assertEqual(quote_identifier("my-proj", "ds"), "`my-proj`.`ds`")
+        with self.assertRaises(ValueError):
+            quote_identifier("proj", "ds`; DROP")
+
+    def test_partitioning_matches_table_objects(self):
+        """DDL-derived partitioning matches _extract_partitioning on equivalent tables."""
+        day_table = bigquery.Table("p.d.t")
+        day_table.time_partitioning = bigquery.TimePartitioning(field="ts", expiration_ms=2 * 86_400_000)
+        ingestion_table = bigquery.Table("p.d.t")
+        ingestion_table.time_partitioning = bigquery.TimePartitioning()
+        range_table = bigquery.Table("p.d.t")
+        range_table.range_partitioning = bigquery.RangePartitioning(
+            field="id", range_=bigquery.PartitionRange(start=0, end=100, interval=10)
+        )
+        cases = [
+            (day_table, "CREATE TABLE `p.d.t`\n(\n  ts TIMESTAMP\n)\nPARTITION BY DATE(ts)\n", "2.0"),
+            (ingestion_table, "CREATE TABLE `p.d.t`\n(\n  x INT64\n)\nPARTITION BY _PARTITIONDATE;", None),
+            (
+                range_table,
+                "CREATE TABLE `p.d.t`\n(\n  id INT64\n)\nPARTITION BY RANGE_BUCKET(id, GENERATE_ARRAY(0, 100, 10))\nCLUSTER BY id;",
+                None,
+            ),
+            (bigquery.Table("p.d.t"), "CREATE TABLE `p.d.t`\n(\n  x INT64\n);", None),
+            # A line of a query body is not a table clause
+            (bigquery.Table("p.d.t"), "CREATE VIEW `p.d.t`\nAS SELECT\n  SUM(x) OVER (\nPARTITION BY y)\nFROM t", None),
+        ]
+        for table, ddl, expiration_days in cases:
+            self.assertEqual(parse_partitioning(ddl, expiration_days), _extract_partitioning(table), msg=ddl)
+
+
+class TestAssembleRelations(unittest.TestCase):
+    """Tests for assembling CatalogRelations from INFORMATION_SCHEMA rows."""
+
+    def test_matches_get_table_mapping(self):
+        """Assembled relation equals the one produced from the equivalent Table object."""
+        table = bigquery.Table("proj.ds.events")
+        table.description = "Event log"
+        table.labels = {"env": "prod"}
+        table.clustering_fields = ["user_id", "kind"]
+        table.time_partitioning = bigquery.TimePartitioning(field="ts")
+        table.schema = [
+            SchemaField("ts", "TIMESTAMP", mode="REQUIRED", description="Event time"),
+            SchemaField("kind", "STRING", policy_tags=PolicyTagList(names=["projects/p/taxonomies/1/policyTags/2"])),
+            SchemaField("user_id", "INT64"),
+            SchemaField("props", "RECORD", mode="REPEATED", fields=[SchemaField("k", "STRING")]),
+        ]
+        expected = BigQueryWarehousePlugin()._map_table(table, "proj", "ds")
+
+        relations = assemble_relations(
+            "proj",
+            table_rows=[
+                {
+                    "table_schema": "ds",
+                    "table_name": "events",
+                    "table_type": "BASE TABLE",
+                    "ddl": "CREATE TABLE `proj.ds.events`\n(\n  ts TIMESTAMP NOT NULL\n)\nPARTITION BY DATE(ts)\nCLUSTER BY user_id, kind;",
+                }
+            ],
+            column_rows=[
+                _column_row("events", "ts", 1, "TIMESTAMP", is_nullable="NO", description="Event time"),
+                _column_row(
+                    "events",
+                    "kind",
+                    2,
+                    "STRING",
+                    clustering_ordinal_position=2,
+                    policy_tags=["projects/p/taxonomies/1/policyTags/2"],
+                ),
+                _column_row("events", "user_id", 3, "INT64", clustering_ordinal_position=1),
+                _column_row("events", "props", 4, "ARRAY<STRUCT<k STRING>>", is_nullable="NO"),
+            ],
+            option_rows=[
+                {"table_schema": "ds", "table_name": "events", "option_name": "description", "option_value": '"Event log"'},
+                {"table_schema": "ds", "table_name": "events", "option_name": "labels", "option_value": '[STRUCT("env", "prod")]'},
+            ],
+        )
+
+        self.assertEqual(relations, [expected])
+        # Fingerprints agree across catalog modes
+        self.assertEqual(relations[0].fingerprint, schema_fingerprint(expected.columns))
+
+    def test_view_without_columns_or_options(self):
+        """Views map to kind 'view', tolerate missing column/option rows and get no partitioning from their query."""
+        ddl = "CREATE VIEW `proj.ds.v`\nAS SELECT\n  ROW_NUMBER() OVER (\nPARTITION BY user_id\n) AS n\nFROM `proj.ds.t`"
+        relations = assemble_relations(
+            "proj",
+            [{"table_schema": "ds", "table_name": "v", "table_type": "VIEW", "ddl": ddl}],
+            [],
+            [],
+        )
+        self.assertEqual(relations[0].kind, "view")
+        self.assertEqual(relations[0].columns, [])
+        self.assertEqual(relations[0].metadata, {"description": None})
+
+
+class TestInformationSchemaCatalogMode(unittest.TestCase):
+    """Tests for read_catalog with catalog_mode=information_schema."""
+
+    def test_resolve_catalog_mode(self):
+        """Defaults to api and rejects unknown modes."""
+        self.assertEqual(_resolve_catalog_mode({}), "api")
+        self.assertEqual(_resolve_catalog_mode({"catalog_mode": "information_schema"}), "information_schema")
+        with self.assertRaises(ValueError):
+            _resolve_catalog_mode({"catalog_mode": "magic"})
+
+    @patch("dbt_helpers_wh_bigquery.plugin.bigquery.Client")
+    def test_issues_fixed_queries_per_dataset(self, mock_client_cls):
+        """Three queries per dataset, no get_table calls, relations in scope order."""
+        client = mock_client_cls.return_value
+
+        def query(sql, job_config=None, location=None):  # noqa: ARG001  # pylint: disable=unused-argument
+            dataset_id = "ds1" if "`proj`.`ds1`" in sql else "ds2"
+            rows: list[dict] = []
+            if "INFORMATION_SCHEMA.TABLES" in sql:
+                rows = [{"table_schema": dataset_id, "table_name": f"{dataset_id}_t", "table_type": "BASE TABLE", "ddl": ""}]
+            elif "INFORMATION_SCHEMA.COLUMNS" in sql:
+                rows = [
+                    {**_column_row(f"{dataset_id}_t", "id", 1, "INT64"), "table_schema": dataset_id},
+                ]
+            job = MagicMock()
+            job.result.return_value = rows
+            return job
+
+        client.query.side_effect = query
+        plugin = BigQueryWarehousePlugin()
+        relations = plugin.read_catalog(
+            ["ds1", "ds2"],
+            {"project": "proj", "api_endpoint": "http://localhost", "catalog_mode": "information_schema"},
+        )
+
+        self.assertEqual([r.full_name for r in relations], ["proj.ds1.ds1_t", "proj.ds2.ds2_t"])
+        self.assertEqual(relations[0].columns[0].data_type, "INT64")
+        self.assertEqual(client.query.call_count, 6)
+        client.get_table.assert_not_called()
+        client.list_tables.assert_not_called()
+
+
+class TestRegionCatalogMode(unittest.TestCase):
+    """Tests for read_catalog with catalog_mode=information_schema_region."""
+
+    @staticmethod
+    def _query(calls):
+        def query(sql, job_config=None, location=None):
+            calls.append((sql, job_config, location))
+            datasets = job_config.query_parameters[0].values
+            rows: list[dict] = []
+            if "INFORMATION_SCHEMA.TABLES" in sql:
+                # Region views return rows for every requested dataset at once
+                rows = [
+                    {"table_schema": ds, "table_name": "t", "table_type": "BASE TABLE", "ddl": ""}
+                    for ds in sorted(datasets)
+                    if ds != "empty"
+                ]
+            job = MagicMock()
+            job.result.return_value = rows
+            return job
+
+        return query
+
+    @patch("dbt_helpers_wh_bigquery.plugin.bigquery.Client")
+    def test_groups_by_project_with_configured_location(self, mock_client_cls):
+        """One set of region queries per project; relations keep scope order."""
+        client = mock_client_cls.return_value
+        calls: list = []
+        client.query.side_effect = self._query(calls)
+
+        relations = BigQueryWarehousePlugin().read_catalog(
+            ["ds_b", "ds_a", "empty", "other.ds_c"],
+            {
+                "project": "proj",
+                "api_endpoint": "http://localhost",
+                "catalog_mode": "information_schema_region",
+                "location": "EU",
+            },
+        )
+
+        self.assertEqual([r.full_name for r in relations], ["proj.ds_b.t", "proj.ds_a.t", "other.ds_c.t"])
+        self.assertEqual(len(calls), 6)
+        proj_calls = [c for c in calls if "`proj`.`region-eu`" in c[0]]
+        self.assertEqual(len(proj_calls), 3)
+        self.assertEqual(proj_calls[0][1].query_parameters[0].values, ["ds_b", "ds_a", "empty"])
+        self.assertTrue(all(location == "EU" for _, _, location in calls))
+        client.get_dataset.assert_not_called()
+
+    @patch("dbt_helpers_wh_bigquery.plugin.bigquery.Client")
+    def test_resolves_locations_when_not_configured(self, mock_client_cls):
+        """Dataset locations are looked up and datasets split into per-region groups."""
+        client = mock_client_cls.return_value
+        calls: list = []
+        client.query.side_effect = self._query(calls)
+        client.get_dataset.side_effect = lambda ref: MagicMock(location="US" if ref.dataset_id == "us_ds" else "asia-northeast1")
+
+        relations = BigQueryWarehousePlugin().read_catalog(
+            ["us_ds", "tokyo_ds"],
+            {"project": "proj", "api_endpoint": "http://localhost", "catalog_mode": "information_schema_region"},
+        )
+
+        self.assertEqual([r.full_name for r in relations], ["proj.us_ds.t", "proj.tokyo_ds.t"])
+        qualifiers = {sql.split("FROM ")[1].split(".INFORMATION_SCHEMA")[0] for sql, _, _ in calls}
+        self.assertEqual(qualifiers, {"`proj`.`region-us`", "`proj`.`region-asia-northeast1`"})
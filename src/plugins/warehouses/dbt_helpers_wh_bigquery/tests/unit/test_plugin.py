@@ -1,7 +1,9 @@
 """Unit tests for BigQuery plugin."""
 
+import threading
+import time
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from google.cloud.bigquery.schema import FieldElementType, SchemaField
 
@@ -9,27 +11,10 @@ from dbt_helpers_sdk import CatalogColumn
 from dbt_helpers_wh_bigquery.plugin import (
     BigQueryWarehousePlugin,
     _map_schema_field,
-    _parse_scope_item,
+    _resolve_max_workers,
 )
 
 
-class TestParseScopeItem(unittest.TestCase):
-    """Tests for _parse_scope_item."""
-
-    def test_dot_separated_returns_project_dataset(self):
-        """Scope 'proj.ds' returns (proj, ds)."""
-        self.assertEqual(_parse_scope_item("proj.ds", None), ("proj", "ds"))
-
-    def test_single_part_uses_default_project(self):
-        """Scope 'ds' with default_project returns (default, ds)."""
-        self.assertEqual(_parse_scope_item("ds", "my-project"), ("my-project", "ds"))
-
-    def test_single_part_no_project_raises(self):
-        """Scope 'ds' without default_project raises ValueError."""
-        with self.assertRaises(ValueError):
-            _parse_scope_item("ds", None)
-
-
 class TestMapSchemaField(unittest.TestCase):
     """Tests for _map_schema_field."""
 
@@ -146,3 +131,115 @@ class TestBigQueryPlugin(unittest.TestCase):
         """Plugin can be instantiated."""
         plugin = BigQueryWarehousePlugin()
         self.assertIsNotNone(plugin)
+
+
+def _fake_table(table_id: str) -> MagicMock:
+    """Build a minimal BigQuery Table double."""
+    table = MagicMock()
+    table.table_id = table_id
+    table.table_type = "TABLE"
+    table.schema = [SchemaField("id", "INT64", mode="REQUIRED")]
+    table.description = None
+    table.labels = {}
+    table.time_partitioning = None
+    table.range_partitioning = None
+    table.clustering_fields = None
+    return table
+
+
+class TestResolveMaxWorkers(unittest.TestCase):
+    """Tests for _resolve_max_workers."""
+
+    def test_default(self):
+        """Falls back to the default pool size."""
+        self.assertEqual(_resolve_max_workers({}), 8)
+
+    def test_configured(self):
+        """Uses connection_config['max_workers'] when set."""
+        self.assertEqual(_resolve_max_workers({"max_workers": 32}), 32)
+
+    def test_invalid_raises(self):
+        """Non-positive or non-integer values raise ValueError."""
+        for value in (0, -1, "4", 2.5, True):
+            with self.assertRaises(ValueError, msg=f"value={value!r}"):
+                _resolve_max_workers({"max_workers": value})
+
+
+class TestReadCatalogConcurrency(unittest.TestCase):
+    """Tests for the concurrent get_table fan-out in read_catalog."""
+
+    def _mock_client(self, tables_by_dataset: dict[str, list[str]], delays: dict[str, float]) -> MagicMock:
+        client = MagicMock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        lock = threading.Lock()
+
+        def list_tables(dataset_ref, **_):
+            return [
+                MagicMock(reference=(dataset_ref.dataset_id, table_id))
+                for table_id in tables_by_dataset[dataset_ref.dataset_id]
+            ]
+
+        def get_table(reference, **_):
+            with lock:
+                self.in_flight += 1
+                self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            time.sleep(delays.get(reference[1], 0.0))
+            with lock:
+                self.in_flight -= 1
+            return _fake_table(reference[1])
+
+        client.list_tables.side_effect = list_tables
+        client.get_table.side_effect = get_table
+        return client
+
+    @patch("dbt_helpers_wh_bigquery.plugin.bigquery.Client")
+    def test_output_order_is_deterministic(self, mock_client_cls):
+        """Relations follow scope then listing order even when fetches finish out of order."""
+        mock_client_cls.return_value = self._mock_client(
+            {"ds1": ["a", "b", "c"], "ds2": ["d", "e"]},
+            delays={"a": 0.05, "b": 0.03, "d": 0.02},
+        )
+        plugin = BigQueryWarehousePlugin()
+        relations = plugin.read_catalog(
+            ["ds1", "ds2"], {"project": "proj", "api_endpoint": "http://localhost", "max_workers": 4}
+        )
+        self.assertEqual([r.name for r in relations], ["a", "b", "c", "d", "e"])
+        self.assertEqual(relations[3].namespace.parts, ["proj", "ds2"])
+        self.assertEqual(relations[0].dbt_name, "proj__ds1__a")
+
+    @patch("dbt_helpers_wh_bigquery.plugin.bigquery.Client")
+    def test_concurrency_is_bounded(self, mock_client_cls):
+        """No more than max_workers get_table calls run at once."""
+        table_ids = [f"t{i}" for i in range(12)]
+        mock_client_cls.return_value = self._mock_client(
+            {"ds": table_ids}, delays=dict.fromkeys(table_ids, 0.02)
+        )
+        plugin = BigQueryWarehousePlugin()
+        relations = plugin.read_catalog(["ds"], {"project": "proj", "api_endpoint": "http://localhost", "max_workers": 3})
+        self.assertEqual(len(relations), 12)
+        self.assertLessEqual(self.max_in_flight, 3)
+        self.assertGreater(self.max_in_flight, 1)
+
+    @patch("dbt_helpers_wh_bigquery.plugin.bigquery.Client")
+    def test_iter_catalog_yields_before_later_fetches_finish(self, mock_client_cls):
+        """iter_catalog yields ready relations while later get_table calls are still running."""
+        release = threading.Event()
+        client = self._mock_client({"ds1": ["a"], "ds2": ["b"]}, delays={})
+        fast_get_table = client.get_table.side_effect
+
+        def get_table(reference, **kwargs):
+            if reference[1] == "b":
+                release.wait(timeout=5)
+            return fast_get_table(reference, **kwargs)
+
+        client.get_table.side_effect = get_table
+        mock_client_cls.return_value = client
+        plugin = BigQueryWarehousePlugin()
+
+        stream = plugin.iter_catalog(["ds1", "ds2"], {"project": "proj", "api_endpoint": "http://localhost"})
+        self.assertEqual(next(stream).name, "a")
+        self.assertFalse(release.is_set())
+        release.set()
+        self.assertEqual([r.name for r in stream], ["b"])
+        self.assertIsNotNone(plugin.request_stats)
@@ -0,0 +1,212 @@
+"""Unit tests for BigQuery request rate limiting and retries."""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+import requests
+from google.api_core import exceptions
+from google.auth import exceptions as auth_exceptions
+
+from dbt_helpers_wh_bigquery.plugin import BigQueryWarehousePlugin
+from dbt_helpers_wh_bigquery.rate_limit import (
+    AdaptiveConcurrency,
+    RateLimitSettings,
+    RequestScheduler,
+    TokenBucket,
+    is_retryable,
+    is_throttled,
+    settings_for_project,
+)
+
+
+class FakeClock:
+    """Deterministic clock whose sleep advances time."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _rate_limited() -> exceptions.Forbidden:
+    return exceptions.Forbidden("Exceeded rate limits", errors=[{"reason": "rateLimitExceeded"}])
+
+
+class TestErrorClassification(unittest.TestCase):
+    """Tests for is_throttled and is_retryable."""
+
+    def test_throttled(self):
+        """429 and 403 rateLimitExceeded are throttling; other 403s are not."""
+        self.assertTrue(is_throttled(exceptions.TooManyRequests("slow down")))
+        self.assertTrue(is_throttled(_rate_limited()))
+        self.assertFalse(is_throttled(exceptions.Forbidden("denied", errors=[{"reason": "accessDenied"}])))
+
+    def test_retryable(self):
+        """Throttling and transient server errors are retried; client errors are not."""
+        self.assertTrue(is_retryable(exceptions.ServiceUnavailable("unavailable")))
+        self.assertTrue(is_retryable(exceptions.InternalServerError("oops")))
+        self.assertTrue(is_retryable(ConnectionError()))
+        self.assertTrue(is_retryable(requests.exceptions.ConnectionError("reset")))
+        self.assertTrue(is_retryable(requests.exceptions.ChunkedEncodingError("truncated")))
+        self.assertTrue(is_retryable(requests.exceptions.ReadTimeout("slow")))
+        self.assertTrue(is_retryable(auth_exceptions.TransportError("token refresh failed")))
+        self.assertFalse(is_retryable(requests.exceptions.SSLError("bad certificate")))
+        self.assertFalse(is_retryable(exceptions.NotFound("missing")))
+        self.assertFalse(is_retryable(exceptions.Forbidden("denied")))
+
+
+class TestTokenBucket(unittest.TestCase):
+    """Tests for TokenBucket."""
+
+    def test_burst_then_rate(self):
+        """The burst is free; further tokens are spaced at 1/rate."""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=10, burst=2, clock=clock, sleep=clock.sleep)
+        waits = [bucket.acquire() for _ in range(4)]
+        self.assertEqual(waits[:2], [0.0, 0.0])
+        self.assertAlmostEqual(waits[2], 0.1)
+        self.assertAlmostEqual(waits[3], 0.1)
+
+
+class TestAdaptiveConcurrency(unittest.TestCase):
+    """Tests for AdaptiveConcurrency."""
+
+    def test_aimd(self):
+        """Throttling halves the limit; successes grow it additively up to the maximum."""
+        limiter = AdaptiveConcurrency(initial=8, minimum=1, maximum=8)
+        limiter.acquire()
+        limiter.release(throttled=True)
+        self.assertEqual(limiter.limit, 4)
+        for _ in range(5):
+            limiter.acquire()
+            limiter.release()
+        self.assertEqual(int(limiter.limit), 5)
+        for _ in range(100):
+            limiter.acquire()
+            limiter.release()
+        self.assertEqual(limiter.limit, 8)
+
+    def test_minimum(self):
+        """The limit never drops below the minimum."""
+        limiter = AdaptiveConcurrency(initial=2, minimum=1, maximum=2)
+        for _ in range(5):
+            limiter.acquire()
+            limiter.release(throttled=True)
+        self.assertEqual(limiter.limit, 1)
+
+
+class TestRequestScheduler(unittest.TestCase):
+    """Tests for RequestScheduler."""
+
+    def _scheduler(self, **settings) -> tuple[RequestScheduler, FakeClock]:
+        clock = FakeClock()
+        scheduler = RequestScheduler(
+            RateLimitSettings(**settings), max_concurrency=4, clock=clock, sleep=clock.sleep, rng=lambda: 1.0
+        )
+        return scheduler, clock
+
+    def test_retries_with_exponential_backoff(self):
+        """Retryable errors are retried with doubling (jittered) backoff and counted."""
+        scheduler, clock = self._scheduler(initial_backoff=0.5)
+        fn = MagicMock(side_effect=[_rate_limited(), exceptions.ServiceUnavailable("x"), "ok"])
+
+        self.assertEqual(scheduler.call(fn, "arg"), "ok")
+        self.assertEqual(fn.call_count, 3)
+        self.assertEqual(clock.sleeps, [0.5, 1.0])
+        stats = scheduler.stats
+        self.assertEqual(stats["requests"], 3)
+        self.assertEqual(stats["retries"], 2)
+        self.assertEqual(stats["throttled"], 1)
+        # The rate limit's backoff counts as throttling, the 503's as plain backoff
+        self.assertEqual(stats["throttled_seconds"], 0.5)
+        self.assertEqual(stats["backoff_seconds"], 1.0)
+        self.assertEqual(stats["concurrency_limit"], 2)
+
+    def test_backoff_is_capped(self):
+        """Backoff never exceeds max_backoff."""
+        scheduler, clock = self._scheduler(initial_backoff=1, max_backoff=3, max_attempts=5)
+        fn = MagicMock(side_effect=[exceptions.TooManyRequests("x")] * 4 + ["ok"])
+        scheduler.call(fn)
+        self.assertEqual(clock.sleeps, [1, 2, 3, 3])
+
+    def test_gives_up_after_max_attempts(self):
+        """The last error is raised once max_attempts is reached."""
+        scheduler, _ = self._scheduler(max_attempts=3)
+        fn = MagicMock(side_effect=exceptions.TooManyRequests("x"))
+        with self.assertRaises(exceptions.TooManyRequests):
+            scheduler.call(fn)
+        self.assertEqual(fn.call_count, 3)
+
+    def test_non_retryable_raises_immediately(self):
+        """Non-retryable errors are not retried."""
+        scheduler, clock = self._scheduler()
+        fn = MagicMock(side_effect=exceptions.NotFound("missing"))
+        with self.assertRaises(exceptions.NotFound):
+            scheduler.call(fn)
+        self.assertEqual(fn.call_count, 1)
+        self.assertEqual(clock.sleeps, [])
+
+    def test_qps_limit(self):
+        """With qps set, calls beyond the burst wait for tokens."""
+        scheduler, clock = self._scheduler(qps=2, burst=1)
+        for _ in range(3):
+            scheduler.call(lambda: None)
+        self.assertEqual(clock.sleeps, [0.5, 0.5])
+        self.assertEqual(scheduler.stats["effective_qps"], 3.0)
+
+
+class TestSettingsForProject(unittest.TestCase):
+    """Tests for settings_for_project."""
+
+    def test_project_overrides(self):
+        """Per-project settings override the default rate_limit block."""
+        config = {"rate_limit": {"qps": 10, "max_attempts": 3}, "project_rate_limits": {"busy": {"qps": 2}}}
+        self.assertEqual(settings_for_project(config, "busy").qps, 2)
+        self.assertEqual(settings_for_project(config, "busy").max_attempts, 3)
+        self.assertEqual(settings_for_project(config, "other").qps, 10)
+        self.assertIsNone(settings_for_project({}, "proj").qps)
+
+
+class TestReadCatalogRetries(unittest.TestCase):
+    """read_catalog retries throttled metadata calls and reports request stats."""
+
+    @patch("dbt_helpers_wh_bigquery.rate_limit.time.sleep")
+    @patch("dbt_helpers_wh_bigquery.plugin.bigquery.Client")
+    def test_throttled_get_table_is_retried(self, mock_client_cls, mock_sleep):
+        """A 429 from get_table is retried and counted per project."""
+        client = mock_client_cls.return_value
+        client.list_tables.return_value = [MagicMock(reference="t")]
+        table = MagicMock(table_id="t", table_type="TABLE", schema=[], description=None, labels={})
+        table.time_partitioning = table.range_partitioning = table.clustering_fields = None
+        client.get_table.side_effect = [exceptions.TooManyRequests("slow down"), table]
+
+        plugin = BigQueryWarehousePlugin()
+        relations = plugin.read_catalog(["ds"], {"project": "proj", "api_endpoint": "http://localhost"})
+
+        self.assertEqual([r.name for r in relations], ["t"])
+        self.assertEqual(client.get_table.call_args.kwargs, {"retry": None})
+        mock_sleep.assert_called_once()
+        self.assertEqual(plugin.request_stats["proj"]["retries"], 1)
+        self.assertEqual(plugin.request_stats["proj"]["throttled"], 1)
+
+    @patch("dbt_helpers_wh_bigquery.rate_limit.time.sleep")
+    @patch("dbt_helpers_wh_bigquery.plugin.bigquery.Client")
+    def test_dropped_connection_is_retried(self, mock_client_cls, mock_sleep):
+        """A requests ConnectionError from list_tables is retried, not raised."""
+        client = mock_client_cls.return_value
+        client.list_tables.side_effect = [requests.exceptions.ConnectionError("connection reset"), []]
+
+        plugin = BigQueryWarehousePlugin()
+        relations = plugin.read_catalog(["ds"], {"project": "proj", "api_endpoint": "http://localhost"})
+
+        self.assertEqual(relations, [])
+        self.assertEqual(client.list_tables.call_count, 2)
+        mock_sleep.assert_called_once()
+        self.assertEqual(plugin.request_stats["proj"]["retries"], 1)
+        self.assertEqual(plugin.request_stats["proj"]["throttled"], 0)
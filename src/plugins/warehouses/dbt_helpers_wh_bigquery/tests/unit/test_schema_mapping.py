@@ -0,0 +1,148 @@
+"""Unit tests for BigQuery schema mapping."""
+
+import datetime
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from google.cloud.bigquery.schema import SchemaField
+
+from dbt_helpers_wh_bigquery.plugin import BigQueryWarehousePlugin
+from dbt_helpers_wh_bigquery.schema_mapping import SchemaMapper, resolve_column_mode
+
+
+def _field(name, field_type, mode="NULLABLE", fields=()):
+    return SimpleNamespace(
+        name=name, field_type=field_type, mode=mode, fields=list(fields), description=None, policy_tags=None
+    )
+
+
+def _event_schema() -> list[SchemaField]:
+    address = [SchemaField("city", "STRING"), SchemaField("zip", "STRING", mode="REQUIRED")]
+    return [
+        SchemaField("id", "INTEGER", mode="REQUIRED"),
+        SchemaField(
+            "user",
+            "RECORD",
+            fields=[SchemaField("home", "RECORD", fields=address), SchemaField("work", "RECORD", fields=address)],
+        ),
+        SchemaField("tags", "RECORD", mode="REPEATED", fields=[SchemaField("key", "STRING")]),
+    ]
+
+
+class TestSchemaMapper(unittest.TestCase):
+    """Tests for SchemaMapper."""
+
+    def test_nested_columns(self):
+        """Nested mode keeps one column per top-level field with full STRUCT types."""
+        columns = SchemaMapper().columns(_event_schema())
+        self.assertEqual([c.name for c in columns], ["id", "user", "tags"])
+        self.assertEqual(
+            columns[1].data_type,
+            "STRUCT<home STRUCT<city STRING, zip STRING>, work STRUCT<city STRING, zip STRING>>",
+        )
+        self.assertEqual(columns[2].data_type, "ARRAY<STRUCT<key STRING>>")
+
+    def test_identical_sub_structs_are_memoized(self):
+        """Identical STRUCT bodies resolve to one cached string, also across calls."""
+        mapper = SchemaMapper()
+        address = [_field("city", "STRING"), _field("zip", "STRING")]
+        first = mapper.sql_type(_field("home", "RECORD", fields=address))
+        second = mapper.sql_type(_field("work", "RECORD", fields=[_field("city", "STRING"), _field("zip", "STRING")]))
+        self.assertIs(first, second)
+
+    def test_deep_nesting_does_not_recurse(self):
+        """Nesting far beyond the recursion limit maps without RecursionError."""
+        resource = {"name": "leaf", "type": "INT64"}
+        for depth in range(5000):
+            resource = {"name": f"level_{depth}", "type": "RECORD", "fields": [resource]}
+        sql_type = SchemaMapper().sql_type(SchemaField.from_api_repr(resource))
+        self.assertTrue(sql_type.startswith("STRUCT<level_4998 STRUCT<"))
+        self.assertIn("leaf INT64", sql_type)
+
+    def test_field_like_objects(self):
+        """Objects that only expose SchemaField attributes map like SchemaFields."""
+        field = _field("tags", "RECORD", mode="REPEATED", fields=[_field("key", "STRING", mode="REQUIRED")])
+        columns = SchemaMapper(flatten=True).columns([field])
+        self.assertEqual([c.data_type for c in columns], ["ARRAY<STRUCT<key STRING>>", "STRING"])
+        self.assertFalse(columns[1].nullable)
+
+    def test_flattened_columns(self):
+        """Flattened mode emits dotted paths in schema order with parent references."""
+        columns = SchemaMapper(flatten=True).columns(_event_schema())
+        self.assertEqual(
+            [c.name for c in columns],
+            [
+                "id",
+                "user",
+                "user.home",
+                "user.home.city",
+                "user.home.zip",
+                "user.work",
+                "user.work.city",
+                "user.work.zip",
+                "tags",
+                "tags.key",
+            ],
+        )
+        by_name = {c.name: c for c in columns}
+        self.assertNotIn("parent", by_name["user"].metadata)
+        self.assertEqual(by_name["user.home.zip"].metadata["parent"], "user.home")
+        self.assertFalse(by_name["user.home.zip"].nullable)
+        self.assertEqual(by_name["user.home"].data_type, "STRUCT<city STRING, zip STRING>")
+        self.assertEqual(by_name["tags"].data_type, "ARRAY<STRUCT<key STRING>>")
+
+    def test_resolve_column_mode(self):
+        """Unknown column modes raise ValueError."""
+        self.assertEqual(resolve_column_mode({}), "nested")
+        self.assertEqual(resolve_column_mode({"column_mode": "flattened"}), "flattened")
+        with self.assertRaises(ValueError):
+            resolve_column_mode({"column_mode": "leaves"})
+
+
+@patch("dbt_helpers_wh_bigquery.plugin.bigquery.Client")
+class TestReadCatalogColumnMode(unittest.TestCase):
+    """read_catalog honours column_mode."""
+
+    def _client(self, mock_client_cls):
+        client = mock_client_cls.return_value
+        client.list_tables.return_value = [MagicMock(reference="events")]
+        table = MagicMock(table_id="events", table_type="TABLE", schema=_event_schema(), description=None, labels={})
+        table.time_partitioning = table.range_partitioning = table.clustering_fields = None
+        table.modified = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+        client.get_table.return_value = table
+        return client
+
+    def test_flattened_mode(self, mock_client_cls):
+        """column_mode 'flattened' yields leaf columns in api mode."""
+        self._client(mock_client_cls)
+        relations = BigQueryWarehousePlugin().read_catalog(
+            ["ds"], {"project": "proj", "api_endpoint": "http://localhost", "column_mode": "flattened"}
+        )
+        self.assertIn("user.home.city", [c.name for c in relations[0].columns])
+
+    def test_flattened_requires_api_mode(self, mock_client_cls):  # noqa: ARG002  # pylint: disable=unused-argument
+        """Flattened columns are rejected for INFORMATION_SCHEMA modes."""
+        with self.assertRaises(ValueError):
+            BigQueryWarehousePlugin().read_catalog(
+                ["ds"],
+                {"project": "proj", "catalog_mode": "information_schema", "column_mode": "flattened"},
+            )
+
+    def test_cache_is_kept_per_column_mode(self, mock_client_cls):
+        """Nested and flattened relations are cached in separate files."""
+        client = self._client(mock_client_cls)
+        client.query.return_value.result.return_value = []
+        cache_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, cache_dir)
+        config = {"project": "proj", "api_endpoint": "http://localhost", "catalog_cache_dir": str(cache_dir)}
+
+        BigQueryWarehousePlugin().read_catalog(["ds"], config)
+        BigQueryWarehousePlugin().read_catalog(["ds"], {**config, "column_mode": "flattened"})
+
+        self.assertEqual(
+            sorted(p.name for p in (cache_dir / "bigquery" / "proj").iterdir()), ["ds.flattened.json", "ds.json"]
+        )
@@ -0,0 +1,128 @@
+"""Unit tests for BigQuery scope patterns."""
+
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+from dbt_helpers_wh_bigquery.plugin import BigQueryWarehousePlugin
+from dbt_helpers_wh_bigquery.scope import (
+    DatasetSelection,
+    ScopePattern,
+    TableFilter,
+    expand_scope,
+    parse_scope_pattern,
+)
+
+
+class TestParseScopePattern(unittest.TestCase):
+    """Tests for parse_scope_pattern."""
+
+    def test_dot_separated_returns_project_dataset(self):
+        """Scope 'proj.ds' returns (proj, ds)."""
+        self.assertEqual(parse_scope_pattern("proj.ds", None), ScopePattern("proj", "ds"))
+
+    def test_single_part_uses_default_project(self):
+        """Scope 'ds' with default_project returns (default, ds)."""
+        self.assertEqual(parse_scope_pattern("ds", "my-project"), ScopePattern("my-project", "ds"))
+
+    def test_single_part_no_project_raises(self):
+        """Scope 'ds' without default_project raises ValueError."""
+        with self.assertRaises(ValueError):
+            parse_scope_pattern("ds", None)
+
+    def test_table_part(self):
+        """Scope 'proj.ds.events_*' carries a table glob."""
+        self.assertEqual(parse_scope_pattern("proj.ds.events_*", None), ScopePattern("proj", "ds", "events_*"))
+
+    def test_invalid_items_raise(self):
+        """Empty parts, too many parts and project globs raise ValueError."""
+        for item in ("proj.", "a.b.c.d", "proj..t", "proj-*.ds"):
+            with self.assertRaises(ValueError, msg=f"item={item!r}"):
+                parse_scope_pattern(item, "default")
+
+
+class TestExpandScope(unittest.TestCase):
+    """Tests for expand_scope."""
+
+    def setUp(self):
+        self.listed = {"proj": ["raw_b", "raw_a", "staging"], "other": ["x"]}
+        self.list_dataset_ids = MagicMock(side_effect=lambda project: self.listed[project])
+
+    def _expand(self, *items: str) -> list[DatasetSelection]:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            return expand_scope([parse_scope_pattern(i, "proj") for i in items], self.list_dataset_ids, executor)
+
+    def test_exact_datasets_are_not_listed(self):
+        """Scope items without globs need no list_datasets call."""
+        self.assertEqual(self._expand("ds", "other.x"), [("proj", "ds", None), ("other", "x", None)])
+        self.list_dataset_ids.assert_not_called()
+
+    def test_globs_expand_sorted_and_deduplicated(self):
+        """Dataset globs expand in sorted order, once per project, without duplicates."""
+        selections = self._expand("staging", "proj.raw_*", "proj.*", "other.*")
+        self.assertEqual(
+            [(s.project, s.dataset) for s in selections],
+            [("proj", "staging"), ("proj", "raw_a"), ("proj", "raw_b"), ("other", "x")],
+        )
+        self.assertEqual(self.list_dataset_ids.call_count, 2)
+
+    def test_table_globs_merge(self):
+        """Table globs on one dataset merge; a whole-dataset item selects all tables."""
+        self.assertEqual(self._expand("proj.ds.a_*", "proj.ds.b_*"), [("proj", "ds", ("a_*", "b_*"))])
+        self.assertEqual(self._expand("proj.ds.a_*", "ds"), [("proj", "ds", None)])
+        self.assertEqual(self._expand("ds", "proj.ds.a_*"), [("proj", "ds", None)])
+
+
+class TestTableFilter(unittest.TestCase):
+    """Tests for TableFilter."""
+
+    def test_scope_table_globs(self):
+        """Only tables matching the selection's table globs are selected."""
+        selection = DatasetSelection("proj", "ds", ("events_*",))
+        self.assertTrue(TableFilter().selects(selection, "events_2024"))
+        self.assertFalse(TableFilter().selects(selection, "users"))
+
+    def test_include_and_exclude(self):
+        """Include globs restrict, exclude globs drop; dotted globs match dataset.table."""
+        table_filter = TableFilter.from_config({"include_tables": ["fct_*", "dim_*"], "exclude_tables": ["tmp.*"]})
+        self.assertTrue(table_filter.selects(DatasetSelection("proj", "ds"), "fct_orders"))
+        self.assertFalse(table_filter.selects(DatasetSelection("proj", "ds"), "stg_orders"))
+        self.assertFalse(table_filter.selects(DatasetSelection("proj", "tmp"), "fct_orders"))
+
+    def test_invalid_config_raises(self):
+        """A bare string instead of a list raises ValueError."""
+        with self.assertRaises(ValueError):
+            TableFilter.from_config({"exclude_tables": "tmp_*"})
+
+
+class TestReadCatalogPatterns(unittest.TestCase):
+    """read_catalog expands patterns and never fetches filtered-out tables."""
+
+    @patch("dbt_helpers_wh_bigquery.plugin.bigquery.Client")
+    def test_filtered_tables_are_not_fetched(self, mock_client_cls):
+        """Only tables selected by scope and config globs reach get_table."""
+        client = mock_client_cls.return_value
+        client.list_datasets.return_value = [MagicMock(dataset_id=d) for d in ("raw_a", "raw_b", "mart")]
+        client.list_tables.side_effect = lambda ref, **_: [
+            MagicMock(table_id=t, reference=(ref.dataset_id, t)) for t in ("events", "events_tmp", "users")
+        ]
+
+        def get_table(reference, **_):
+            table = MagicMock(table_id=reference[1], table_type="TABLE", schema=[], description=None, labels={})
+            table.time_partitioning = table.range_partitioning = table.clustering_fields = None
+            return table
+
+        client.get_table.side_effect = get_table
+
+        plugin = BigQueryWarehousePlugin()
+        relations = plugin.read_catalog(
+            ["proj.raw_*.events*", "mart"],
+            {"project": "proj", "api_endpoint": "http://localhost", "exclude_tables": ["*_tmp"]},
+        )
+
+        self.assertEqual(
+            [(r.namespace.parts[1], r.name) for r in relations],
+            [("raw_a", "events"), ("raw_b", "events"), ("mart", "events"), ("mart", "users")],
+        )
+        self.assertEqual(client.get_table.call_count, 4)
+        client.list_datasets.assert_called_once_with("proj", retry=None)
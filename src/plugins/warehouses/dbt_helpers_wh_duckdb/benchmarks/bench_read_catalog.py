@@ -0,0 +1,138 @@
+"""Benchmark DuckDB read_catalog on a database with many tables.
+
+Compares the former per-schema implementation (two information_schema queries per
+schema, fetched as row tuples; kept here as a reference) with the plugin's single
+query, fetched through Arrow and, with pyarrow hidden, as row tuples.
+
+The database is generated on first use and reused afterwards.
+
+Usage:
+    uv run python benchmarks/bench_read_catalog.py --tables 20000 --schemas 20
+    uv run python benchmarks/bench_read_catalog.py --db /tmp/catalog_20k.duckdb --skip-reference
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import duckdb
+
+from dbt_helpers_sdk import CatalogColumn, CatalogNamespace, CatalogRelation
+from dbt_helpers_wh_duckdb.plugin import DuckDBWarehousePlugin
+
+_COLUMN_TYPES = ("INTEGER", "VARCHAR", "DOUBLE", "TIMESTAMP", "STRUCT(k VARCHAR, v INTEGER[])", "BOOLEAN")
+
+
+def create_database(path: Path, n_tables: int, n_schemas: int, n_columns: int) -> None:
+    """Create n_tables tables spread round-robin over n_schemas schemas."""
+    conn = duckdb.connect(str(path))
+    try:
+        conn.execute("BEGIN")
+        for s in range(n_schemas):
+            conn.execute(f"CREATE SCHEMA schema_{s:03d}")
+        for t in range(n_tables):
+            columns = ", ".join(
+                f"col_{c} {_COLUMN_TYPES[(t + c) % len(_COLUMN_TYPES)]}{' NOT NULL' if c == 0 else ''}"
+                for c in range(n_columns)
+            )
+            conn.execute(f"CREATE TABLE schema_{t % n_schemas:03d}.table_{t:06d} ({columns})")
+        conn.execute("COMMIT")
+    finally:
+        conn.close()
+
+
+def reference_read_catalog(db_path: str, scope: list[str]) -> list[CatalogRelation]:
+    """The per-schema implementation the single-pass query replaced."""
+    relations = []
+    conn = duckdb.connect(db_path)
+    try:
+        for schema in scope:
+            cols_data = conn.execute(
+                """
+                SELECT table_name, column_name, data_type, is_nullable
+                FROM information_schema.columns
+                WHERE table_schema = ?
+                ORDER BY table_name, ordinal_position
+                """,
+                [schema],
+            ).fetchall()
+            table_to_cols: dict[str, list[CatalogColumn]] = {}
+            for table_name, col_name, data_type, is_nullable in cols_data:
+                table_to_cols.setdefault(table_name, []).append(
+                    CatalogColumn(name=col_name, data_type=data_type, nullable=is_nullable == "YES")
+                )
+            tables = conn.execute(
+                "SELECT table_name, table_type FROM information_schema.tables WHERE table_schema = ?", [schema]
+            ).fetchall()
+            for table_name, table_type in tables:
+                kind = "table" if table_type == "BASE TABLE" else "view"
+                relations.append(
+                    CatalogRelation(
+                        namespace=CatalogNamespace(parts=[schema]),
+                        name=table_name,
+                        kind=kind,
+                        columns=table_to_cols.get(table_name, []),
+                        dbt_name=f"{schema}__{table_name}",
+                        metadata={"description": None},
+                    )
+                )
+    finally:
+        conn.close()
+    return relations
+
+
+def _without_pyarrow(fn: Callable[[], Any]) -> Callable[[], Any]:
+    def run() -> Any:
+        with patch.dict(sys.modules, {"pyarrow": None}):
+            return fn()
+
+    return run
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--db", type=Path, help="Database path (default: a file in the temp directory)")
+    parser.add_argument("--tables", type=int, default=20_000)
+    parser.add_argument("--schemas", type=int, default=20)
+    parser.add_argument("--columns", type=int, default=12, help="Columns per table")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--skip-reference", action="store_true", help="Do not time the former implementation")
+    args = parser.parse_args()
+
+    db_path = args.db or Path(tempfile.gettempdir()) / f"dbt_helpers_bench_{args.tables}x{args.columns}.duckdb"
+    if not db_path.exists():
+        print(f"Creating {db_path} ...")
+        create_database(db_path, args.tables, args.schemas, args.columns)
+    scope = [f"schema_{s:03d}" for s in range(args.schemas)]
+    plugin = DuckDBWarehousePlugin(db_path=str(db_path))
+    config = {"db_path": str(db_path)}
+
+    runs: dict[str, Callable[[], list[CatalogRelation]]] = {}
+    if not args.skip_reference:
+        runs["per-schema (reference)"] = lambda: reference_read_catalog(str(db_path), scope)
+    runs["single query, arrow"] = lambda: plugin.read_catalog(scope, config)
+    runs["single query, rows"] = _without_pyarrow(lambda: plugin.read_catalog(scope, config))
+
+    print(f"{args.tables} tables x {args.columns} columns in {args.schemas} schemas")
+    start = time.perf_counter()
+    duckdb.connect(str(db_path)).close()
+    print(f"{'open database only':>24}: {time.perf_counter() - start:7.2f} s")
+    baseline = None
+    for name, fn in runs.items():
+        best = float("inf")
+        n_relations = 0
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            n_relations = len(fn())
+            best = min(best, time.perf_counter() - start)
+        baseline = baseline or best
+        print(f"{name:>24}: {best:7.2f} s  {baseline / best:5.1f}x  ({n_relations} relations)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Benchmark DuckDB read_catalog over many database files.
+
+Compares the attached session (every file ATTACHed into one connection and read by
+one query) with worker processes (`processes`, one file per task, rows merged in the
+parent), and prints the slowest files of the last process-pool read.
+
+The databases are generated on first use and reused afterwards.
+
+Usage:
+    uv run python benchmarks/bench_read_files.py --files 60 --tables 500 --processes 8
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from bench_read_catalog import create_database
+
+from dbt_helpers_wh_duckdb.plugin import DuckDBWarehousePlugin
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dir", type=Path, help="Directory of the databases (default: in the temp directory)")
+    parser.add_argument("--files", type=int, default=60)
+    parser.add_argument("--tables", type=int, default=500, help="Tables per file")
+    parser.add_argument("--schemas", type=int, default=5, help="Schemas per file")
+    parser.add_argument("--columns", type=int, default=12, help="Columns per table")
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    db_dir = args.dir or Path(tempfile.gettempdir()) / f"dbt_helpers_files_{args.files}x{args.tables}x{args.columns}"
+    if len(list(db_dir.glob("*.duckdb"))) != args.files:
+        print(f"Creating {args.files} databases in {db_dir} ...")
+        shutil.rmtree(db_dir, ignore_errors=True)
+        db_dir.mkdir(parents=True)
+        for f in range(args.files):
+            create_database(db_dir / f"domain_{f:03d}.duckdb", args.tables, args.schemas, args.columns)
+    scope = [f"schema_{s:03d}" for s in range(args.schemas)]
+    config = {"db_paths": [str(db_dir / "*.duckdb")]}
+    plugin = DuckDBWarehousePlugin()
+
+    def read(processes: int) -> Callable[[], int]:
+        def run() -> int:
+            try:
+                return len(plugin.read_catalog(scope, {**config, "processes": processes}))
+            finally:
+                # Release the attached session so every run opens the files again
+                plugin.close()
+
+        return run
+
+    runs = {"attached session": read(1), f"{args.processes} processes": read(args.processes)}
+
+    print(f"{args.files} files x {args.tables} tables x {args.columns} columns")
+    baseline = None
+    for name, fn in runs.items():
+        best = float("inf")
+        n_relations = 0
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            n_relations = fn()
+            best = min(best, time.perf_counter() - start)
+        baseline = baseline or best
+        print(f"{name:>24}: {best:7.2f} s  {baseline / best:5.1f}x  ({n_relations} relations)")
+
+    print("slowest files of the last read:")
+    by_time = sorted(plugin.file_stats.items(), key=lambda item: item[1]["seconds"], reverse=True)
+    for path, stats in by_time[:5]:
+        print(f"{Path(path).name:>24}: {stats['seconds']:7.2f} s  ({stats['relations']} relations)")
+
+
+if __name__ == "__main__":
+    main()
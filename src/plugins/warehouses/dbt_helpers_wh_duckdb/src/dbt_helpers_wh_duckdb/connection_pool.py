@@ -0,0 +1,77 @@
+"""Reusable read-only DuckDB connections for repeated catalog reads in one process."""
+
+import threading
+from pathlib import Path
+from typing import Any
+
+import duckdb
+
+from dbt_helpers_sdk.database_files import attach_aliases, quote_identifier
+
+_MEMORY = ":memory:"
+
+
+def _quote_literal(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _fingerprint(path: str) -> tuple[Any, ...]:
+    """Size and mtime of a database file and its write-ahead log; changes when a writer commits."""
+    if path == _MEMORY:
+        return (path,)
+    stats: list[tuple[int, int] | None] = []
+    for file in (Path(path), Path(f"{path}.wal")):
+        try:
+            stat = file.stat()
+            stats.append((stat.st_mtime_ns, stat.st_size))
+        except FileNotFoundError:
+            stats.append(None)
+    return (path, *stats)
+
+
+class ConnectionPool:
+    """Thread-safe pool of read-only DuckDB connections keyed by the set of database files.
+
+    A single file is opened directly; several files are ATTACHed into one in-memory
+    session under their file stems. A pooled connection is reopened when any of its
+    files was replaced or rewritten on disk, which closes cursors still open on the
+    previous connection. Callers should query through `cursor()` so concurrent reads
+    do not share one connection.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._connections: dict[tuple[str, ...], tuple[tuple[Any, ...], duckdb.DuckDBPyConnection]] = {}
+
+    def get_connection(self, db_paths: list[str]) -> duckdb.DuckDBPyConnection:
+        """Return a connection covering db_paths, opening it on first use or after a file changed."""
+        key = tuple(db_paths)
+        fingerprint = tuple(_fingerprint(path) for path in db_paths)
+        with self._lock:
+            pooled = self._connections.get(key)
+            if pooled is not None and pooled[0] == fingerprint:
+                return pooled[1]
+            if pooled is not None:
+                pooled[1].close()
+            conn = self._connect(db_paths)
+            self._connections[key] = (fingerprint, conn)
+            return conn
+
+    @staticmethod
+    def _connect(db_paths: list[str]) -> duckdb.DuckDBPyConnection:
+        if len(db_paths) == 1:
+            path = db_paths[0]
+            conn = duckdb.connect(path, read_only=path != _MEMORY)
+        else:
+            conn = duckdb.connect(_MEMORY)
+            for path, alias in zip(db_paths, attach_aliases(db_paths), strict=True):
+                # ATTACH takes no query parameters
+                conn.execute(f"ATTACH {_quote_literal(path)} AS {quote_identifier(alias)} (READ_ONLY)")
+        return conn
+
+    def close(self) -> None:
+        """Close all pooled connections, releasing their file locks."""
+        with self._lock:
+            for _, conn in self._connections.values():
+                conn.close()
+            self._connections.clear()
@@ -0,0 +1,131 @@
+"""File-backed scope entries: Parquet/CSV files or dataset directories exposed as relations.
+
+A scope entry `<format>:<glob>` selects files. When the glob ends with `/` each matching
+directory is one relation over all its files (recursively, so Hive-partitioned layouts
+work); otherwise each matching file is one relation. Columns come from `DESCRIBE`, which
+for Parquet reads only file footers.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, NamedTuple
+
+import duckdb
+
+from dbt_helpers_sdk import CatalogColumn
+
+# Scope prefix to (DuckDB table function, file glob within a dataset directory)
+FILE_FORMATS: dict[str, tuple[str, str]] = {
+    "parquet": ("read_parquet", "**/*.parquet"),
+    "csv": ("read_csv", "**/*.csv"),
+}
+
+
+class FileScope(NamedTuple):
+    """A parsed `<format>:<glob>` scope entry."""
+
+    file_format: str
+    pattern: str
+
+
+class FileRelation(NamedTuple):
+    """One relation backed by files: a single file or every file under a directory."""
+
+    file_format: str
+    namespace: str
+    name: str
+    location: str
+
+
+def parse_file_scope(item: str) -> FileScope | None:
+    """Return the file scope for a `<format>:<glob>` item, or None for a schema item."""
+    prefix, sep, pattern = item.partition(":")
+    if not sep or prefix not in FILE_FORMATS:
+        return None
+    if not pattern:
+        raise ValueError(f"Scope item '{item}' has no file pattern")
+    return FileScope(prefix, pattern)
+
+
+def _split(path: str) -> tuple[str, str]:
+    """Return (parent directory name, entry name) of a file or directory path."""
+    parts = [part for part in path.replace("\\", "/").split("/") if part]
+    name = parts[-1] if parts else path
+    parent = parts[-2] if len(parts) > 1 else ""
+    return parent, name
+
+
+def expand_file_scope(cursor: duckdb.DuckDBPyConnection, file_scope: FileScope) -> list[FileRelation]:
+    """Expand a file scope with DuckDB's glob (local or remote file systems), in path order."""
+    directories = file_scope.pattern.endswith("/")
+    if directories and not any(char in file_scope.pattern for char in "*?["):
+        # glob() only matches files for literal paths; a literal directory is taken as given
+        matches = [file_scope.pattern]
+    else:
+        rows = cursor.execute("SELECT file FROM glob(?)", [file_scope.pattern]).fetchall()
+        matches = sorted(row[0] for row in rows)
+    relations = []
+    for match in matches:
+        parent, name = _split(match)
+        if directories:
+            location = match.rstrip("/") + "/" + FILE_FORMATS[file_scope.file_format][1]
+        else:
+            location = match
+            name = name.split(".", 1)[0]
+        relations.append(FileRelation(file_scope.file_format, parent or file_scope.file_format, name, location))
+    return relations
+
+
+def external_location(relation: FileRelation, union_by_name: bool) -> str:
+    """Return the dbt-duckdb `external_location` that reads the relation's files."""
+    if not union_by_name:
+        return relation.location
+    reader = FILE_FORMATS[relation.file_format][0]
+    location = relation.location.replace("'", "''")
+    return f"{reader}('{location}', union_by_name = true)"
+
+
+def describe_file_relation(
+    cursor: duckdb.DuckDBPyConnection, relation: FileRelation, union_by_name: bool
+) -> list[CatalogColumn] | None:
+    """Return the columns of a file-backed relation, or None when no readable files match."""
+    reader = FILE_FORMATS[relation.file_format][0]
+    try:
+        rows = cursor.execute(
+            f"DESCRIBE SELECT * FROM {reader}($location, union_by_name = $union_by_name)",  # nosec B608
+            {"location": relation.location, "union_by_name": union_by_name},
+        ).fetchall()
+    except duckdb.IOException:
+        return None
+    return [
+        CatalogColumn(name=column_name, data_type=column_type, nullable=null == "YES")
+        for column_name, column_type, null, *_ in rows
+    ]
+
+
+def describe_file_scopes(
+    conn: duckdb.DuckDBPyConnection, file_scopes: list[FileScope], connection_config: dict[str, Any]
+) -> list[tuple[FileRelation, list[CatalogColumn] | None]]:
+    """Expand file scopes and describe every relation concurrently, one cursor per task.
+
+    `union_by_name` (default false) unions column sets across a relation's files by name;
+    otherwise the first file's schema is used. `max_workers` (default 8) bounds concurrency.
+    """
+    union_by_name = bool(connection_config.get("union_by_name", False))
+    max_workers = int(connection_config.get("max_workers", 8))
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be >= 1, got {max_workers}")
+
+    def with_cursor(fn: Any, *args: Any) -> Any:
+        cursor = conn.cursor()
+        try:
+            return fn(cursor, *args)
+        finally:
+            cursor.close()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        expanded = executor.map(lambda file_scope: with_cursor(expand_file_scope, file_scope), file_scopes)
+        relations = [relation for group in expanded for relation in group]
+        described = executor.map(
+            lambda relation: with_cursor(describe_file_relation, relation, union_by_name), relations
+        )
+        return list(zip(relations, described, strict=True))
@@ -1,3 +1,9 @@
+import heapq
+import multiprocessing
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
 from typing import Any
 
 import duckdb
@@ -7,77 +13,278 @@ from dbt_helpers_sdk import (
     CatalogColumn,
     CatalogNamespace,
     CatalogRelation,
+    schema_fingerprint,
 )
+from dbt_helpers_sdk.database_files import attach_aliases, is_glob, resolve_db_paths
+
+from .connection_pool import ConnectionPool
+from .file_scope import FileScope, describe_file_scopes, external_location, parse_file_scope
+
+# One pass over all schemas in scope: relations in scope order, then by database and name. A scope
+# item is a schema name (matched in every database of the session) or `database.schema`. Each row
+# carries the relation's comment, tags and row estimate, its columns in ordinal order (one list per
+# attribute, so they convert column-wise from Arrow), their schema fingerprint (the digest of
+# `schema_fingerprint`, computed in the same aggregation) and its primary/unique keys. Columns and keys
+# are aggregated separately so the joins do not multiply rows. The duckdb_* functions are cheaper
+# than the information_schema views built on top of them.
+_CATALOG_QUERY = """
+    WITH relations AS (
+        SELECT
+            database_name, schema_name, table_name, table_oid, 'BASE TABLE' AS table_type,
+            comment, tags, estimated_size
+        FROM duckdb_tables()
+        UNION ALL
+        SELECT database_name, schema_name, view_name, view_oid, 'VIEW', comment, tags, NULL
+        FROM duckdb_views()
+        WHERE NOT internal
+    ),
+    scoped AS (
+        SELECT *
+        FROM (
+            SELECT
+                *,
+                coalesce(
+                    list_position($scope, database_name || '.' || schema_name), list_position($scope, schema_name)
+                ) AS scope_position
+            FROM relations
+        )
+        WHERE scope_position IS NOT NULL
+    ),
+    columns AS (
+        SELECT
+            table_oid,
+            list(column_name ORDER BY column_index) AS column_names,
+            list(data_type ORDER BY column_index) AS data_types,
+            list(is_nullable ORDER BY column_index) AS nullables,
+            list(comment ORDER BY column_index) AS comments,
+            md5(string_agg(column_name || ':' || data_type, ',' ORDER BY column_index)) AS fingerprint
+        FROM duckdb_columns()
+        WHERE table_oid IN (SELECT table_oid FROM scoped)
+        GROUP BY table_oid
+    ),
+    keys AS (
+        SELECT
+            table_oid,
+            first(constraint_column_names) FILTER (WHERE constraint_type = 'PRIMARY KEY') AS primary_key,
+            list(constraint_column_names ORDER BY constraint_index) FILTER (WHERE constraint_type = 'UNIQUE')
+                AS unique_keys
+        FROM duckdb_constraints()
+        WHERE constraint_type IN ('PRIMARY KEY', 'UNIQUE') AND table_oid IN (SELECT table_oid FROM scoped)
+        GROUP BY table_oid
+    )
+    SELECT
+        r.database_name,
+        r.schema_name,
+        r.table_name,
+        r.table_type,
+        r.comment,
+        r.tags,
+        r.estimated_size,
+        c.fingerprint,
+        c.column_names,
+        c.data_types,
+        c.nullables,
+        c.comments,
+        k.primary_key,
+        k.unique_keys
+    FROM scoped AS r
+    LEFT JOIN columns AS c ON c.table_oid = r.table_oid
+    LEFT JOIN keys AS k ON k.table_oid = r.table_oid
+    ORDER BY r.scope_position, r.database_name, r.table_name
+"""
+
+# Rows converted per batch; bounds memory while streaming very large catalogs
+_BATCH_ROWS = 2048
+
+_Row = tuple[Any, ...]
+
+
+def _iter_rows(result: duckdb.DuckDBPyConnection) -> Iterator[_Row]:
+    """Yield catalog rows batch by batch, converted column-wise through Arrow when pyarrow is installed."""
+    try:
+        import pyarrow  # noqa: F401  # pylint: disable=import-outside-toplevel,unused-import
+    except ImportError:
+        while rows := result.fetchmany(_BATCH_ROWS):
+            yield from rows
+        return
+
+    # Newer DuckDB releases deprecate fetch_record_batch in favour of to_arrow_reader
+    to_arrow_reader = getattr(result, "to_arrow_reader", None) or result.fetch_record_batch
+    for batch in to_arrow_reader(_BATCH_ROWS):
+        yield from zip(*(column.to_pylist() for column in batch.columns), strict=True)
 
 
 class DuckDBWarehousePlugin(CatalogClient):
-    """Catalog client for DuckDB databases."""
+    """Catalog client for DuckDB databases and Parquet/CSV files.
+
+    Database files are opened read-only and the connection is reused across calls. With
+    `db_paths`, several files are ATTACHed into one session (as catalogs named by their file
+    stems) and relations are namespaced `[database, schema]`; its entries may be glob patterns.
+    With `processes` > 1, each file is instead introspected in a worker process and the results
+    are merged in the same order. Scope items `parquet:<glob>` and `csv:<glob>` expose files or
+    dataset directories as external relations (see file_scope).
+    """
 
     def __init__(self, db_path: str = ":memory:"):
         self.db_path = db_path
+        # Read-only connections are reused across read_catalog calls on this instance
+        self._connection_pool = ConnectionPool()
+        # Per-file read time and relation count of the last read in worker processes
+        self.file_stats: dict[str, dict[str, Any]] = {}
+
+    def close(self) -> None:
+        """Close pooled connections, releasing their file locks."""
+        self._connection_pool.close()
+
+    def release_file_locks(self) -> None:
+        """Close pooled connections so other processes can write the database files; called after each operation."""
+        self.close()
 
     def read_catalog(self, scope: list[str], connection_config: dict[str, Any]) -> list[CatalogRelation]:
-        db_path = connection_config.get("db_path", self.db_path)
-        # Connect to the database
-        conn = duckdb.connect(db_path)
-        relations = []
+        return list(self.iter_catalog(scope, connection_config))
+
+    def iter_catalog(self, scope: list[str], connection_config: dict[str, Any]) -> Iterator[CatalogRelation]:
+        """Yield database relations in scope order, then file-backed relations in scope order.
+
+        The cursor stays open until the iterator is exhausted or closed.
+        """
+        schemas: list[str] = []
+        file_scopes: list[FileScope] = []
+        for item in scope:
+            file_scope = parse_file_scope(item)
+            if file_scope is None:
+                schemas.append(item)
+            else:
+                file_scopes.append(file_scope)
+
+        processes = int(connection_config.get("processes", 1))
+        if processes < 1:
+            raise ValueError(f"processes must be >= 1, got {processes}")
+        db_paths = resolve_db_paths(connection_config, self.db_path)
+        # A glob keeps the [database, schema] namespace even while it matches a single file
+        multi_database = len(db_paths) > 1 or any(is_glob(str(path)) for path in connection_config.get("db_paths") or [])
+        # A database file that does not exist has no relations (it is not created)
+        db_paths = [path for path in db_paths if path == ":memory:" or Path(path).exists()]
+        self.file_stats = {}
+        if not (schemas and db_paths) and not file_scopes:
+            return
+        in_processes = processes > 1 and len(db_paths) > 1
 
+        if schemas and db_paths:
+            if in_processes:
+                yield from self._iter_schema_relations_in_processes(db_paths, schemas, processes)
+            else:
+                conn = self._connection_pool.get_connection(db_paths)
+                yield from self._iter_schema_relations(conn, schemas, multi_database)
+        if file_scopes:
+            # Database files read in worker processes are not attached in this process
+            conn = self._connection_pool.get_connection(db_paths if db_paths and not in_processes else [":memory:"])
+            yield from self._iter_file_relations(conn, file_scopes, connection_config)
+
+    def _iter_schema_relations(
+        self, conn: duckdb.DuckDBPyConnection, schemas: list[str], multi_database: bool
+    ) -> Iterator[CatalogRelation]:
+        cursor = conn.cursor()
         try:
-            for schema in scope:
-                # Query all columns in the schema in one go
-                # This avoids N+1 queries
-                cols_data = conn.execute(
-                    """
-                    SELECT table_name, column_name, data_type, is_nullable
-                    FROM information_schema.columns
-                    WHERE table_schema = ?
-                    ORDER BY table_name, ordinal_position
-                """,
-                    [schema],
-                ).fetchall()
-
-                # Group columns by table
-                table_to_cols: dict[str, list[CatalogColumn]] = {}
-                for table_name, col_name, data_type, is_nullable in cols_data:
-                    if table_name not in table_to_cols:
-                        table_to_cols[table_name] = []
-                    table_to_cols[table_name].append(
-                        CatalogColumn(
-                            name=col_name,
-                            data_type=data_type,
-                            nullable=(is_nullable == "YES"),
-                        )
-                    )
-
-                # Also fetch tables (including views) to ensure we have all relations
-                tables = conn.execute(
-                    """
-                    SELECT table_name, table_type
-                    FROM information_schema.tables
-                    WHERE table_schema = ?
-                """,
-                    [schema],
-                ).fetchall()
-
-                for table_name, table_type in tables:
-                    kind = "table" if table_type == "BASE TABLE" else "view"
-                    columns = table_to_cols.get(table_name, [])
-
-                    relations.append(
-                        CatalogRelation(
-                            namespace=CatalogNamespace(parts=[schema]),
-                            name=table_name,
-                            kind=kind,
-                            columns=columns,
-                            dbt_name=f"{schema}__{table_name}",
-                            metadata={
-                                "meta": {"owner": "test_team"},  # Default for MVP
-                                "tags": ["raw_data"],
-                                "description": f"Raw {kind} {table_name}",
-                            },
-                        )
-                    )
+            # The progress bar would write to stdout on long catalog queries
+            cursor.execute("SET enable_progress_bar = false")
+            result = cursor.execute(_CATALOG_QUERY, {"scope": schemas})
+            for row in _iter_rows(result):
+                yield _schema_relation(row, multi_database)
         finally:
-            conn.close()
+            cursor.close()
+
+    def _iter_schema_relations_in_processes(
+        self, db_paths: list[str], schemas: list[str], processes: int
+    ) -> Iterator[CatalogRelation]:
+        # Same distinct-stem rule as the attached session, so both modes name catalogs alike
+        attach_aliases(db_paths)
+        # Spawned rather than forked: forking a process with open DuckDB connections is unsafe
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=min(processes, len(db_paths)), mp_context=context) as executor:
+            results = list(executor.map(_read_file_rows, db_paths, [schemas] * len(db_paths)))
+        for path, (rows, seconds) in zip(db_paths, results, strict=True):
+            self.file_stats[path] = {"seconds": round(seconds, 3), "relations": len(rows)}
+        # Each file's rows are already in query order, so merging restores the attached session's order
+        for row in heapq.merge(*(rows for rows, _ in results), key=_scope_order(schemas)):
+            yield _schema_relation(row, multi_database=True)
+
+    def _iter_file_relations(
+        self, conn: duckdb.DuckDBPyConnection, file_scopes: list[FileScope], connection_config: dict[str, Any]
+    ) -> Iterator[CatalogRelation]:
+        union_by_name = bool(connection_config.get("union_by_name", False))
+        for file_relation, columns in describe_file_scopes(conn, file_scopes, connection_config):
+            # Directories without readable files of the format are not relations
+            if columns is None:
+                continue
+            relation = _relation([file_relation.namespace], file_relation.name, "external", columns)
+            relation.fingerprint = schema_fingerprint(columns)
+            relation.metadata["meta"] = {"external_location": external_location(file_relation, union_by_name)}
+            relation.metadata["format"] = file_relation.file_format
+            yield relation
+
+
+def _read_file_rows(path: str, schemas: list[str]) -> tuple[list[_Row], float]:
+    """Run the catalog query on one database file in a worker process.
+
+    Returns the rows as plain tuples, which pickle compactly, and the seconds the read took.
+    The file is opened directly, so its catalog is named by its file stem as when ATTACHed.
+    """
+    start = time.perf_counter()
+    conn = duckdb.connect(path, read_only=True)
+    try:
+        conn.execute("SET enable_progress_bar = false")
+        rows = list(_iter_rows(conn.execute(_CATALOG_QUERY, {"scope": schemas})))
+    finally:
+        conn.close()
+    return rows, time.perf_counter() - start
+
+
+def _scope_order(schemas: list[str]) -> Callable[[_Row], tuple[int, str, str]]:
+    """Return the sort key of the catalog query's ORDER BY for rows of a given scope."""
+    positions: dict[str, int] = {}
+    for position, item in enumerate(schemas):
+        positions.setdefault(item, position)
+
+    def key(row: _Row) -> tuple[int, str, str]:
+        database, schema, table_name = row[:3]
+        position = positions.get(f"{database}.{schema}")
+        return (positions[schema] if position is None else position, database, table_name)
+
+    return key
+
+
+def _schema_relation(row: _Row, multi_database: bool) -> CatalogRelation:
+    database, schema, table_name, table_type, comment, tags, estimated_size, fingerprint = row[:8]
+    *column_lists, pk, uks = row[8:]
+    kind = "table" if table_type == "BASE TABLE" else "view"
+    columns = [
+        CatalogColumn(name=name, data_type=data_type, nullable=nullable, description=column_comment)
+        for name, data_type, nullable, column_comment in zip(*(values or [] for values in column_lists), strict=True)
+    ]
+    parts = [database, schema] if multi_database else [schema]
+    relation = _relation(parts, table_name, kind, columns, description=comment)
+    relation.fingerprint = fingerprint or schema_fingerprint(columns)
+    # DuckDB tags are key/value pairs like BigQuery labels (a dict, or pairs from Arrow)
+    if tags:
+        relation.metadata["labels"] = dict(tags)
+    if pk:
+        relation.metadata["primary_key"] = list(pk)
+    if uks:
+        relation.metadata["unique_keys"] = [list(key) for key in uks]
+    if estimated_size is not None:
+        relation.metadata["estimated_row_count"] = int(estimated_size)
+    return relation
+
 
-        return relations
+def _relation(
+    parts: list[str], name: str, kind: str, columns: list[CatalogColumn], description: str | None = None
+) -> CatalogRelation:
+    return CatalogRelation(
+        namespace=CatalogNamespace(parts=parts),
+        name=name,
+        kind=kind,
+        columns=columns,
+        dbt_name="__".join([*parts, name]),
+        metadata={"description": description},
+    )
@@ -24,6 +24,7 @@ class TestDuckDBSyncScenarios(unittest.TestCase):
         db_path = self.tmp_path / "desc_test.duckdb"
         conn = duckdb.connect(str(db_path))
         conn.execute("CREATE TABLE main.users (id INTEGER, name VARCHAR)")
+        conn.execute("COMMENT ON TABLE main.users IS 'Registered users'")
         conn.close()
 
         project_dir = self.tmp_path / "project"
@@ -50,10 +51,10 @@ paths:
         yml_path = project_dir / "models/staging/main__users.yml"
         content = yml_path.read_text()
         assert "description: |" in content
-        assert "Raw table users" in content
+        assert "Registered users" in content
 
         # 2. Remove description manually from YAML
-        new_content = re.sub(r"description: \|.*Raw table users", "description: ''", content, flags=re.DOTALL)
+        new_content = re.sub(r"description: \|.*Registered users", "description: ''", content, flags=re.DOTALL)
         yml_path.write_text(new_content)
 
         # 3. Sync
@@ -62,8 +63,8 @@ paths:
         orchestrator.apply_plan(plan2)
 
         final_content = yml_path.read_text()
-        # It might be rendered as 'description: Raw table users' or 'description: |- \n Raw table users'
-        assert "Raw table users" in final_content
+        # It might be rendered as 'description: Registered users' or 'description: |- \n Registered users'
+        assert "Registered users" in final_content
 
     def test_idempotency_scenario(self):
         """Verify that a second sync run produces no changes."""
@@ -0,0 +1,66 @@
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+import duckdb
+
+from dbt_helpers_wh_duckdb.connection_pool import ConnectionPool
+
+
+def _create_db(path: Path, ddl: str) -> str:
+    conn = duckdb.connect(str(path))
+    conn.execute(ddl)
+    conn.close()
+    return str(path)
+
+
+class TestConnectionPool(unittest.TestCase):
+    """Tests for the ConnectionPool class."""
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.pool = ConnectionPool()
+
+    def tearDown(self):
+        self.pool.close()
+        shutil.rmtree(self.test_dir)
+
+    def test_reuses_read_only_connection(self):
+        db_path = _create_db(self.test_dir / "a.duckdb", "CREATE TABLE t (id INT)")
+
+        conn = self.pool.get_connection([db_path])
+
+        self.assertIs(self.pool.get_connection([db_path]), conn)
+        with self.assertRaises(duckdb.Error):
+            conn.execute("CREATE TABLE u (id INT)")
+
+    def test_reopens_replaced_file(self):
+        db_path = _create_db(self.test_dir / "a.duckdb", "CREATE TABLE old_table (id INT)")
+        replacement = _create_db(self.test_dir / "replacement.duckdb", "CREATE TABLE new_table (id INT)")
+        conn = self.pool.get_connection([db_path])
+
+        shutil.copy(replacement, db_path)
+        reopened = self.pool.get_connection([db_path])
+
+        self.assertIsNot(reopened, conn)
+        self.assertEqual(reopened.execute("SELECT table_name FROM duckdb_tables()").fetchall(), [("new_table",)])
+
+    def test_attaches_multiple_files(self):
+        sales = _create_db(self.test_dir / "sales.duckdb", "CREATE TABLE orders (id INT)")
+        marketing = _create_db(self.test_dir / "marketing.duckdb", "CREATE TABLE campaigns (id INT)")
+
+        conn = self.pool.get_connection([sales, marketing])
+
+        rows = conn.execute("SELECT database_name, table_name FROM duckdb_tables() ORDER BY 1").fetchall()
+        self.assertEqual(rows, [("marketing", "campaigns"), ("sales", "orders")])
+
+    def test_attaches_files_with_quotes_in_their_paths(self):
+        (self.test_dir / "o'neil").mkdir()
+        sales = _create_db(self.test_dir / "o'neil" / "sales.duckdb", "CREATE TABLE orders (id INT)")
+        marketing = _create_db(self.test_dir / "marketing.duckdb", "CREATE TABLE campaigns (id INT)")
+
+        conn = self.pool.get_connection([sales, marketing])
+
+        rows = conn.execute("SELECT database_name, table_name FROM duckdb_tables() ORDER BY 1").fetchall()
+        self.assertEqual(rows, [("marketing", "campaigns"), ("sales", "orders")])
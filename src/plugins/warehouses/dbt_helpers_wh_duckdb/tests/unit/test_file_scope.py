@@ -0,0 +1,99 @@
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+import duckdb
+
+from dbt_helpers_sdk import schema_fingerprint
+from dbt_helpers_wh_duckdb.file_scope import FileRelation, FileScope, external_location, parse_file_scope
+from dbt_helpers_wh_duckdb.plugin import DuckDBWarehousePlugin
+
+
+class TestFileScope(unittest.TestCase):
+    """Tests for Parquet/CSV scope entries."""
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.raw = self.test_dir / "raw"
+        for partition in ("dt=2024-01-01", "dt=2024-01-02"):
+            (self.raw / "orders" / partition).mkdir(parents=True)
+        (self.raw / "users").mkdir()
+        (self.raw / "empty").mkdir()
+        conn = duckdb.connect()
+        conn.execute(f"COPY (SELECT 1::INT AS id, 'a' AS name) TO '{self.raw}/orders/dt=2024-01-01/p0.parquet'")
+        conn.execute(
+            f"COPY (SELECT 2::INT AS id, 3.5::DOUBLE AS amount) TO '{self.raw}/orders/dt=2024-01-02/p0.parquet'"
+        )
+        conn.execute(f"COPY (SELECT 1::BIGINT AS user_id) TO '{self.raw}/users/part-0.parquet'")
+        conn.execute(f"COPY (SELECT 1 AS event_id, 'click' AS kind) TO '{self.raw}/events.csv' (HEADER)")
+        conn.close()
+        self.plugin = DuckDBWarehousePlugin()
+
+    def tearDown(self):
+        self.plugin.close()
+        shutil.rmtree(self.test_dir)
+
+    def test_parse_file_scope(self):
+        self.assertEqual(parse_file_scope("parquet:/data/raw/*/"), FileScope("parquet", "/data/raw/*/"))
+        self.assertEqual(parse_file_scope("csv:s3://bucket/*.csv"), FileScope("csv", "s3://bucket/*.csv"))
+        self.assertIsNone(parse_file_scope("raw"))
+        self.assertIsNone(parse_file_scope("json:/data/*.json"))
+        with self.assertRaises(ValueError):
+            parse_file_scope("parquet:")
+
+    def test_directories_become_relations(self):
+        relations = self.plugin.read_catalog([f"parquet:{self.raw}/*/"], connection_config={})
+
+        self.assertEqual(
+            [(r.namespace.parts, r.name, r.kind) for r in relations],
+            [(["raw"], "orders", "external"), (["raw"], "users", "external")],
+        )
+        orders = relations[0]
+        self.assertEqual([c.name for c in orders.columns], ["id", "name", "dt"])
+        self.assertEqual(orders.metadata["meta"], {"external_location": f"{self.raw}/orders/**/*.parquet"})
+        self.assertIsNone(orders.metadata["description"])
+        self.assertNotIn("tags", orders.metadata)
+        self.assertEqual(orders.metadata["format"], "parquet")
+        self.assertEqual(orders.dbt_name, "raw__orders")
+        self.assertEqual(orders.fingerprint, schema_fingerprint(orders.columns))
+
+    def test_union_by_name(self):
+        relations = self.plugin.read_catalog(
+            [f"parquet:{self.raw}/orders/"], connection_config={"union_by_name": True, "max_workers": 2}
+        )
+
+        self.assertEqual([c.name for c in relations[0].columns], ["id", "name", "amount", "dt"])
+        self.assertTrue(relations[0].metadata["meta"]["external_location"].startswith("read_parquet("))
+
+    def test_files_become_relations_alongside_schemas(self):
+        db_path = self.test_dir / "warehouse.duckdb"
+        conn = duckdb.connect(str(db_path))
+        conn.execute("CREATE SCHEMA landing; CREATE TABLE landing.t (id INT)")
+        conn.close()
+
+        relations = self.plugin.read_catalog(
+            [f"csv:{self.raw}/*.csv", "landing"], connection_config={"db_path": str(db_path)}
+        )
+
+        self.assertEqual([(r.namespace.parts, r.name) for r in relations], [(["landing"], "t"), (["raw"], "events")])
+        self.assertEqual(
+            [(c.name, c.data_type) for c in relations[1].columns], [("event_id", "BIGINT"), ("kind", "VARCHAR")]
+        )
+
+    def test_paths_with_quotes(self):
+        """Glob patterns and file locations are bound as parameters, so quotes are plain characters."""
+        quoted = self.test_dir / "o'neil"
+        quoted.mkdir()
+        conn = duckdb.connect()
+        conn.execute("COPY (SELECT 1 AS id) TO ? (HEADER)", [str(quoted / "accounts.csv")])
+        conn.close()
+
+        relations = self.plugin.read_catalog([f"csv:{quoted}/*.csv"], connection_config={"union_by_name": True})
+        self.assertEqual([(r.namespace.parts, r.name) for r in relations], [(["o'neil"], "accounts")])
+        self.assertEqual([c.name for c in relations[0].columns], ["id"])
+        self.assertEqual(self.plugin.read_catalog([f"csv:{quoted}/x'); DROP TABLE t; --*.csv"], {}), [])
+
+    def test_external_location_escapes_quotes(self):
+        relation = FileRelation("csv", "raw", "o", "/data/o'neil/*.csv")
+        self.assertEqual(external_location(relation, True), "read_csv('/data/o''neil/*.csv', union_by_name = true)")
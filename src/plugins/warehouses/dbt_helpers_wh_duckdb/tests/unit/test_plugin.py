@@ -32,3 +32,110 @@ class TestDuckDBPlugin(unittest.TestCase):
 
         relations = plugin.read_catalog(["raw"], connection_config={})
         self.assertEqual(len(relations), 0)
+
+    def test_duckdb_iter_catalog_streams_in_scope_order(self):
+        db_path = str(self.test_dir / "stream.duckdb")
+        conn = duckdb.connect(db_path)
+        conn.execute("CREATE SCHEMA a; CREATE TABLE a.t1 (id INT); CREATE SCHEMA b; CREATE TABLE b.t2 (id INT)")
+        conn.close()
+        plugin = DuckDBWarehousePlugin(db_path=db_path)
+
+        stream = plugin.iter_catalog(["a", "b"], connection_config={})
+        first = next(stream)
+        self.assertEqual((first.namespace.parts, first.name), (["a"], "t1"))
+        self.assertEqual([r.name for r in stream], ["t2"])
+        self.assertEqual(plugin.read_catalog(["a", "b"], connection_config={})[0], first)
+
+    def test_duckdb_read_catalog_reuses_pooled_connection(self):
+        db_path = str(self.test_dir / "pooled.duckdb")
+        conn = duckdb.connect(db_path)
+        conn.execute("CREATE SCHEMA raw; CREATE TABLE raw.t (id INT)")
+        conn.close()
+        plugin = DuckDBWarehousePlugin(db_path=db_path)
+        self.addCleanup(plugin.close)
+
+        plugin.read_catalog(["raw"], connection_config={})
+        pooled = plugin._connection_pool.get_connection([db_path])  # pylint: disable=protected-access
+        relations = plugin.read_catalog(["raw"], connection_config={})
+
+        self.assertIs(plugin._connection_pool.get_connection([db_path]), pooled)  # pylint: disable=protected-access
+        self.assertEqual([r.name for r in relations], ["t"])
+
+    def test_duckdb_read_catalog_scope_with_quotes(self):
+        db_path = str(self.test_dir / "quotes.duckdb")
+        conn = duckdb.connect(db_path)
+        conn.execute("""CREATE SCHEMA "it's"; CREATE TABLE "it's".t (id INT)""")
+        conn.close()
+        plugin = DuckDBWarehousePlugin(db_path=db_path)
+        self.addCleanup(plugin.close)
+
+        relations = plugin.read_catalog(["it's", "x'); DROP TABLE t; --"], connection_config={})
+        self.assertEqual([(r.namespace.parts, r.name) for r in relations], [(["it's"], "t")])
+
+    def test_duckdb_read_catalog_missing_file_is_not_created(self):
+        db_path = self.test_dir / "missing.duckdb"
+        plugin = DuckDBWarehousePlugin(db_path=str(db_path))
+
+        self.assertEqual(plugin.read_catalog(["raw"], connection_config={}), [])
+        self.assertFalse(db_path.exists())
+
+    def test_duckdb_read_catalog_attached_databases(self):
+        paths = []
+        for name in ("sales", "marketing"):
+            path = str(self.test_dir / f"{name}.duckdb")
+            conn = duckdb.connect(path)
+            conn.execute(f"CREATE SCHEMA raw; CREATE TABLE raw.{name}_events (id INT)")
+            conn.close()
+            paths.append(path)
+        plugin = DuckDBWarehousePlugin()
+        self.addCleanup(plugin.close)
+
+        relations = plugin.read_catalog(["raw"], connection_config={"db_paths": paths})
+        self.assertEqual(
+            [(r.namespace.parts, r.name, r.dbt_name) for r in relations],
+            [
+                (["marketing", "raw"], "marketing_events", "marketing__raw__marketing_events"),
+                (["sales", "raw"], "sales_events", "sales__raw__sales_events"),
+            ],
+        )
+
+        relations = plugin.read_catalog(["sales.raw"], connection_config={"db_paths": paths})
+        self.assertEqual([r.name for r in relations], ["sales_events"])
+
+    def test_duckdb_read_catalog_in_processes(self):
+        for name in ("sales", "marketing", "finance"):
+            conn = duckdb.connect(str(self.test_dir / f"{name}.duckdb"))
+            conn.execute(
+                f"CREATE SCHEMA raw; CREATE SCHEMA staging; CREATE TABLE raw.{name}_events (id INT PRIMARY KEY); "
+                f"CREATE TABLE staging.{name}_users (id INT); COMMENT ON TABLE raw.{name}_events IS '{name}'"
+            )
+            conn.close()
+        scope = ["staging", "sales.raw", "raw"]
+        config = {"db_paths": [str(self.test_dir / "*.duckdb")]}
+        plugin = DuckDBWarehousePlugin()
+        self.addCleanup(plugin.close)
+
+        attached = plugin.read_catalog(scope, connection_config=config)
+        self.assertEqual(plugin.file_stats, {})
+        in_processes = plugin.read_catalog(scope, connection_config={**config, "processes": 2})
+
+        self.assertEqual(in_processes, attached)
+        self.assertEqual(
+            [r.dbt_name for r in in_processes],
+            [
+                "finance__staging__finance_users",
+                "marketing__staging__marketing_users",
+                "sales__staging__sales_users",
+                "sales__raw__sales_events",
+                "finance__raw__finance_events",
+                "marketing__raw__marketing_events",
+            ],
+        )
+        self.assertEqual(sorted(plugin.file_stats), sorted(str(path) for path in self.test_dir.glob("*.duckdb")))
+        for stats in plugin.file_stats.values():
+            self.assertEqual(stats["relations"], 2)
+            self.assertGreaterEqual(stats["seconds"], 0)
+
+    def test_duckdb_read_catalog_rejects_invalid_processes(self):
+        with self.assertRaises(ValueError):
+            DuckDBWarehousePlugin().read_catalog(["raw"], connection_config={"processes": 0})
@@ -1,10 +1,13 @@
 import shutil
+import sys
 import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
 import duckdb
 
+from dbt_helpers_sdk import schema_fingerprint
 from dbt_helpers_wh_duckdb.plugin import DuckDBWarehousePlugin
 
 
@@ -70,3 +73,90 @@ class TestDuckDBPluginEnhanced(unittest.TestCase):
         plugin = DuckDBWarehousePlugin(db_path=db_path)
         relations = plugin.read_catalog(["non_existent"], connection_config={})
         self.assertEqual(len(relations), 0)
+
+    def _create_multi_schema_db(self) -> str:
+        db_path = str(self.test_dir / "multi.duckdb")
+        conn = duckdb.connect(db_path)
+        conn.execute("CREATE SCHEMA staging")
+        conn.execute("CREATE SCHEMA raw")
+        conn.execute("CREATE TABLE raw.users (id INTEGER NOT NULL, name VARCHAR, tags VARCHAR[])")
+        conn.execute("CREATE TABLE staging.events (payload STRUCT(k VARCHAR, v INTEGER), event_id BIGINT)")
+        conn.execute("CREATE VIEW staging.active_users AS SELECT id FROM raw.users")
+        conn.close()
+        return db_path
+
+    def test_duckdb_read_catalog_multi_schema(self):
+        plugin = DuckDBWarehousePlugin(db_path=self._create_multi_schema_db())
+        relations = plugin.read_catalog(["staging", "raw", "non_existent"], connection_config={})
+
+        self.assertEqual(
+            [(r.namespace.parts, r.name, r.kind) for r in relations],
+            [(["staging"], "active_users", "view"), (["staging"], "events", "table"), (["raw"], "users", "table")],
+        )
+        users = relations[2]
+        self.assertEqual([c.name for c in users.columns], ["id", "name", "tags"])
+        self.assertEqual([c.data_type for c in users.columns], ["INTEGER", "VARCHAR", "VARCHAR[]"])
+        self.assertEqual([c.nullable for c in users.columns], [False, True, True])
+        self.assertEqual(relations[1].columns[0].data_type, "STRUCT(k VARCHAR, v INTEGER)")
+
+    def test_duckdb_read_catalog_fingerprints(self):
+        db_path = self._create_multi_schema_db()
+        plugin = DuckDBWarehousePlugin(db_path=db_path)
+        relations = plugin.read_catalog(["staging", "raw"], connection_config={})
+
+        for relation in relations:
+            self.assertEqual(relation.fingerprint, schema_fingerprint(relation.columns))
+        self.assertEqual(len({r.fingerprint for r in relations}), 3)
+
+        plugin.close()
+        conn = duckdb.connect(db_path)
+        conn.execute("COMMENT ON TABLE staging.events IS 'Comments are not part of the schema'")
+        conn.execute("ALTER TABLE raw.users ADD COLUMN email VARCHAR")
+        conn.close()
+        changed = plugin.read_catalog(["staging", "raw"], connection_config={})
+
+        self.assertEqual(
+            [before.fingerprint == after.fingerprint for before, after in zip(relations, changed, strict=True)],
+            [True, True, False],
+        )
+
+    def test_duckdb_read_catalog_without_pyarrow(self):
+        db_path = self._create_multi_schema_db()
+        plugin = DuckDBWarehousePlugin(db_path=db_path)
+        expected = plugin.read_catalog(["staging", "raw"], connection_config={})
+
+        with patch.dict(sys.modules, {"pyarrow": None}):
+            relations = plugin.read_catalog(["staging", "raw"], connection_config={})
+
+        self.assertEqual(relations, expected)
+
+    def test_duckdb_read_catalog_comments_keys_and_size(self):
+        db_path = str(self.test_dir / "rich.duckdb")
+        conn = duckdb.connect(db_path)
+        conn.execute("CREATE SCHEMA raw")
+        conn.execute(
+            "CREATE TABLE raw.orders (order_id INTEGER, line_no INTEGER, sku VARCHAR UNIQUE, "
+            "external_id VARCHAR, PRIMARY KEY (order_id, line_no), UNIQUE (external_id, sku))"
+        )
+        conn.execute("INSERT INTO raw.orders SELECT i, 1, 'sku' || i, 'x' || i FROM range(5) t(i)")
+        conn.execute("COMMENT ON TABLE raw.orders IS 'Order lines'")
+        conn.execute("COMMENT ON COLUMN raw.orders.sku IS 'Stock keeping unit'")
+        conn.execute("CREATE VIEW raw.skus AS SELECT sku FROM raw.orders")
+        conn.close()
+
+        plugin = DuckDBWarehousePlugin(db_path=db_path)
+        orders, skus = plugin.read_catalog(["raw"], connection_config={})
+
+        self.assertEqual(orders.metadata["description"], "Order lines")
+        self.assertEqual([c.description for c in orders.columns], [None, None, "Stock keeping unit", None])
+        self.assertEqual([c.nullable for c in orders.columns], [False, False, True, True])
+        self.assertEqual(orders.metadata["primary_key"], ["order_id", "line_no"])
+        self.assertEqual(sorted(orders.metadata["unique_keys"]), [["external_id", "sku"], ["sku"]])
+        self.assertEqual(orders.metadata["estimated_row_count"], 5)
+        # Without a comment there is no description, and no placeholder meta or tags
+        self.assertEqual(skus.metadata, {"description": None})
+        self.assertNotIn("primary_key", skus.metadata)
+        self.assertNotIn("estimated_row_count", skus.metadata)
+
+        with patch.dict(sys.modules, {"pyarrow": None}):
+            self.assertEqual(plugin.read_catalog(["raw"], connection_config={}), [orders, skus])
@@ -0,0 +1,143 @@
+"""Benchmark SQLite read_catalog, and the core pipeline on top of it.
+
+Compares a per-table implementation (one `PRAGMA table_info` call per table listed
+from sqlite_master; kept here as a reference) with the plugin's one statement per
+database. SQLite runs in-process, so both mostly measure building CatalogRelations.
+With --pipeline, also times the core source and model planning against the same
+databases (SQLite needs no server, so it isolates the core's cost).
+
+The databases are generated on first use and reused afterwards.
+
+Usage:
+    uv run python benchmarks/bench_read_catalog.py --tables 20000 --databases 4
+    uv run python benchmarks/bench_read_catalog.py --tables 2000 --databases 2 --pipeline
+"""
+
+import argparse
+import atexit
+import shutil
+import sqlite3
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from dbt_helpers_sdk import CatalogColumn, CatalogNamespace, CatalogRelation
+from dbt_helpers_sdk.database_files import attach_aliases
+from dbt_helpers_wh_sqlite.plugin import SQLiteWarehousePlugin, connect
+
+_COLUMN_TYPES = ("INTEGER", "TEXT", "REAL", "TIMESTAMP", "BLOB", "NUMERIC(10, 2)")
+
+
+def create_database(path: Path, n_tables: int, n_columns: int, prefix: str) -> None:
+    """Create n_tables tables of n_columns columns in one database file."""
+    conn = sqlite3.connect(path)
+    try:
+        with conn:
+            for t in range(n_tables):
+                columns = ", ".join(
+                    f"col_{c} {_COLUMN_TYPES[(t + c) % len(_COLUMN_TYPES)]}{' NOT NULL' if c == 0 else ''}"
+                    for c in range(n_columns)
+                )
+                conn.execute(f"CREATE TABLE {prefix}_table_{t:06d} ({columns})")
+    finally:
+        conn.close()
+
+
+def reference_read_catalog(db_paths: list[str], scope: list[str]) -> list[CatalogRelation]:
+    """The per-table implementation the per-database statement replaces."""
+    aliases = attach_aliases(db_paths)
+    conn = connect(db_paths, aliases)
+    relations = []
+    try:
+        for database in scope:
+            tables = conn.execute(
+                f"SELECT name, type FROM \"{database}\".sqlite_master "  # nosec B608
+                "WHERE type IN ('table', 'view') AND name NOT LIKE 'sqlite_%' ORDER BY name"
+            ).fetchall()
+            for table_name, table_type in tables:
+                rows = conn.execute(f'PRAGMA "{database}".table_info("{table_name}")').fetchall()
+                columns = [
+                    CatalogColumn(name=name, data_type=data_type or "BLOB", nullable=not notnull)
+                    for _, name, data_type, notnull, _, _ in rows
+                ]
+                relations.append(
+                    CatalogRelation(
+                        namespace=CatalogNamespace(parts=[database]),
+                        name=table_name,
+                        kind="table" if table_type == "table" else "view",
+                        columns=columns,
+                        dbt_name=f"{database}__{table_name}",
+                    )
+                )
+    finally:
+        conn.close()
+    return relations
+
+
+def time_pipeline(db_paths: list[str], scope: list[str]) -> dict[str, Callable[[], Any]]:
+    """Return core planning runs against a throwaway project configured for the sqlite plugin."""
+    from dbt_helpers_core.orchestrator import Orchestrator  # pylint: disable=import-outside-toplevel
+
+    project_dir = Path(tempfile.mkdtemp())
+    atexit.register(shutil.rmtree, project_dir, ignore_errors=True)
+    paths = "\n".join(f"      - {path}" for path in db_paths)
+    (project_dir / "dbt_helpers.yml").write_text(
+        f"warehouse:\n  plugin: sqlite\n  connection:\n    db_paths:\n{paths}\n", encoding="utf-8"
+    )
+
+    def plan(operation: str) -> Callable[[], int]:
+        def run() -> int:
+            return len(getattr(Orchestrator(project_dir), operation)(scope).ops)
+
+        return run
+
+    return {"core source plan": plan("generate_source_plan"), "core model scaffold": plan("scaffold_models")}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dir", type=Path, help="Directory of the databases (default: in the temp directory)")
+    parser.add_argument("--tables", type=int, default=20_000, help="Tables in total")
+    parser.add_argument("--databases", type=int, default=4, help="Database files the tables are spread over")
+    parser.add_argument("--columns", type=int, default=12, help="Columns per table")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--skip-reference", action="store_true", help="Do not time the per-table implementation")
+    parser.add_argument("--pipeline", action="store_true", help="Also time the core source and model planning")
+    args = parser.parse_args()
+
+    db_dir = args.dir or Path(tempfile.gettempdir()) / f"dbt_helpers_sqlite_{args.tables}x{args.columns}"
+    scope = [f"db_{d:02d}" for d in range(args.databases)]
+    db_paths = [str(db_dir / f"{database}.db") for database in scope]
+    if not all(Path(path).exists() for path in db_paths):
+        print(f"Creating {args.databases} databases in {db_dir} ...")
+        shutil.rmtree(db_dir, ignore_errors=True)
+        db_dir.mkdir(parents=True)
+        for database, path in zip(scope, db_paths, strict=True):
+            create_database(Path(path), args.tables // args.databases, args.columns, database)
+    plugin = SQLiteWarehousePlugin()
+    config = {"db_paths": db_paths}
+
+    runs: dict[str, Callable[[], Any]] = {}
+    if not args.skip_reference:
+        runs["per-table (reference)"] = lambda: len(reference_read_catalog(db_paths, scope))
+    runs["statement per database"] = lambda: len(plugin.read_catalog(scope, config))
+    if args.pipeline:
+        runs.update(time_pipeline(db_paths, scope))
+
+    print(f"{args.tables} tables x {args.columns} columns in {args.databases} databases")
+    baseline = None
+    for name, fn in runs.items():
+        best = float("inf")
+        count = 0
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            count = fn()
+            best = min(best, time.perf_counter() - start)
+        baseline = baseline or best
+        print(f"{name:>24}: {best:7.2f} s  {baseline / best:5.1f}x  ({count} relations or ops)")
+
+
+if __name__ == "__main__":
+    main()
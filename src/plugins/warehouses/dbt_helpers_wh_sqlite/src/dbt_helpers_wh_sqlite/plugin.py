@@ -0,0 +1,128 @@
+import sqlite3
+from collections.abc import Iterator
+from itertools import groupby
+from operator import itemgetter
+from pathlib import Path
+from typing import Any
+
+from dbt_helpers_sdk import (
+    CatalogClient,
+    CatalogColumn,
+    CatalogNamespace,
+    CatalogRelation,
+    schema_fingerprint,
+)
+from dbt_helpers_sdk.database_files import attach_aliases, is_glob, quote_identifier, resolve_db_paths
+
+_MEMORY = ":memory:"
+
+# Columns of every table and view in one database, by table name and column order. `sqlite_master`
+# is the legacy name of `sqlite_schema`, available in every SQLite release. The table-valued
+# pragma_table_info takes the database name as its second argument, so one statement per database
+# replaces a PRAGMA call per table.
+_DATABASE_COLUMNS_SQL = """
+    SELECT m.name, m.type, c.name, c.type, c."notnull", c.pk
+    FROM {database}.sqlite_master AS m
+    JOIN pragma_table_info(m.name, ?) AS c
+    WHERE m.type IN ('table', 'view') AND m.name NOT LIKE 'sqlite\\_%' ESCAPE '\\'
+    ORDER BY m.name, c.cid
+"""
+
+# Rows fetched per batch; bounds memory while streaming very large catalogs
+_BATCH_ROWS = 2048
+
+
+def _read_only_uri(path: str) -> str:
+    return f"{Path(path).resolve().as_uri()}?mode=ro"
+
+
+def connect(db_paths: list[str], aliases: list[str] | None = None) -> sqlite3.Connection:
+    """Open the database files read-only.
+
+    Without aliases the single file is the `main` database; otherwise each file is
+    ATTACHed to an in-memory database under its alias.
+    """
+    if aliases is None:
+        (path,) = db_paths
+        return sqlite3.connect(_MEMORY if path == _MEMORY else _read_only_uri(path), uri=True)
+    conn = sqlite3.connect(_MEMORY, uri=True)
+    try:
+        for path, alias in zip(db_paths, aliases, strict=True):
+            conn.execute(f"ATTACH DATABASE ? AS {quote_identifier(alias)}", [_read_only_uri(path)])
+    except sqlite3.Error:
+        conn.close()
+        raise
+    return conn
+
+
+class SQLiteWarehousePlugin(CatalogClient):
+    """Catalog client for SQLite database files.
+
+    SQLite has no schemas, so the database is the namespace: a single file is `main`, and
+    with `db_paths` (files or glob patterns) each file is ATTACHed under its file stem. Scope items are database names.
+    Files are opened read-only and relations come from one statement over all databases.
+    """
+
+    def __init__(self, db_path: str = _MEMORY):
+        self.db_path = db_path
+
+    def read_catalog(self, scope: list[str], connection_config: dict[str, Any]) -> list[CatalogRelation]:
+        return list(self.iter_catalog(scope, connection_config))
+
+    def iter_catalog(self, scope: list[str], connection_config: dict[str, Any]) -> Iterator[CatalogRelation]:
+        """Yield relations in scope order, then by name.
+
+        The connection stays open until the iterator is exhausted or closed.
+        """
+        db_paths = resolve_db_paths(connection_config, self.db_path)
+        multi_database = len(db_paths) > 1 or any(is_glob(str(path)) for path in connection_config.get("db_paths") or [])
+        all_aliases = attach_aliases(db_paths) if multi_database else ["main"]
+        # A database file that does not exist has no relations (it is not created)
+        present = [
+            (path, alias)
+            for path, alias in zip(db_paths, all_aliases, strict=True)
+            if path == _MEMORY or Path(path).exists()
+        ]
+        aliases = [alias for _, alias in present]
+        databases = [alias for alias in dict.fromkeys(scope) if alias in aliases]
+        if not databases:
+            return
+
+        conn = connect([path for path, _ in present], aliases if multi_database else None)
+        try:
+            # One statement per database: a UNION ALL over all databases would sort every column row
+            for database in databases:
+                cursor = conn.execute(_DATABASE_COLUMNS_SQL.format(database=quote_identifier(database)), [database])
+                for (table_name, table_type), rows in groupby(_iter_rows(cursor), key=itemgetter(0, 1)):
+                    yield _relation(database, table_name, table_type, list(rows))
+        finally:
+            conn.close()
+
+
+def _iter_rows(cursor: sqlite3.Cursor) -> Iterator[tuple[Any, ...]]:
+    while rows := cursor.fetchmany(_BATCH_ROWS):
+        yield from rows
+
+
+def _relation(database: str, table_name: str, table_type: str, rows: list[tuple[Any, ...]]) -> CatalogRelation:
+    kind = "table" if table_type == "table" else "view"
+    columns = [
+        # Columns declared without a type have BLOB affinity
+        CatalogColumn(name=column_name, data_type=data_type or "BLOB", nullable=not notnull)
+        for _, _, column_name, data_type, notnull, _ in rows
+    ]
+    # SQLite has no table comments
+    metadata: dict[str, Any] = {"description": None}
+    # pk is the column's 1-based position in the primary key, 0 if not part of it
+    primary_key = sorted((row[5], row[2]) for row in rows if row[5])
+    if primary_key:
+        metadata["primary_key"] = [column_name for _, column_name in primary_key]
+    return CatalogRelation(
+        namespace=CatalogNamespace(parts=[database]),
+        name=table_name,
+        kind=kind,
+        columns=columns,
+        dbt_name=f"{database}__{table_name}",
+        metadata=metadata,
+        fingerprint=schema_fingerprint(columns),
+    )
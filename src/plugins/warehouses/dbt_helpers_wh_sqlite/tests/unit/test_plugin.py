@@ -0,0 +1,101 @@
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+
+from dbt_helpers_sdk import schema_fingerprint
+from dbt_helpers_wh_sqlite.plugin import SQLiteWarehousePlugin
+
+
+def _create_db(path: Path, ddl: str) -> str:
+    conn = sqlite3.connect(path)
+    conn.executescript(ddl)
+    conn.close()
+    return str(path)
+
+
+class TestSQLitePlugin(unittest.TestCase):
+    """Tests for the SQLiteWarehousePlugin class."""
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_sqlite_read_catalog(self):
+        db_path = _create_db(
+            self.test_dir / "app.db",
+            """
+            CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT NOT NULL, payload);
+            CREATE TABLE order_lines (order_id INTEGER, line_no INTEGER, amount REAL, PRIMARY KEY (order_id, line_no));
+            CREATE INDEX users_name ON users (name);
+            CREATE VIEW active_users AS SELECT id, name FROM users;
+            CREATE TABLE counters (id INTEGER PRIMARY KEY AUTOINCREMENT);
+            """,
+        )
+        plugin = SQLiteWarehousePlugin(db_path=db_path)
+
+        relations = plugin.read_catalog(["main"], connection_config={})
+
+        # sqlite_sequence (created by AUTOINCREMENT) and indexes are not relations
+        self.assertEqual(
+            [(r.namespace.parts, r.name, r.kind, r.dbt_name) for r in relations],
+            [
+                (["main"], "active_users", "view", "main__active_users"),
+                (["main"], "counters", "table", "main__counters"),
+                (["main"], "order_lines", "table", "main__order_lines"),
+                (["main"], "users", "table", "main__users"),
+            ],
+        )
+        users = relations[3]
+        self.assertEqual(
+            [(c.name, c.data_type, c.nullable) for c in users.columns],
+            [("id", "INTEGER", True), ("name", "TEXT", False), ("payload", "BLOB", True)],
+        )
+        self.assertEqual(users.metadata, {"description": None, "primary_key": ["id"]})
+        self.assertEqual(users.fingerprint, schema_fingerprint(users.columns))
+        self.assertEqual(relations[2].metadata["primary_key"], ["order_id", "line_no"])
+        self.assertNotIn("primary_key", relations[0].metadata)
+        self.assertEqual(plugin.read_catalog(["other"], connection_config={}), [])
+
+    def test_sqlite_read_catalog_attached_databases(self):
+        sales = _create_db(self.test_dir / "sales.db", "CREATE TABLE orders (id INTEGER)")
+        crm = _create_db(self.test_dir / "crm.sqlite", "CREATE TABLE contacts (id INTEGER); CREATE TABLE leads (id)")
+        missing = str(self.test_dir / "missing.db")
+        plugin = SQLiteWarehousePlugin()
+
+        relations = plugin.read_catalog(
+            ["sales", "crm", "missing", "main"], connection_config={"db_paths": [crm, sales, missing]}
+        )
+
+        self.assertEqual(
+            [(r.namespace.parts, r.name, r.dbt_name) for r in relations],
+            [
+                (["sales"], "orders", "sales__orders"),
+                (["crm"], "contacts", "crm__contacts"),
+                (["crm"], "leads", "crm__leads"),
+            ],
+        )
+        self.assertFalse(Path(missing).exists())
+
+        # A glob pattern attaches the matched files even when it matches one
+        relations = plugin.read_catalog(["sales"], connection_config={"db_paths": [str(self.test_dir / "s*.db")]})
+        self.assertEqual([r.dbt_name for r in relations], ["sales__orders"])
+
+    def test_sqlite_read_catalog_is_read_only(self):
+        db_path = _create_db(self.test_dir / "app.db", "CREATE TABLE t (id INTEGER)")
+        plugin = SQLiteWarehousePlugin(db_path=str(self.test_dir / "missing.db"))
+
+        stream = plugin.iter_catalog(["main"], connection_config={"db_path": db_path})
+        self.assertEqual(next(stream).name, "t")
+        # A writer is not blocked while the catalog is read
+        conn = sqlite3.connect(db_path)
+        conn.execute("CREATE TABLE u (id INTEGER)")
+        conn.commit()
+        conn.close()
+        self.assertEqual(list(stream), [])
+
+        self.assertEqual(plugin.read_catalog(["main"], connection_config={}), [])
+        self.assertFalse((self.test_dir / "missing.db").exists())